@@ -1732,8 +1732,9 @@ def get_account_from_arn(arn: str) -> str:
         # must be a service principal arn, such as ec2.amazonaws.com
         return ""
 
-    parts = arn.split(":")
-    if len(parts) < 4:
+    # Only the first five fields are needed, and the resource part may itself contain colons
+    parts = arn.split(":", 5)
+    if len(parts) < 5:
         return ""
     else:
         return parts[4]
@@ -7,6 +7,7 @@ including both network-level errors and HTTP 5xx server errors.
 
 import json
 import logging
+import re
 from typing import Any
 from typing import Dict
 
@@ -24,6 +25,16 @@ GCP_API_BACKOFF_MAX = 30
 # Number of retries for network-level errors (handled natively by googleapiclient)
 GCP_API_NUM_RETRIES = 5
 
+# HttpError reasons that mean the API is not enabled on the project, and IAM reasons that must not be mistaken for it
+_API_DISABLED_REASONS = frozenset({"accessNotConfigured", "SERVICE_DISABLED"})
+_PERMISSION_DENIED_REASONS = frozenset(
+    {"forbidden", "insufficientPermissions", "IAM_PERMISSION_DENIED"},
+)
+# Fallback for APIs whose errors carry no reason: the standard "API not enabled" message patterns
+_API_DISABLED_MESSAGE_RE = re.compile(
+    "API has not been used|is not enabled|it is disabled",
+)
+
 
 def is_retryable_gcp_http_error(exc: Exception) -> bool:
     """
@@ -144,14 +155,22 @@ def is_api_disabled_error(e: HttpError) -> bool:
     should still fail loudly.
 
     Detection strategy:
+    0. Only HTTP 403 responses with an "error" object can mean the API is disabled; anything else returns False
+       without parsing
     1. Primary: Check error.errors[0].reason for 'accessNotConfigured' or 'SERVICE_DISABLED'
     2. Fallback: Check error.message for standard "API not enabled" patterns
 
     :param e: The HttpError exception to check
     :return: True if the error indicates API is disabled, False otherwise
     """
+    if getattr(e.resp, "status", None) != 403:
+        return False
+    # Bodies without an "error" object (e.g. HTML error pages) cannot match either check below
+    content = e.content
+    if not isinstance(content, bytes) or b'"error"' not in content:
+        return False
     try:
-        error_json = json.loads(e.content.decode("utf-8"))
+        error_json = json.loads(content.decode("utf-8"))
         err = error_json.get("error", {})
 
         # Primary check: Use the 'reason' field (most reliable indicator)
@@ -159,23 +178,15 @@ def is_api_disabled_error(e: HttpError) -> bool:
         errors_list = err.get("errors", [])
         if errors_list:
             reason = errors_list[0].get("reason", "")
-            if reason in ("accessNotConfigured", "SERVICE_DISABLED"):
+            if reason in _API_DISABLED_REASONS:
                 return True
             # Explicitly reject 'forbidden' and other IAM-related reasons
-            if reason in (
-                "forbidden",
-                "insufficientPermissions",
-                "IAM_PERMISSION_DENIED",
-            ):
+            if reason in _PERMISSION_DENIED_REASONS:
                 return False
 
         # Fallback: Check message patterns for APIs that may use different error formats
         message = err.get("message", "")
-        return (
-            "API has not been used" in message
-            or "is not enabled" in message
-            or "it is disabled" in message
-        )
+        return _API_DISABLED_MESSAGE_RE.search(message) is not None
     except (ValueError, KeyError, AttributeError) as parse_error:
         logger.debug(
             "Failed to parse HttpError response as JSON: %s. Treating as non-API-disabled error.",
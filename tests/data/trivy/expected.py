@@ -0,0 +1,114 @@
+# Expected graph state after syncing TRIVY_SAMPLE against the test ECR image
+
+ZERO_SHA = "sha256:" + "0" * 64
+
+EXPECTED_TRIVY_FINDINGS = frozenset(
+    {
+        ("TIF|CVE-2023-29383", "CVE-2023-29383", "LOW"),
+        ("TIF|CVE-2023-4039", "CVE-2023-4039", "LOW"),
+        ("TIF|CVE-2023-4641", "CVE-2023-4641", "MEDIUM"),
+        ("TIF|CVE-2024-12133", "CVE-2024-12133", "MEDIUM"),
+        ("TIF|CVE-2024-13176", "CVE-2024-13176", "MEDIUM"),
+        ("TIF|CVE-2024-26462", "CVE-2024-26462", "MEDIUM"),
+        ("TIF|CVE-2024-56406", "CVE-2024-56406", "HIGH"),
+        ("TIF|CVE-2025-24528", "CVE-2025-24528", "MEDIUM"),
+        ("TIF|CVE-2025-31115", "CVE-2025-31115", "HIGH"),
+        ("TIF|CVE-2025-43859", "CVE-2025-43859", "CRITICAL"),
+    },
+)
+
+EXPECTED_TRIVY_PACKAGES = frozenset(
+    {
+        ("0.14.0|h11", "h11", "0.14.0"),
+        ("1.20.1-2+deb12u2|krb5-locales", "krb5-locales", "1.20.1-2+deb12u2"),
+        ("1.20.1-2+deb12u2|libk5crypto3", "libk5crypto3", "1.20.1-2+deb12u2"),
+        ("1.20.1-2+deb12u2|libkrb5-3", "libkrb5-3", "1.20.1-2+deb12u2"),
+        ("1.20.1-2+deb12u2|libkrb5support0", "libkrb5support0", "1.20.1-2+deb12u2"),
+        ("12.2.0-14|gcc-12-base", "gcc-12-base", "12.2.0-14"),
+        ("12.2.0-14|libstdc++6", "libstdc++6", "12.2.0-14"),
+        ("1:4.13+dfsg1-1+b1|login", "login", "1:4.13+dfsg1-1+b1"),
+        ("1:4.13+dfsg1-1+b1|passwd", "passwd", "1:4.13+dfsg1-1+b1"),
+        ("3.0.15-1~deb12u1|libssl3", "libssl3", "3.0.15-1~deb12u1"),
+        ("3.0.15-1~deb12u1|openssl", "openssl", "3.0.15-1~deb12u1"),
+        ("4.19.0-2|libtasn1-6", "libtasn1-6", "4.19.0-2"),
+        ("5.36.0-7+deb12u1|perl-base", "perl-base", "5.36.0-7+deb12u1"),
+        ("5.4.1-0.2|liblzma5", "liblzma5", "5.4.1-0.2"),
+    },
+)
+
+# Every package and finding is on the same test image
+EXPECTED_PKG_ECR = frozenset(
+    (package_id, ZERO_SHA) for package_id, _, _ in EXPECTED_TRIVY_PACKAGES
+)
+EXPECTED_FINDING_ECR = frozenset(
+    (finding_id, ZERO_SHA) for finding_id, _, _ in EXPECTED_TRIVY_FINDINGS
+)
+
+EXPECTED_PKG_FIX = frozenset(
+    {
+        ("0.14.0|h11", "0.16.0|h11"),
+        ("1.20.1-2+deb12u2|krb5-locales", "1.20.1-2+deb12u3|krb5-locales"),
+        ("1.20.1-2+deb12u2|libk5crypto3", "1.20.1-2+deb12u3|libk5crypto3"),
+        ("1.20.1-2+deb12u2|libkrb5-3", "1.20.1-2+deb12u3|libkrb5-3"),
+        ("1.20.1-2+deb12u2|libkrb5support0", "1.20.1-2+deb12u3|libkrb5support0"),
+        ("12.2.0-14|gcc-12-base", "12.2.0-14+deb12u1|gcc-12-base"),
+        ("12.2.0-14|libstdc++6", "12.2.0-14+deb12u1|libstdc++6"),
+        ("1:4.13+dfsg1-1+b1|login", "1:4.13+dfsg1-1+deb12u1|login"),
+        ("1:4.13+dfsg1-1+b1|passwd", "1:4.13+dfsg1-1+deb12u1|passwd"),
+        ("3.0.15-1~deb12u1|libssl3", "3.0.16-1~deb12u1|libssl3"),
+        ("3.0.15-1~deb12u1|openssl", "3.0.16-1~deb12u1|openssl"),
+        ("4.19.0-2|libtasn1-6", "4.19.0-2+deb12u1|libtasn1-6"),
+        ("5.36.0-7+deb12u1|perl-base", "5.36.0-7+deb12u2|perl-base"),
+        ("5.4.1-0.2|liblzma5", "5.4.1-1|liblzma5"),
+    },
+)
+
+EXPECTED_FIX_FINDING = frozenset(
+    {
+        ("0.16.0|h11", "TIF|CVE-2025-43859"),
+        ("1.20.1-2+deb12u3|krb5-locales", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u3|krb5-locales", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u3|libk5crypto3", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u3|libk5crypto3", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u3|libkrb5-3", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u3|libkrb5-3", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u3|libkrb5support0", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u3|libkrb5support0", "TIF|CVE-2025-24528"),
+        ("12.2.0-14+deb12u1|gcc-12-base", "TIF|CVE-2023-4039"),
+        ("12.2.0-14+deb12u1|libstdc++6", "TIF|CVE-2023-4039"),
+        ("1:4.13+dfsg1-1+deb12u1|login", "TIF|CVE-2023-29383"),
+        ("1:4.13+dfsg1-1+deb12u1|login", "TIF|CVE-2023-4641"),
+        ("1:4.13+dfsg1-1+deb12u1|passwd", "TIF|CVE-2023-29383"),
+        ("1:4.13+dfsg1-1+deb12u1|passwd", "TIF|CVE-2023-4641"),
+        ("3.0.16-1~deb12u1|libssl3", "TIF|CVE-2024-13176"),
+        ("3.0.16-1~deb12u1|openssl", "TIF|CVE-2024-13176"),
+        ("4.19.0-2+deb12u1|libtasn1-6", "TIF|CVE-2024-12133"),
+        ("5.36.0-7+deb12u2|perl-base", "TIF|CVE-2024-56406"),
+        ("5.4.1-1|liblzma5", "TIF|CVE-2025-31115"),
+    },
+)
+
+EXPECTED_PKG_FINDING = frozenset(
+    {
+        ("0.14.0|h11", "TIF|CVE-2025-43859"),
+        ("1.20.1-2+deb12u2|krb5-locales", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u2|krb5-locales", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u2|libk5crypto3", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u2|libk5crypto3", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u2|libkrb5-3", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u2|libkrb5-3", "TIF|CVE-2025-24528"),
+        ("1.20.1-2+deb12u2|libkrb5support0", "TIF|CVE-2024-26462"),
+        ("1.20.1-2+deb12u2|libkrb5support0", "TIF|CVE-2025-24528"),
+        ("12.2.0-14|gcc-12-base", "TIF|CVE-2023-4039"),
+        ("12.2.0-14|libstdc++6", "TIF|CVE-2023-4039"),
+        ("1:4.13+dfsg1-1+b1|login", "TIF|CVE-2023-29383"),
+        ("1:4.13+dfsg1-1+b1|login", "TIF|CVE-2023-4641"),
+        ("1:4.13+dfsg1-1+b1|passwd", "TIF|CVE-2023-29383"),
+        ("1:4.13+dfsg1-1+b1|passwd", "TIF|CVE-2023-4641"),
+        ("3.0.15-1~deb12u1|libssl3", "TIF|CVE-2024-13176"),
+        ("3.0.15-1~deb12u1|openssl", "TIF|CVE-2024-13176"),
+        ("4.19.0-2|libtasn1-6", "TIF|CVE-2024-12133"),
+        ("5.36.0-7+deb12u1|perl-base", "TIF|CVE-2024-56406"),
+        ("5.4.1-0.2|liblzma5", "TIF|CVE-2025-31115"),
+    },
+)
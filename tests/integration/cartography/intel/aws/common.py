@@ -8,4 +8,4 @@ def create_test_account(neo4j_session, test_account_id, test_update_tag):
         """,
         aws_account_id=test_account_id,
         aws_update_tag=test_update_tag,
-    )
+    ).consume()
@@ -8,6 +8,7 @@ from tests.data.aws.route53 import GET_ZONES_SAMPLE_RESPONSE
 from tests.data.aws.route53 import GET_ZONES_WITH_SUBZONE
 from tests.integration.cartography.intel.aws.common import create_test_account
 from tests.integration.util import check_nodes
+from tests.integration.util import check_nodes_fast
 from tests.integration.util import check_rels
 
 TEST_ACCOUNT_ID = "000000000000"
@@ -49,7 +50,7 @@ def test_sync_route53(mock_get_zones, neo4j_session):
         """,
         ip_addresses=["1.2.3.4", "5.6.7.8", "9.10.11.12", "2001:db8::1", "2001:db8::2"],
         update_tag=TEST_UPDATE_TAG,
-    )
+    ).consume()
 
     # Act
     sync(
@@ -72,7 +73,7 @@ def test_sync_route53(mock_get_zones, neo4j_session):
         ("/hostedzone/HOSTED_ZONE", "example.com"),
     }, "DNS Zones don't exist"
 
-    assert check_nodes(neo4j_session, "AWSDNSRecord", ["id", "name", "type"]) == {
+    expected_records = {
         ("/hostedzone/HOSTED_ZONE/example.com/A", "example.com", "A"),
         ("/hostedzone/HOSTED_ZONE/ipv6.example.com/AAAA", "ipv6.example.com", "AAAA"),
         ("/hostedzone/HOSTED_ZONE/example.com/NS", "example.com", "NS"),
@@ -106,7 +107,13 @@ def test_sync_route53(mock_get_zones, neo4j_session):
             "hello.what.example.com",
             "A",
         ),
-    }, "DNS records don't exist"
+    }
+    assert (
+        check_nodes_fast(
+            neo4j_session, "AWSDNSRecord", ["id", "name", "type"], expected_records
+        )
+        == expected_records
+    ), "DNS records don't exist"
 
     # DNS zones -- AWS account
     assert check_rels(
@@ -252,16 +259,11 @@ def test_sync_route53_with_existing_resources(mock_get_zones, neo4j_session):
         """
         MERGE (lb:AWSLoadBalancerV2 {id: "myawesomeloadbalancer.amazonaws.com", dnsname: "myawesomeloadbalancer.amazonaws.com"})
         SET lb.lastupdated = $update_tag
-        """,
-        update_tag=TEST_UPDATE_TAG,
-    )
-    neo4j_session.run(
-        """
         MERGE (ec2:EC2Instance {id: "i-1234567890abcdef0", publicdnsname: "hello.what.example.com"})
         SET ec2.lastupdated = $update_tag
         """,
         update_tag=TEST_UPDATE_TAG,
-    )
+    ).consume()
 
     # Act
     sync(
@@ -332,7 +334,7 @@ def test_sync_route53_cleanup(mock_get_zones, neo4j_session):
         """,
         account_id=TEST_ACCOUNT_ID,
         update_tag=TEST_UPDATE_TAG,
-    )
+    ).consume()
 
     # Act - Run sync with new update tag
     sync(
@@ -345,19 +347,28 @@ def test_sync_route53_cleanup(mock_get_zones, neo4j_session):
     )
 
     # Assert - Stale record should be cleaned up (not present)
-    assert check_nodes(neo4j_session, "AWSDNSRecord", ["id"]) == {
-        ("/hostedzone/HOSTED_ZONE/example.com/A",),
-        ("/hostedzone/HOSTED_ZONE/ipv6.example.com/AAAA",),
-        ("/hostedzone/HOSTED_ZONE/example.com/NS",),
-        ("/hostedzone/HOSTED_ZONE/_b6e76e6a1b6853211abcdef123454.example.com/CNAME",),
-        ("/hostedzone/HOSTED_ZONE/elbv2.example.com/ALIAS",),
-        ("/hostedzone/HOSTED_ZONE/aliasv6.example.com/ALIAS_AAAA",),
-        ("/hostedzone/HOSTED_ZONE/www.example.com/WEIGHTED_CNAME",),
-        (
-            "/hostedzone/HOSTED_ZONE/_1f9ee9f5c4304947879ee77d0a995cc9.something.something.aws/A",
-        ),
-        ("/hostedzone/HOSTED_ZONE/hello.what.example.com/A",),
+    expected_record_ids = {
+        "/hostedzone/HOSTED_ZONE/example.com/A",
+        "/hostedzone/HOSTED_ZONE/ipv6.example.com/AAAA",
+        "/hostedzone/HOSTED_ZONE/example.com/NS",
+        "/hostedzone/HOSTED_ZONE/_b6e76e6a1b6853211abcdef123454.example.com/CNAME",
+        "/hostedzone/HOSTED_ZONE/elbv2.example.com/ALIAS",
+        "/hostedzone/HOSTED_ZONE/aliasv6.example.com/ALIAS_AAAA",
+        "/hostedzone/HOSTED_ZONE/www.example.com/WEIGHTED_CNAME",
+        "/hostedzone/HOSTED_ZONE/_1f9ee9f5c4304947879ee77d0a995cc9.something.something.aws/A",
+        "/hostedzone/HOSTED_ZONE/hello.what.example.com/A",
     }
+    # Only compare counts on the happy path; the full node set is fetched for the message only if the assert fails.
+    counts = neo4j_session.run(
+        """
+        MATCH (n:AWSDNSRecord)
+        RETURN count(n) AS total, count(CASE WHEN n.id IN $ids THEN 1 END) AS matched
+        """,
+        ids=list(expected_record_ids),
+    ).single()
+    assert (
+        counts["total"] == counts["matched"] == len(expected_record_ids)
+    ), f"Unexpected DNS records: {check_nodes(neo4j_session, 'AWSDNSRecord', ['id'])}"
 
 
 @patch.object(
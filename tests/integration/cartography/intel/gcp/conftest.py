@@ -0,0 +1,151 @@
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import cartography.intel.gcp.iam
+import cartography.intel.gcp.policy_bindings
+import cartography.intel.gsuite.groups
+import cartography.intel.gsuite.users
+import tests.data.gcp.policy_bindings
+from cartography.models.gcp.crm.organizations import GCPOrganizationSchema
+from cartography.models.gcp.crm.projects import GCPProjectSchema
+from tests.integration.cartography.intel.gcp.helpers import run_full_gcp_sync
+from tests.integration.util import ensure_schema_indexes
+
+_CREATE_PROJECT_AND_ORG_CYPHER = """
+MERGE (project:GCPProject{id: $project_id})
+ON CREATE SET project.firstseen = timestamp()
+SET project.lastupdated = $update_tag
+WITH *
+MERGE (org:GCPOrganization{id: $org_id})
+ON CREATE SET org.firstseen = timestamp()
+SET org.lastupdated = $update_tag
+"""
+
+
+# Static return values for the IAM, GSuite and policy binding API calls. They are patched once per module by
+# gcp_iam_gsuite_mocks rather than by a stack of decorators on every test.
+_IAM_GSUITE_PATCHES: tuple[tuple[Any, str, Any], ...] = (
+    (
+        cartography.intel.gcp.policy_bindings,
+        "get_policy_bindings",
+        tests.data.gcp.policy_bindings.MOCK_POLICY_BINDINGS_RESPONSE,
+    ),
+    (
+        cartography.intel.gsuite.groups,
+        "get_members_for_groups",
+        tests.data.gcp.policy_bindings.MOCK_GSUITE_GROUP_MEMBERS,
+    ),
+    (
+        cartography.intel.gsuite.groups,
+        "get_all_groups",
+        tests.data.gcp.policy_bindings.MOCK_GSUITE_GROUPS,
+    ),
+    (
+        cartography.intel.gsuite.users,
+        "get_all_users",
+        tests.data.gcp.policy_bindings.MOCK_GSUITE_USERS,
+    ),
+    (
+        cartography.intel.gcp.iam,
+        "get_gcp_predefined_roles",
+        tests.data.gcp.policy_bindings.MOCK_IAM_ROLES,
+    ),
+    (cartography.intel.gcp.iam, "get_gcp_org_roles", []),
+    (cartography.intel.gcp.iam, "get_gcp_project_custom_roles", []),
+    (
+        cartography.intel.gcp.iam,
+        "get_gcp_service_accounts",
+        tests.data.gcp.policy_bindings.MOCK_IAM_SERVICE_ACCOUNTS,
+    ),
+)
+
+
+def _enter_patches(stack, patch_spec):
+    """
+    Enter a plain return-value stub for each (target, attribute, return_value) in `patch_spec` and return the mocks
+    by attribute name.
+    """
+    return SimpleNamespace(
+        **{
+            attribute: stack.enter_context(
+                patch.object(target, attribute, return_value=return_value),
+            )
+            for target, attribute, return_value in patch_spec
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def gcp_iam_gsuite_mocks():
+    """
+    Patch the IAM, GSuite and policy binding API calls in _IAM_GSUITE_PATCHES for the module.
+    """
+    with ExitStack() as stack:
+        yield _enter_patches(stack, _IAM_GSUITE_PATCHES)
+
+
+@pytest.fixture(scope="module")
+def gcp_resource_patches(gcp_resource_patch_spec):
+    """
+    Patch the (target, attribute, return_value) entries of gcp_resource_patch_spec for the module. Test modules that
+    use this fixture define gcp_resource_patch_spec.
+    """
+    with ExitStack() as stack:
+        yield _enter_patches(stack, gcp_resource_patch_spec)
+
+
+@pytest.fixture(scope="module")
+def mock_clients():
+    """
+    Placeholder API clients for the GCP and GSuite syncs. The functions that would use them are patched, so the
+    clients are only passed through and a bare object is enough.
+    """
+    return SimpleNamespace(
+        iam=object(),
+        admin=object(),
+        storage=object(),
+        compute=object(),
+        asset=object(),
+    )
+
+
+@pytest.fixture(scope="module")
+def gcp_project_and_org(neo4j_session, gcp_sync_params):
+    """
+    Create the GCPProject and GCPOrganization that the test module's syncs attach to, once per module. Test modules
+    that use this fixture define gcp_sync_params, see GCPSyncParams.
+    """
+    ensure_schema_indexes(neo4j_session, GCPOrganizationSchema(), GCPProjectSchema())
+    neo4j_session.run(
+        _CREATE_PROJECT_AND_ORG_CYPHER,
+        project_id=gcp_sync_params.project_id,
+        org_id=gcp_sync_params.org_id,
+        update_tag=gcp_sync_params.update_tag,
+    ).consume()
+
+
+@pytest.fixture(scope="module")
+def gcp_iam_gsuite_synced(
+    neo4j_session,
+    gcp_sync_params,
+    gcp_project_and_org,
+    gcp_iam_gsuite_mocks,
+    mock_clients,
+):
+    """
+    Run the org-level IAM, project-level IAM, GSuite user and GSuite group syncs that policy bindings and permission
+    relationships build on, once per module, with gcp_iam_gsuite_mocks in place.
+    """
+    run_full_gcp_sync(
+        neo4j_session,
+        gcp_sync_params.project_id,
+        gcp_sync_params.org_id,
+        gcp_sync_params.update_tag,
+        gcp_sync_params.common_job_params,
+        gcp_sync_params.gsuite_params,
+        mock_clients,
+    )
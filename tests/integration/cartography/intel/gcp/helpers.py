@@ -0,0 +1,74 @@
+from typing import NamedTuple
+
+import cartography.intel.gcp.iam
+import cartography.intel.gsuite.groups
+import cartography.intel.gsuite.users
+
+# Ids, update tag and job parameters shared by the policy binding and permission relationship tests.
+TEST_PROJECT_ID = "project-abc"
+TEST_UPDATE_TAG = 123456789
+COMMON_JOB_PARAMS = {
+    "UPDATE_TAG": TEST_UPDATE_TAG,
+    "ORG_RESOURCE_NAME": "organizations/1337",
+    "PROJECT_ID": TEST_PROJECT_ID,
+}
+
+
+class GCPSyncParams(NamedTuple):
+    """
+    The ids, update tag and job parameters that the shared GCP fixtures in conftest.py sync with. Test modules that
+    use those fixtures provide an instance through a module-scoped `gcp_sync_params` fixture.
+    """
+
+    project_id: str
+    org_id: str
+    update_tag: int
+    common_job_params: dict
+    gsuite_params: dict
+
+
+def run_full_gcp_sync(
+    neo4j_session,
+    project_id,
+    org_id,
+    update_tag,
+    common_job_params,
+    gsuite_params,
+    clients,
+):
+    """
+    Run the org-level IAM, project-level IAM, GSuite user and GSuite group syncs that policy bindings and permission
+    relationships build on. `clients` needs `iam` and `admin` attributes; the API calls behind them are expected to
+    be patched.
+    """
+    # Sync org-level IAM (predefined roles) first
+    cartography.intel.gcp.iam.sync_org_iam(
+        neo4j_session,
+        clients.iam,
+        org_id,
+        update_tag,
+        common_job_params,
+    )
+
+    # Sync project-level IAM (service accounts and project custom roles)
+    cartography.intel.gcp.iam.sync(
+        neo4j_session,
+        clients.iam,
+        project_id,
+        update_tag,
+        common_job_params,
+    )
+
+    cartography.intel.gsuite.users.sync_gsuite_users(
+        neo4j_session,
+        clients.admin,
+        update_tag,
+        gsuite_params,
+    )
+
+    cartography.intel.gsuite.groups.sync_gsuite_groups(
+        neo4j_session,
+        clients.admin,
+        update_tag,
+        gsuite_params,
+    )
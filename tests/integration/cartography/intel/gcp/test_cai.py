@@ -8,12 +8,19 @@ from tests.integration.cartography.intel.gcp.test_iam import TEST_PROJECT_ID
 from tests.integration.cartography.intel.gcp.test_iam import TEST_UPDATE_TAG
 from tests.integration.util import check_nodes
 from tests.integration.util import check_rels
+from tests.integration.util import reset_graph
 
 COMMON_JOB_PARAMS = {
     "PROJECT_ID": TEST_PROJECT_ID,
     "UPDATE_TAG": TEST_UPDATE_TAG,
 }
 
+_ROLE_SCOPES_QUERY = """
+MATCH (r:GCPRole)
+RETURN r.name as name, r.scope as scope, r.role_type as role_type
+ORDER BY r.name
+"""
+
 
 @patch("cartography.intel.gcp.cai.get_gcp_service_accounts_cai")
 @patch("cartography.intel.gcp.cai.get_gcp_roles_cai")
@@ -23,7 +30,7 @@ def test_sync_cai(mock_get_roles, mock_get_service_accounts, neo4j_session):
     Verifies that service accounts and project-level roles are properly loaded into Neo4j.
     """
     # Arrange
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
+    reset_graph(neo4j_session)
     _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
 
     # Mock CAI API responses - extract data from CAI asset responses
@@ -113,7 +120,7 @@ def test_sync_cai_filters_non_project_roles(
     Predefined roles and org-level roles should be synced at the organization level via sync_org_iam().
     """
     # Arrange
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
+    reset_graph(neo4j_session)
     _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
 
     # Mock CAI API responses - include a mix of role types
@@ -162,7 +169,7 @@ def test_sync_cai_role_scope_property(
     Test that CAI sync sets the scope property correctly on project custom roles.
     """
     # Arrange
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
+    reset_graph(neo4j_session)
     _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
 
     # Mock CAI API responses
@@ -182,13 +189,7 @@ def test_sync_cai_role_scope_property(
     )
 
     # Assert - verify scope property is set correctly
-    result = neo4j_session.run(
-        """
-        MATCH (r:GCPRole)
-        RETURN r.name as name, r.scope as scope, r.role_type as role_type
-        ORDER BY r.name
-        """
-    )
+    result = neo4j_session.run(_ROLE_SCOPES_QUERY)
     roles = {
         record["name"]: (record["scope"], record["role_type"]) for record in result
     }
@@ -9,25 +9,187 @@ without cascade_delete, the project's resources (instances, buckets, etc.)
 would remain as orphans since resource cleanup is scoped to PROJECT_ID.
 """
 
+import uuid
+from types import SimpleNamespace
+from unittest.mock import DEFAULT
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
+
 import cartography.intel.gcp
 import cartography.intel.gcp.crm.folders
 import cartography.intel.gcp.crm.orgs
 import cartography.intel.gcp.crm.projects
 import cartography.intel.gcp.iam
+from cartography.client.core.tx import run_write_query
 from cartography.config import Config
 from cartography.graph.job import GraphJob
+from cartography.models.gcp.compute.instance import GCPInstanceSchema
 from cartography.models.gcp.crm.folders import GCPFolderSchema
+from cartography.models.gcp.crm.organizations import GCPOrganizationSchema
 from cartography.models.gcp.crm.projects import GCPProjectSchema
+from cartography.models.gcp.storage.bucket import GCPBucketSchema
 from tests.integration import settings
-from tests.integration.util import check_nodes
+from tests.integration.util import any_nodes_exist
+from tests.integration.util import count_nodes_by_label
+from tests.integration.util import delete_nodes_by_label
+from tests.integration.util import ensure_schema_indexes
 
 TEST_UPDATE_TAG = 123456789
 TEST_UPDATE_TAG_V2 = 123456790
-TEST_ORG_ID = "organizations/1337"
-TEST_PROJECT_ID = "test-project-cascade"
+
+# The labels the tests in this module create nodes with; see test_ids.
+_GCP_TEST_LABELS = [
+    "GCPOrganization",
+    "GCPFolder",
+    "GCPProject",
+    "GCPInstance",
+    "GCPBucket",
+]
+
+# Setup Cypher is kept in module-level constants and fully parameterized so that every test sends the exact same
+# query text and Neo4j can reuse the cached plan. Every test uses fresh ids (see test_ids), so the setup can CREATE
+# nodes instead of paying for the existence check of a MERGE.
+_SETUP_STALE_PROJECT_CYPHER = """
+CREATE (o:GCPOrganization {id: $org_id, lastupdated: $tag})
+CREATE (o)-[:RESOURCE]->(p:GCPProject:Tenant {id: $project_id, lastupdated: $old_tag})
+FOREACH (child IN $instances |
+    CREATE (p)-[:RESOURCE]->(:GCPInstance {id: child.id, lastupdated: child.lastupdated})
+)
+FOREACH (child IN $buckets |
+    CREATE (p)-[:RESOURCE]->(:GCPBucket {id: child.id, lastupdated: child.lastupdated})
+)
+"""
+_SETUP_STALE_FOLDERS_CYPHER = """
+CREATE (o:GCPOrganization {id: $org_id, lastupdated: $tag})
+CREATE (o)-[:RESOURCE]->(pf:GCPFolder {id: $parent_id, lastupdated: $old_tag})
+CREATE (pf)-[:RESOURCE]->(:GCPFolder {id: $child_id, lastupdated: $old_tag})
+"""
+_ADD_CHILD_INSTANCE_CYPHER = """
+MATCH (p:GCPProject {id: $project_id})
+CREATE (p)-[:RESOURCE]->(:GCPInstance {id: $instance_id, lastupdated: $tag})
+"""
+
+
+_COMMON_JOB_PARAMS = {"UPDATE_TAG": TEST_UPDATE_TAG_V2}
+_ORPHAN_INSTANCE_ID = (
+    "projects/{project_id}/zones/us-central1-a/instances/orphan-instance"
+)
+_ORPHAN_BUCKET_ID = "projects/{project_id}/buckets/orphan-bucket"
+
+
+def _run_cascade_cleanup(node_schema, neo4j_session, org_id):
+    """
+    Run the cascade_delete cleanup job for the given schema under the given org, the way start_gcp_ingestion() does.
+    """
+    GraphJob.from_node_schema(
+        node_schema,
+        {**_COMMON_JOB_PARAMS, "ORG_RESOURCE_NAME": org_id},
+        cascade_delete=True,
+    ).run(neo4j_session)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _gcp_indexes(neo4j_session):
+    """The setup Cypher and the cascade cleanup jobs look GCP nodes up by id, so create their indexes once."""
+    ensure_schema_indexes(
+        neo4j_session,
+        GCPOrganizationSchema(),
+        GCPFolderSchema(),
+        GCPProjectSchema(),
+        GCPInstanceSchema(),
+        GCPBucketSchema(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def test_ids(neo4j_session):
+    """
+    Give each test its own org/project ids so the tests in this module are isolated from each other without wiping
+    the whole graph. Every node a test creates carries the token in its id and is removed, label by label, when the
+    test finishes.
+    """
+    token = uuid.uuid4().hex[:12]
+    yield SimpleNamespace(
+        token=token,
+        org_id=f"organizations/{token}",
+        project_id=f"test-project-cascade-{token}",
+    )
+    delete_nodes_by_label(neo4j_session, _GCP_TEST_LABELS, id_contains=token)
+
+
+def _node_ids(neo4j_session, node_label, token):
+    """
+    Return the ids of the nodes with the given label that were created by the current test.
+    """
+    result = neo4j_session.run(
+        f"MATCH (n:{node_label}) WHERE n.id CONTAINS $token RETURN n.id AS id",
+        token=token,
+    )
+    return {record["id"] for record in result}
+
+
+def _create_stale_project(neo4j_session, test_ids, instances=(), buckets=()):
+    """
+    Create a fresh org with a stale project under it, plus the given child instances and buckets, in a single query.
+    `instances` and `buckets` are lists of {"id": ..., "lastupdated": ...} dicts.
+    """
+    run_write_query(
+        neo4j_session,
+        _SETUP_STALE_PROJECT_CYPHER,
+        org_id=test_ids.org_id,
+        project_id=test_ids.project_id,
+        tag=TEST_UPDATE_TAG_V2,  # Current tag - org is fresh
+        old_tag=TEST_UPDATE_TAG,  # Old tag - project is stale
+        instances=list(instances),
+        buckets=list(buckets),
+    )
+
+
+def _make_fake_credentials():
+    """Create a mock GCP credentials object for testing."""
+    creds = MagicMock()
+    creds.quota_project_id = "test-quota-project"
+    creds.universe_domain = "googleapis.com"
+    return creds
+
+
+@pytest.fixture(scope="class")
+def gcp_sync_mocks():
+    """
+    Patch the GCP API calls made by start_gcp_ingestion() once for the whole test class, rather than re-applying a
+    stack of patch decorators on every test. Tests set `.return_value` on the mocks they need per scenario.
+    """
+    with (
+        patch.multiple(
+            cartography.intel.gcp,
+            get_gcp_credentials=MagicMock(return_value=_make_fake_credentials()),
+            _sync_project_resources=MagicMock(return_value=None),
+        ),
+        patch.multiple(
+            cartography.intel.gcp.iam,
+            get_gcp_predefined_roles=MagicMock(return_value=[]),
+            get_gcp_org_roles=MagicMock(return_value=[]),
+        ),
+        patch.multiple(
+            cartography.intel.gcp.crm.orgs,
+            get_gcp_organizations=DEFAULT,
+        ) as orgs,
+        patch.multiple(
+            cartography.intel.gcp.crm.folders,
+            get_gcp_folders=DEFAULT,
+        ) as folders,
+        patch.multiple(
+            cartography.intel.gcp.crm.projects,
+            get_gcp_projects=DEFAULT,
+        ) as projects,
+    ):
+        yield SimpleNamespace(
+            orgs=orgs["get_gcp_organizations"],
+            folders=folders["get_gcp_folders"],
+            projects=projects["get_gcp_projects"],
+        )
 
 
 class TestProjectCascadeDelete:
@@ -35,163 +197,81 @@ class TestProjectCascadeDelete:
     Test that cascade_delete on GCPProject cleanup removes orphaned child resources.
     """
 
-    def test_project_cascade_deletes_child_resources(self, neo4j_session):
+    def test_project_cascade_deletes_child_resources(self, neo4j_session, test_ids):
         """
         When a stale GCPProject is deleted with cascade_delete=True,
         its child resources should also be deleted.
         """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create org
-        neo4j_session.run(
-            """
-            MERGE (o:GCPOrganization {id: $org_id})
-            SET o.lastupdated = $tag
-            """,
-            org_id=TEST_ORG_ID,
-            tag=TEST_UPDATE_TAG_V2,  # Current tag - org is fresh
-        )
-
-        # Create stale project (old update tag)
-        neo4j_session.run(
-            """
-            MERGE (p:GCPProject:Tenant {id: $project_id})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GCPOrganization {id: $org_id})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_id=TEST_PROJECT_ID,
-            org_id=TEST_ORG_ID,
-            old_tag=TEST_UPDATE_TAG,  # Old tag - project is stale
-        )
-
-        # Create child resources under the project (also stale)
+        # Create a fresh org with a stale project, plus stale child resources under the project.
         # These simulate resources that weren't synced because the project was deleted
-        neo4j_session.run(
-            """
-            MATCH (p:GCPProject {id: $project_id})
-            MERGE (i:GCPInstance {id: $instance_id})
-            SET i.lastupdated = $old_tag
-            MERGE (p)-[:RESOURCE]->(i)
-            """,
-            project_id=TEST_PROJECT_ID,
-            instance_id=f"projects/{TEST_PROJECT_ID}/zones/us-central1-a/instances/orphan-instance",
-            old_tag=TEST_UPDATE_TAG,
-        )
-
-        neo4j_session.run(
-            """
-            MATCH (p:GCPProject {id: $project_id})
-            MERGE (b:GCPBucket {id: $bucket_id})
-            SET b.lastupdated = $old_tag
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_id=TEST_PROJECT_ID,
-            bucket_id=f"projects/{TEST_PROJECT_ID}/buckets/orphan-bucket",
-            old_tag=TEST_UPDATE_TAG,
+        _create_stale_project(
+            neo4j_session,
+            test_ids,
+            instances=[
+                {
+                    "id": _ORPHAN_INSTANCE_ID.format(project_id=test_ids.project_id),
+                    "lastupdated": TEST_UPDATE_TAG,
+                },
+            ],
+            buckets=[
+                {
+                    "id": _ORPHAN_BUCKET_ID.format(project_id=test_ids.project_id),
+                    "lastupdated": TEST_UPDATE_TAG,
+                },
+            ],
         )
 
         # Verify initial state
-        assert len(check_nodes(neo4j_session, "GCPProject", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GCPInstance", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GCPBucket", ["id"])) == 1
+        assert count_nodes_by_label(
+            neo4j_session,
+            ["GCPProject", "GCPInstance", "GCPBucket"],
+            id_contains=test_ids.token,
+        ) == {"GCPProject": 1, "GCPInstance": 1, "GCPBucket": 1}
 
         # Run cleanup with cascade_delete=True
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "ORG_RESOURCE_NAME": TEST_ORG_ID,
-        }
-        GraphJob.from_node_schema(
-            GCPProjectSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
+        _run_cascade_cleanup(GCPProjectSchema(), neo4j_session, test_ids.org_id)
 
         # Verify: project and its children are deleted
-        assert (
-            len(check_nodes(neo4j_session, "GCPProject", ["id"])) == 0
+        assert not any_nodes_exist(
+            neo4j_session, "GCPProject", test_ids.token
         ), "Stale project should be deleted"
-        assert (
-            len(check_nodes(neo4j_session, "GCPInstance", ["id"])) == 0
+        assert not any_nodes_exist(
+            neo4j_session, "GCPInstance", test_ids.token
         ), "Child instance should be cascade deleted"
-        assert (
-            len(check_nodes(neo4j_session, "GCPBucket", ["id"])) == 0
+        assert not any_nodes_exist(
+            neo4j_session, "GCPBucket", test_ids.token
         ), "Child bucket should be cascade deleted"
 
-    def test_project_cascade_preserves_fresh_children(self, neo4j_session):
+    def test_project_cascade_preserves_fresh_children(self, neo4j_session, test_ids):
         """
         When cascade_delete runs, children with current update_tag should be preserved.
         This handles the case where a resource was re-parented in the current sync.
         """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create org
-        neo4j_session.run(
-            """
-            MERGE (o:GCPOrganization {id: $org_id})
-            SET o.lastupdated = $tag
-            """,
-            org_id=TEST_ORG_ID,
-            tag=TEST_UPDATE_TAG_V2,
-        )
-
-        # Create stale project
-        neo4j_session.run(
-            """
-            MERGE (p:GCPProject:Tenant {id: $project_id})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GCPOrganization {id: $org_id})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_id=TEST_PROJECT_ID,
-            org_id=TEST_ORG_ID,
-            old_tag=TEST_UPDATE_TAG,  # Stale
-        )
-
-        # Create a stale child (should be deleted)
-        neo4j_session.run(
-            """
-            MATCH (p:GCPProject {id: $project_id})
-            MERGE (i:GCPInstance {id: $instance_id})
-            SET i.lastupdated = $old_tag
-            MERGE (p)-[:RESOURCE]->(i)
-            """,
-            project_id=TEST_PROJECT_ID,
-            instance_id="stale-instance",
-            old_tag=TEST_UPDATE_TAG,  # Stale
-        )
-
-        # Create a fresh child (should be preserved - maybe re-parented)
-        neo4j_session.run(
-            """
-            MATCH (p:GCPProject {id: $project_id})
-            MERGE (i:GCPInstance {id: $instance_id})
-            SET i.lastupdated = $current_tag
-            MERGE (p)-[:RESOURCE]->(i)
-            """,
-            project_id=TEST_PROJECT_ID,
-            instance_id="fresh-instance",
-            current_tag=TEST_UPDATE_TAG_V2,  # Current - should be preserved
+        stale_instance_id = f"stale-instance-{test_ids.token}"
+        fresh_instance_id = f"fresh-instance-{test_ids.token}"
+
+        # Create a fresh org and a stale project with a stale child (should be deleted) and a fresh child (should be
+        # preserved - maybe re-parented)
+        _create_stale_project(
+            neo4j_session,
+            test_ids,
+            instances=[
+                {"id": stale_instance_id, "lastupdated": TEST_UPDATE_TAG},
+                {"id": fresh_instance_id, "lastupdated": TEST_UPDATE_TAG_V2},
+            ],
         )
 
         # Verify initial state
-        assert len(check_nodes(neo4j_session, "GCPInstance", ["id"])) == 2
+        assert len(_node_ids(neo4j_session, "GCPInstance", test_ids.token)) == 2
 
         # Run cleanup with cascade_delete
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "ORG_RESOURCE_NAME": TEST_ORG_ID,
-        }
-        GraphJob.from_node_schema(
-            GCPProjectSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
+        _run_cascade_cleanup(GCPProjectSchema(), neo4j_session, test_ids.org_id)
 
         # Verify: stale instance deleted, fresh instance preserved
-        remaining_instances = check_nodes(neo4j_session, "GCPInstance", ["id"])
-        instance_ids = {i[0] for i in remaining_instances}
+        instance_ids = _node_ids(neo4j_session, "GCPInstance", test_ids.token)
 
-        assert "stale-instance" not in instance_ids, "Stale instance should be deleted"
-        assert "fresh-instance" in instance_ids, "Fresh instance should be preserved"
+        assert stale_instance_id not in instance_ids, "Stale instance should be deleted"
+        assert fresh_instance_id in instance_ids, "Fresh instance should be preserved"
 
 
 class TestFolderCascadeDelete:
@@ -199,7 +279,7 @@ class TestFolderCascadeDelete:
     Test cascade_delete on GCPFolder cleanup.
     """
 
-    def test_folder_cascade_deletes_child_projects(self, neo4j_session):
+    def test_folder_cascade_deletes_child_projects(self, neo4j_session, test_ids):
         """
         When a stale GCPFolder is deleted with cascade_delete=True,
         child projects with RESOURCE relationship should also be deleted.
@@ -207,64 +287,29 @@ class TestFolderCascadeDelete:
         Note: In GCP, projects have RESOURCE relationship to Organization,
         not to Folder. But folders can have nested folders as children.
         """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create org
-        neo4j_session.run(
-            """
-            MERGE (o:GCPOrganization {id: $org_id})
-            SET o.lastupdated = $tag
-            """,
-            org_id=TEST_ORG_ID,
-            tag=TEST_UPDATE_TAG_V2,
-        )
-
-        # Create stale parent folder
-        parent_folder_id = "folders/parent"
-        neo4j_session.run(
-            """
-            MERGE (f:GCPFolder {id: $folder_id})
-            SET f.lastupdated = $old_tag
-            WITH f
-            MATCH (o:GCPOrganization {id: $org_id})
-            MERGE (o)-[:RESOURCE]->(f)
-            """,
-            folder_id=parent_folder_id,
-            org_id=TEST_ORG_ID,
-            old_tag=TEST_UPDATE_TAG,
-        )
-
-        # Create stale nested folder (child of parent folder)
-        child_folder_id = "folders/child"
-        neo4j_session.run(
-            """
-            MATCH (pf:GCPFolder {id: $parent_id})
-            MERGE (cf:GCPFolder {id: $child_id})
-            SET cf.lastupdated = $old_tag
-            MERGE (pf)-[:RESOURCE]->(cf)
-            """,
+        # Create a fresh org, a stale parent folder under it and a stale nested folder (child of parent folder)
+        parent_folder_id = f"folders/parent-{test_ids.token}"
+        child_folder_id = f"folders/child-{test_ids.token}"
+        run_write_query(
+            neo4j_session,
+            _SETUP_STALE_FOLDERS_CYPHER,
+            org_id=test_ids.org_id,
             parent_id=parent_folder_id,
             child_id=child_folder_id,
+            tag=TEST_UPDATE_TAG_V2,
             old_tag=TEST_UPDATE_TAG,
         )
 
         # Verify initial state
-        assert len(check_nodes(neo4j_session, "GCPFolder", ["id"])) == 2
+        assert len(_node_ids(neo4j_session, "GCPFolder", test_ids.token)) == 2
 
         # Run cleanup with cascade_delete
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "ORG_RESOURCE_NAME": TEST_ORG_ID,
-        }
-        GraphJob.from_node_schema(
-            GCPFolderSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
+        _run_cascade_cleanup(GCPFolderSchema(), neo4j_session, test_ids.org_id)
 
         # Verify: both folders deleted (parent was stale, child cascaded)
-        remaining_folders = check_nodes(neo4j_session, "GCPFolder", ["id"])
-        assert (
-            len(remaining_folders) == 0
-        ), f"All stale folders should be deleted, but found: {remaining_folders}"
+        assert not any_nodes_exist(
+            neo4j_session, "GCPFolder", test_ids.token
+        ), f"All stale folders should be deleted, but found: {_node_ids(neo4j_session, 'GCPFolder', test_ids.token)}"
 
 
 class TestCascadeDeleteIntegration:
@@ -272,77 +317,31 @@ class TestCascadeDeleteIntegration:
     Integration test using the full GCP sync flow with cascade_delete.
     """
 
-    def _make_fake_credentials(self):
-        """Create a mock GCP credentials object for testing."""
-        creds = MagicMock()
-        creds.quota_project_id = "test-quota-project"
-        creds.universe_domain = "googleapis.com"
-        return creds
-
-    @patch.object(
-        cartography.intel.gcp,
-        "get_gcp_credentials",
-    )
-    @patch.object(
-        cartography.intel.gcp,
-        "_sync_project_resources",
-        return_value=None,
-    )
-    @patch.object(
-        cartography.intel.gcp.crm.projects,
-        "get_gcp_projects",
-    )
-    @patch.object(
-        cartography.intel.gcp.crm.folders,
-        "get_gcp_folders",
-    )
-    @patch.object(
-        cartography.intel.gcp.crm.orgs,
-        "get_gcp_organizations",
-    )
-    @patch.object(
-        cartography.intel.gcp.iam,
-        "get_gcp_predefined_roles",
-        return_value=[],
-    )
-    @patch.object(
-        cartography.intel.gcp.iam,
-        "get_gcp_org_roles",
-        return_value=[],
-    )
     def test_full_sync_with_cascade_delete(
         self,
-        mock_get_org_roles,
-        mock_get_predefined_roles,
-        mock_get_orgs,
-        mock_get_folders,
-        mock_get_projects,
-        mock_sync_resources,
-        mock_get_creds,
+        gcp_sync_mocks,
         neo4j_session,
+        test_ids,
     ):
         """
         Test the full GCP sync flow properly cascades deletions.
         """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-        mock_get_creds.return_value = self._make_fake_credentials()
-
         # First sync: org with project
-        mock_get_orgs.return_value = [
+        gcp_sync_mocks.orgs.return_value = [
             {
-                "name": TEST_ORG_ID,
+                "name": test_ids.org_id,
                 "displayName": "test-org",
                 "lifecycleState": "ACTIVE",
             }
         ]
-        mock_get_folders.return_value = []
-        mock_get_projects.return_value = [
+        gcp_sync_mocks.folders.return_value = []
+        gcp_sync_mocks.projects.return_value = [
             {
-                "projectId": TEST_PROJECT_ID,
+                "projectId": test_ids.project_id,
                 "projectNumber": "123456",
                 "name": "Test Project",
                 "lifecycleState": "ACTIVE",
-                "parent": TEST_ORG_ID,
+                "parent": test_ids.org_id,
             }
         ]
 
@@ -353,32 +352,31 @@ class TestCascadeDeleteIntegration:
         cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
         # Create a child resource under the project
-        neo4j_session.run(
-            """
-            MATCH (p:GCPProject {id: $project_id})
-            MERGE (i:GCPInstance {id: $instance_id})
-            SET i.lastupdated = $tag
-            MERGE (p)-[:RESOURCE]->(i)
-            """,
-            project_id=TEST_PROJECT_ID,
-            instance_id="orphan-instance",
+        run_write_query(
+            neo4j_session,
+            _ADD_CHILD_INSTANCE_CYPHER,
+            project_id=test_ids.project_id,
+            instance_id=f"orphan-instance-{test_ids.token}",
             tag=TEST_UPDATE_TAG,
         )
 
         # Verify initial state
-        assert len(check_nodes(neo4j_session, "GCPProject", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GCPInstance", ["id"])) == 1
+        assert count_nodes_by_label(
+            neo4j_session,
+            ["GCPProject", "GCPInstance"],
+            id_contains=test_ids.token,
+        ) == {"GCPProject": 1, "GCPInstance": 1}
 
         # Second sync: project is deleted
-        mock_get_projects.return_value = []  # Project no longer exists
+        gcp_sync_mocks.projects.return_value = []  # Project no longer exists
 
         config.update_tag = TEST_UPDATE_TAG_V2
         cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
         # Verify: project and its child instance are both deleted
-        assert (
-            len(check_nodes(neo4j_session, "GCPProject", ["id"])) == 0
+        assert not any_nodes_exist(
+            neo4j_session, "GCPProject", test_ids.token
         ), "Deleted project should be cleaned up"
-        assert (
-            len(check_nodes(neo4j_session, "GCPInstance", ["id"])) == 0
+        assert not any_nodes_exist(
+            neo4j_session, "GCPInstance", test_ids.token
         ), "Child instance should be cascade deleted when project is deleted"
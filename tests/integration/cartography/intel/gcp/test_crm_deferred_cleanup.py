@@ -3,9 +3,12 @@ Integration tests for GCP CRM deferred cleanup functionality.
 Tests that hierarchical cleanup happens in the correct order to prevent orphaned nodes.
 """
 
+from functools import reduce
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
+
 import cartography.intel.gcp
 import cartography.intel.gcp.crm.folders
 import cartography.intel.gcp.crm.orgs
@@ -18,10 +21,22 @@ from cartography.models.gcp.crm.folders import GCPFolderSchema
 from tests.integration import settings
 from tests.integration.util import check_nodes
 from tests.integration.util import check_rels
+from tests.integration.util import query_single_value
 
 TEST_UPDATE_TAG = 123456789
 TEST_UPDATE_TAG_V2 = 123456790  # For simulating a second sync
 
+pytestmark = pytest.mark.needs_clean_graph
+
+_PROJECT_PARENT_ORG_IDS_QUERY = """
+MATCH (:GCPProject{id: $project_id})-[:PARENT]->(o:GCPOrganization)
+RETURN collect(o.id) AS ids
+"""
+_PROJECT_RESOURCE_ORG_IDS_QUERY = """
+MATCH (o:GCPOrganization)-[:RESOURCE]->(:GCPProject{id: $project_id})
+RETURN collect(o.id) AS ids
+"""
+
 
 def _make_fake_credentials():
     """Create a mock GCP credentials object for testing."""
@@ -31,16 +46,75 @@ def _make_fake_credentials():
     return creds
 
 
-@patch.object(
-    cartography.intel.gcp,
-    "get_gcp_credentials",
-    return_value=_make_fake_credentials(),
-)
-@patch.object(
-    cartography.intel.gcp,
-    "_sync_project_resources",
-    return_value=None,  # Skip project resource sync for these tests
-)
+_FAKE_CREDS = _make_fake_credentials()
+
+
+def _gcp_full_mocks(func):
+    """
+    Decorator that stubs out the GCP calls every test in this module needs mocked: credentials, per-project resource
+    sync and the org-level IAM role listings. The stubs are passed as `new` so they do not add mock arguments to the
+    test signature.
+    """
+    patchers = [
+        patch.object(
+            cartography.intel.gcp,
+            "get_gcp_credentials",
+            new=MagicMock(return_value=_FAKE_CREDS),
+        ),
+        patch.object(
+            cartography.intel.gcp,
+            "_sync_project_resources",
+            new=MagicMock(return_value=None),  # Skip project resource sync
+        ),
+        patch.object(
+            cartography.intel.gcp.iam,
+            "get_gcp_predefined_roles",
+            new=MagicMock(return_value=[]),
+        ),
+        patch.object(
+            cartography.intel.gcp.iam,
+            "get_gcp_org_roles",
+            new=MagicMock(return_value=[]),
+        ),
+    ]
+    return reduce(lambda f, patcher: patcher(f), reversed(patchers), func)
+
+
+@_gcp_full_mocks
+def _run_initial_sync(neo4j_session):
+    with (
+        patch.object(
+            cartography.intel.gcp.crm.orgs,
+            "get_gcp_organizations",
+            return_value=tests.data.gcp.crm.GCP_ORGANIZATIONS,
+        ),
+        patch.object(
+            cartography.intel.gcp.crm.folders,
+            "get_gcp_folders",
+            return_value=tests.data.gcp.crm.GCP_FOLDERS,
+        ),
+        patch.object(
+            cartography.intel.gcp.crm.projects,
+            "get_gcp_projects",
+            return_value=tests.data.gcp.crm.GCP_PROJECTS,
+        ),
+    ):
+        config = Config(
+            neo4j_uri=settings.get("NEO4J_URL"),
+            update_tag=TEST_UPDATE_TAG,
+        )
+        cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
+
+
+@pytest.fixture
+def primed_gcp_graph(neo4j_session):
+    """
+    Run a first full GCP ingestion of the org, folder and project test data through the production loaders.
+    """
+    _run_initial_sync(neo4j_session)
+
+
+@_gcp_full_mocks
 @patch.object(
     cartography.intel.gcp.crm.projects,
     "get_gcp_projects",
@@ -56,24 +130,10 @@ def _make_fake_credentials():
     "get_gcp_organizations",
     return_value=tests.data.gcp.crm.GCP_ORGANIZATIONS,
 )
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
 def test_deferred_cleanup_order(
-    mock_get_org_roles,
-    mock_get_predefined_roles,
     mock_get_orgs,
     mock_get_folders,
     mock_get_projects,
-    mock_sync_resources,
-    mock_get_creds,
     neo4j_session,
 ):
     """
@@ -83,16 +143,14 @@ def test_deferred_cleanup_order(
     3. Folders (deferred, but before orgs)
     4. Organizations (last)
     """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
 
     # Track the order of cleanup job executions
     cleanup_order = []
     original_run = GraphJob.run
 
     def track_cleanup(self, session):
-        # Track which schema is being cleaned up
-        if hasattr(self, "name"):
-            cleanup_order.append(self.name)
+        # Track which schema is being cleaned up; every GraphJob has a name
+        cleanup_order.append(self.name)
         return original_run(self, session)
 
     with patch.object(GraphJob, "run", track_cleanup):
@@ -107,44 +165,26 @@ def test_deferred_cleanup_order(
 
     # Verify cleanup happened in the correct order
     # Should see: Projects cleaned up before Folders, Folders before Organizations
-    # The job names include "Cleanup" prefix
-    assert any(
-        "GCPProject" in name for name in cleanup_order
-    ), f"GCPProject cleanup not found in {cleanup_order}"
-    assert any(
-        "GCPFolder" in name for name in cleanup_order
-    ), f"GCPFolder cleanup not found in {cleanup_order}"
-    assert any(
-        "GCPOrganization" in name for name in cleanup_order
-    ), f"GCPOrganization cleanup not found in {cleanup_order}"
-
-    # Find the indices of cleanup jobs
-    project_idx = next(
-        i for i, name in enumerate(cleanup_order) if "GCPProject" in name
-    )
-    folder_idx = next(i for i, name in enumerate(cleanup_order) if "GCPFolder" in name)
-    org_idx = next(
-        i for i, name in enumerate(cleanup_order) if "GCPOrganization" in name
-    )
+    # The job names include "Cleanup" prefix. Record the first cleanup of each label in one pass.
+    hierarchy = ("GCPProject", "GCPFolder", "GCPOrganization")
+    first_idx = {}
+    for i, name in enumerate(cleanup_order):
+        for label in hierarchy:
+            if label in name:
+                first_idx.setdefault(label, i)
+
+    for label in hierarchy:
+        assert label in first_idx, f"{label} cleanup not found in {cleanup_order}"
 
     assert (
-        project_idx < folder_idx
+        first_idx["GCPProject"] < first_idx["GCPFolder"]
     ), f"Projects should be cleaned before folders: {cleanup_order}"
     assert (
-        folder_idx < org_idx
+        first_idx["GCPFolder"] < first_idx["GCPOrganization"]
     ), f"Folders should be cleaned before orgs: {cleanup_order}"
 
 
-@patch.object(
-    cartography.intel.gcp,
-    "get_gcp_credentials",
-    return_value=_make_fake_credentials(),
-)
-@patch.object(
-    cartography.intel.gcp,
-    "_sync_project_resources",
-    return_value=None,
-)
+@_gcp_full_mocks
 @patch.object(
     cartography.intel.gcp.crm.projects,
     "get_gcp_projects",
@@ -157,44 +197,19 @@ def test_deferred_cleanup_order(
     cartography.intel.gcp.crm.orgs,
     "get_gcp_organizations",
 )
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
 def test_org_deletion_cleanup(
-    mock_get_org_roles,
-    mock_get_predefined_roles,
     mock_get_orgs,
     mock_get_folders,
     mock_get_projects,
-    mock_sync_resources,
-    mock_get_creds,
     neo4j_session,
+    primed_gcp_graph,
 ):
     """
     Test that when an org is deleted (no longer returned by API),
     its projects and folders are cleaned up properly.
     """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-    # First sync: org exists with folders and projects
-    mock_get_orgs.return_value = tests.data.gcp.crm.GCP_ORGANIZATIONS
-    mock_get_folders.return_value = tests.data.gcp.crm.GCP_FOLDERS
-    mock_get_projects.return_value = tests.data.gcp.crm.GCP_PROJECTS
-
-    config = Config(
-        neo4j_uri=settings.get("NEO4J_URL"),
-        update_tag=TEST_UPDATE_TAG,
-    )
-
-    cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
+    # First sync (primed_gcp_graph): org exists with folders and projects
     # Verify initial state - org, folders, and projects exist
     assert len(check_nodes(neo4j_session, "GCPOrganization", ["id"])) == 1
     assert len(check_nodes(neo4j_session, "GCPFolder", ["id"])) == 1
@@ -205,7 +220,10 @@ def test_org_deletion_cleanup(
     mock_get_folders.return_value = []  # No folders returned
     mock_get_projects.return_value = []  # No projects returned
 
-    config.update_tag = TEST_UPDATE_TAG_V2
+    config = Config(
+        neo4j_uri=settings.get("NEO4J_URL"),
+        update_tag=TEST_UPDATE_TAG_V2,
+    )
     cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
     # In the current implementation, when an org is no longer returned by the API,
@@ -233,16 +251,7 @@ def test_org_deletion_cleanup(
     ), "Org should be stale"
 
 
-@patch.object(
-    cartography.intel.gcp,
-    "get_gcp_credentials",
-    return_value=_make_fake_credentials(),
-)
-@patch.object(
-    cartography.intel.gcp,
-    "_sync_project_resources",
-    return_value=None,
-)
+@_gcp_full_mocks
 @patch.object(
     cartography.intel.gcp.crm.projects,
     "get_gcp_projects",
@@ -255,50 +264,28 @@ def test_org_deletion_cleanup(
     cartography.intel.gcp.crm.orgs,
     "get_gcp_organizations",
 )
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
 def test_partial_deletion_cleanup(
-    mock_get_org_roles,
-    mock_get_predefined_roles,
     mock_get_orgs,
     mock_get_folders,
     mock_get_projects,
-    mock_sync_resources,
-    mock_get_creds,
     neo4j_session,
+    primed_gcp_graph,
 ):
     """
     Test that when some resources are deleted but not others,
     cleanup works correctly.
     """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-    # First sync: org exists with folders and projects
-    mock_get_orgs.return_value = tests.data.gcp.crm.GCP_ORGANIZATIONS
-    mock_get_folders.return_value = tests.data.gcp.crm.GCP_FOLDERS
-    mock_get_projects.return_value = tests.data.gcp.crm.GCP_PROJECTS
-
-    config = Config(
-        neo4j_uri=settings.get("NEO4J_URL"),
-        update_tag=TEST_UPDATE_TAG,
-    )
-
-    cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
+    # First sync (primed_gcp_graph): org exists with folders and projects
     # Second sync: org still exists, but folders and projects are gone
     mock_get_orgs.return_value = tests.data.gcp.crm.GCP_ORGANIZATIONS
     mock_get_folders.return_value = []  # No folders
     mock_get_projects.return_value = []  # No projects
 
-    config.update_tag = TEST_UPDATE_TAG_V2
+    config = Config(
+        neo4j_uri=settings.get("NEO4J_URL"),
+        update_tag=TEST_UPDATE_TAG_V2,
+    )
     cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
     # Verify org still exists
@@ -315,38 +302,14 @@ def test_partial_deletion_cleanup(
     ), "Projects should be cleaned up"
 
 
-@patch.object(
-    cartography.intel.gcp,
-    "get_gcp_credentials",
-    return_value=_make_fake_credentials(),
-)
-@patch.object(
-    cartography.intel.gcp,
-    "_sync_project_resources",
-    return_value=None,  # Skip project resource sync for these tests
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
+@_gcp_full_mocks
 def test_project_migration_between_orgs(
-    mock_get_org_roles,
-    mock_get_predefined_roles,
-    mock_sync_resources,
-    mock_get_creds,
     neo4j_session,
 ):
     """
     Test that when a project migrates from one org to another,
     old relationships are properly cleaned up using the full ingestion flow.
     """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
 
     # Two organizations
     orgs_initial = [
@@ -399,6 +362,9 @@ def test_project_migration_between_orgs(
             "get_gcp_projects",
             side_effect=get_projects_initial,
         ),
+        # Only org/folder/project edges are asserted on, so skip the org-level IAM sync and its cleanup job
+        patch.object(cartography.intel.gcp.iam, "sync_org_iam", return_value=None),
+        patch.object(cartography.intel.gcp.iam, "cleanup_org_roles", return_value=None),
     ):
         config = Config(
             neo4j_uri=settings.get("NEO4J_URL"),
@@ -470,6 +436,9 @@ def test_project_migration_between_orgs(
             "get_gcp_projects",
             side_effect=get_projects_after_migration,
         ),
+        # Only org/folder/project edges are asserted on, so skip the org-level IAM sync and its cleanup job
+        patch.object(cartography.intel.gcp.iam, "sync_org_iam", return_value=None),
+        patch.object(cartography.intel.gcp.iam, "cleanup_org_roles", return_value=None),
     ):
         config = Config(
             neo4j_uri=settings.get("NEO4J_URL"),
@@ -478,39 +447,30 @@ def test_project_migration_between_orgs(
         cartography.intel.gcp.start_gcp_ingestion(neo4j_session, config)
 
     # Verify final state - project should only be related to org2 now
-    parent_rels_after = check_rels(
+    parent_orgs_after = query_single_value(
         neo4j_session,
-        "GCPProject",
-        "id",
-        "GCPOrganization",
-        "id",
-        "PARENT",
-        rel_direction_right=True,
+        _PROJECT_PARENT_ORG_IDS_QUERY,
+        {"project_id": "migrating-project"},
     )
-    assert parent_rels_after == {
-        ("migrating-project", "organizations/9999"),
-    }, f"Project should only have PARENT relationship to org2, but got {parent_rels_after}"
+    assert parent_orgs_after == [
+        "organizations/9999",
+    ], f"Project should only have PARENT relationship to org2, but got {parent_orgs_after}"
 
     # Check RESOURCE relationships
-    resource_rels_after = check_rels(
+    resource_orgs_after = query_single_value(
         neo4j_session,
-        "GCPOrganization",
-        "id",
-        "GCPProject",
-        "id",
-        "RESOURCE",
-        rel_direction_right=True,
+        _PROJECT_RESOURCE_ORG_IDS_QUERY,
+        {"project_id": "migrating-project"},
     )
-    assert resource_rels_after == {
-        ("organizations/9999", "migrating-project"),
-    }, f"Only org2 should have RESOURCE relationship, but got {resource_rels_after}"
+    assert resource_orgs_after == [
+        "organizations/9999",
+    ], f"Only org2 should have RESOURCE relationship, but got {resource_orgs_after}"
 
 
 def test_cleanup_with_multiple_orgs(neo4j_session):
     """
     Test that cleanup works correctly when there are multiple organizations.
     """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
 
     # Create test data with multiple orgs
     multiple_orgs = [
@@ -544,18 +504,13 @@ def test_cleanup_with_multiple_orgs(neo4j_session):
         },
     ]
 
-    # Load first org with its resources
+    # Load both orgs and their folders
     cartography.intel.gcp.crm.orgs.load_gcp_organizations(
-        neo4j_session, [multiple_orgs[0]], TEST_UPDATE_TAG
+        neo4j_session, multiple_orgs, TEST_UPDATE_TAG
     )
     cartography.intel.gcp.crm.folders.load_gcp_folders(
         neo4j_session, folders_org1, TEST_UPDATE_TAG, "organizations/1337"
     )
-
-    # Load second org with its resources
-    cartography.intel.gcp.crm.orgs.load_gcp_organizations(
-        neo4j_session, [multiple_orgs[1]], TEST_UPDATE_TAG
-    )
     cartography.intel.gcp.crm.folders.load_gcp_folders(
         neo4j_session, folders_org2, TEST_UPDATE_TAG, "organizations/9999"
     )
@@ -1,10 +1,17 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 import cartography.intel.gcp.iam
 import tests.data.gcp.iam
-from tests.integration.util import check_nodes
-from tests.integration.util import check_rels
+from cartography.models.gcp.crm.organizations import GCPOrganizationSchema
+from cartography.models.gcp.crm.projects import GCPProjectSchema
+from cartography.models.gcp.iam import GCPOrgRoleSchema
+from cartography.models.gcp.iam import GCPProjectRoleSchema
+from cartography.models.gcp.iam import GCPServiceAccountSchema
+from tests.integration.util import ensure_schema_indexes
+from tests.integration.util import graph_snapshot
 
 TEST_PROJECT_ID = "project-abc"
 TEST_ORG_ID = "organizations/123456789012"
@@ -15,65 +22,69 @@ COMMON_JOB_PARAMS = {
     "UPDATE_TAG": TEST_UPDATE_TAG,
 }
 
+pytestmark = pytest.mark.needs_clean_graph
+
+# Each test syncs once and checks everything it loaded with a single graph_snapshot() query. The specs are module
+# constants so every run sends the same query text and hits Neo4j's query plan cache.
+_ORG_ROLE_REL = ("GCPOrganization", "id", "GCPRole", "name", "RESOURCE")
+_PROJECT_ROLE_REL = ("GCPProject", "id", "GCPRole", "name", "RESOURCE")
+_PROJECT_SA_REL = ("GCPProject", "id", "GCPServiceAccount", "id", "RESOURCE")
+_PROJECT_IAM_SPEC = {
+    "nodes": {
+        "GCPRole": ["id", "scope", "role_type"],
+        "GCPServiceAccount": ["id"],
+    },
+    "rels": [_PROJECT_ROLE_REL, _ORG_ROLE_REL, _PROJECT_SA_REL],
+}
+_ORG_IAM_SPEC = {
+    "nodes": {"GCPRole": ["id", "scope", "role_type"]},
+    "rels": [_ORG_ROLE_REL],
+}
 
-def _create_test_project(neo4j_session, project_id: str, update_tag: int):
-    """Helper to create a GCPProject node for testing."""
-    neo4j_session.run(
-        """
-        MERGE (p:GCPProject{id:$ProjectId})
-        ON CREATE SET p.firstseen = timestamp()
-        SET p.lastupdated = $gcp_update_tag
-        """,
-        ProjectId=project_id,
-        gcp_update_tag=update_tag,
-    )
 
+_SEED_NODES_CYPHER = """
+UNWIND $rows AS r
+FOREACH (_ IN CASE WHEN r.label = 'GCPProject' THEN [1] ELSE [] END |
+    MERGE (p:GCPProject{id: r.id})
+    ON CREATE SET p.firstseen = timestamp()
+    SET p.lastupdated = r.tag
+)
+FOREACH (_ IN CASE WHEN r.label = 'GCPOrganization' THEN [1] ELSE [] END |
+    MERGE (o:GCPOrganization{id: r.id})
+    ON CREATE SET o.firstseen = timestamp()
+    SET o.lastupdated = r.tag
+)
+"""
+
+_PROJECT_ROW = {"label": "GCPProject", "id": TEST_PROJECT_ID, "tag": TEST_UPDATE_TAG}
+_ORG_ROW = {"label": "GCPOrganization", "id": TEST_ORG_ID, "tag": TEST_UPDATE_TAG}
 
-def _create_test_organization(neo4j_session, org_id: str, update_tag: int):
-    """Helper to create a GCPOrganization node for testing."""
-    neo4j_session.run(
-        """
-        MERGE (o:GCPOrganization{id:$OrgId})
-        ON CREATE SET o.firstseen = timestamp()
-        SET o.lastupdated = $gcp_update_tag
-        """,
-        OrgId=org_id,
-        gcp_update_tag=update_tag,
+
+@pytest.fixture(scope="module", autouse=True)
+def _gcp_indexes(neo4j_session):
+    """_seed_nodes() MERGEs projects and orgs by id, so create their indexes once for the module."""
+    ensure_schema_indexes(
+        neo4j_session,
+        GCPOrganizationSchema(),
+        GCPProjectSchema(),
+        GCPOrgRoleSchema(),
+        GCPProjectRoleSchema(),
+        GCPServiceAccountSchema(),
     )
 
 
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=tests.data.gcp.iam.LIST_SERVICE_ACCOUNTS_RESPONSE["accounts"],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=tests.data.gcp.iam.LIST_PROJECT_CUSTOM_ROLES_RESPONSE["roles"],
-)
-def test_sync_gcp_iam_project_roles(
-    _mock_get_project_roles, _mock_get_sa, neo4j_session
-):
-    """Test sync() loads GCP IAM project-level custom roles correctly."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
+def _seed_nodes(neo4j_session, rows: list[dict]):
+    """Helper to create GCPProject and GCPOrganization nodes for testing in one query."""
+    neo4j_session.run(_SEED_NODES_CYPHER, rows=rows).consume()
 
-    cartography.intel.gcp.iam.sync(
+
+def _create_test_project(neo4j_session, project_id: str, update_tag: int):
+    """Helper to create a GCPProject node for testing."""
+    _seed_nodes(
         neo4j_session,
-        MagicMock(),
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
+        [{"label": "GCPProject", "id": project_id, "tag": update_tag}],
     )
 
-    # Verify only project-level custom roles are created
-    assert check_nodes(neo4j_session, "GCPRole", ["id"]) == {
-        ("projects/project-abc/roles/customRole1",),
-        ("projects/project-abc/roles/customRole2",),
-    }
-
 
 @patch.object(
     cartography.intel.gcp.iam,
@@ -85,122 +96,42 @@ def test_sync_gcp_iam_project_roles(
     "get_gcp_project_custom_roles",
     return_value=tests.data.gcp.iam.LIST_PROJECT_CUSTOM_ROLES_RESPONSE["roles"],
 )
-def test_sync_gcp_iam_service_accounts(
-    _mock_get_project_roles, _mock_get_sa, neo4j_session
-):
-    """Test sync() loads GCP IAM service accounts correctly."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
+def test_sync_gcp_iam(_mock_get_project_roles, _mock_get_sa, neo4j_session):
+    """Test sync() loads GCP IAM project-level custom roles and service accounts and their relationships."""
+    _seed_nodes(neo4j_session, [_PROJECT_ROW, _ORG_ROW])
 
     cartography.intel.gcp.iam.sync(
         neo4j_session,
-        MagicMock(),
+        SimpleNamespace(),
         TEST_PROJECT_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
     )
 
+    snapshot = graph_snapshot(neo4j_session, _PROJECT_IAM_SPEC)
+
+    # Verify only project-level custom roles are created, with PROJECT scope and CUSTOM type
+    assert snapshot["nodes"]["GCPRole"] == {
+        ("projects/project-abc/roles/customRole1", "PROJECT", "CUSTOM"),
+        ("projects/project-abc/roles/customRole2", "PROJECT", "CUSTOM"),
+    }
+
     # Verify service account nodes
-    assert check_nodes(neo4j_session, "GCPServiceAccount", ["id"]) == {
+    assert snapshot["nodes"]["GCPServiceAccount"] == {
         ("112233445566778899",),
         ("998877665544332211",),
     }
 
-
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=tests.data.gcp.iam.LIST_SERVICE_ACCOUNTS_RESPONSE["accounts"],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=tests.data.gcp.iam.LIST_PROJECT_CUSTOM_ROLES_RESPONSE["roles"],
-)
-def test_sync_gcp_iam_project_role_relationships(
-    _mock_get_project_roles, _mock_get_sa, neo4j_session
-):
-    """Test sync() creates correct relationships for project-level custom roles.
-
-    Project-level custom roles are sub-resources of their project, not the organization.
-    """
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
-
-    cartography.intel.gcp.iam.sync(
-        neo4j_session,
-        MagicMock(),
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    # Verify project -> role RESOURCE relationship (sub_resource)
-    assert check_rels(
-        neo4j_session,
-        "GCPProject",
-        "id",
-        "GCPRole",
-        "name",
-        "RESOURCE",
-        rel_direction_right=True,
-    ) == {
+    # Verify project -> role RESOURCE relationship (sub_resource).
+    # Project-level custom roles are sub-resources of their project, not the organization.
+    assert snapshot["rels"][_PROJECT_ROLE_REL] == {
         (TEST_PROJECT_ID, "projects/project-abc/roles/customRole1"),
         (TEST_PROJECT_ID, "projects/project-abc/roles/customRole2"),
     }
-
-    # Verify no organization -> role relationship for project-level roles
-    assert (
-        check_rels(
-            neo4j_session,
-            "GCPOrganization",
-            "id",
-            "GCPRole",
-            "name",
-            "RESOURCE",
-            rel_direction_right=True,
-        )
-        == set()
-    )
-
-
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=tests.data.gcp.iam.LIST_SERVICE_ACCOUNTS_RESPONSE["accounts"],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=[],
-)
-def test_sync_gcp_iam_service_account_relationships(
-    _mock_get_project_roles, _mock_get_sa, neo4j_session
-):
-    """Test sync() creates correct relationships for GCP IAM service accounts."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
-
-    cartography.intel.gcp.iam.sync(
-        neo4j_session,
-        MagicMock(),
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
+    assert snapshot["rels"][_ORG_ROLE_REL] == set()
 
     # Verify project -> service account RESOURCE relationship
-    assert check_rels(
-        neo4j_session,
-        "GCPProject",
-        "id",
-        "GCPServiceAccount",
-        "id",
-        "RESOURCE",
-        rel_direction_right=True,
-    ) == {
+    assert snapshot["rels"][_PROJECT_SA_REL] == {
         (TEST_PROJECT_ID, "112233445566778899"),
         (TEST_PROJECT_ID, "998877665544332211"),
     }
@@ -216,67 +147,35 @@ def test_sync_gcp_iam_service_account_relationships(
     "get_gcp_org_roles",
     return_value=tests.data.gcp.iam.LIST_ORG_ROLES_RESPONSE["roles"],
 )
-def test_sync_org_iam_roles(_mock_get_org_roles, _mock_get_predefined, neo4j_session):
-    """Test sync_org_iam() loads organization-level IAM roles correctly."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
+def test_sync_org_iam(_mock_get_org_roles, _mock_get_predefined, neo4j_session):
+    """Test sync_org_iam() loads organization-level IAM roles, their scope and their relationships."""
+    _seed_nodes(neo4j_session, [_ORG_ROW])
 
     cartography.intel.gcp.iam.sync_org_iam(
         neo4j_session,
-        MagicMock(),
+        SimpleNamespace(),
         TEST_ORG_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
     )
 
-    # Verify all org-level roles are created (predefined + custom org roles)
-    assert check_nodes(neo4j_session, "GCPRole", ["id"]) == {
-        # Basic/predefined roles
-        ("roles/owner",),
-        ("roles/editor",),
-        ("roles/viewer",),
-        ("roles/iam.securityAdmin",),
-        # Custom org roles
-        ("organizations/123456789012/roles/customOrgRole1",),
-        ("organizations/123456789012/roles/customOrgRole2",),
+    snapshot = graph_snapshot(neo4j_session, _ORG_IAM_SPEC)
+
+    # Verify all org-level roles are created (predefined + custom org roles) with the right scope and type
+    assert snapshot["nodes"]["GCPRole"] == {
+        # Basic roles should have GLOBAL scope and BASIC type
+        ("roles/owner", "GLOBAL", "BASIC"),
+        ("roles/editor", "GLOBAL", "BASIC"),
+        ("roles/viewer", "GLOBAL", "BASIC"),
+        # Predefined roles should have GLOBAL scope and PREDEFINED type
+        ("roles/iam.securityAdmin", "GLOBAL", "PREDEFINED"),
+        # Custom org roles should have ORGANIZATION scope and CUSTOM type
+        ("organizations/123456789012/roles/customOrgRole1", "ORGANIZATION", "CUSTOM"),
+        ("organizations/123456789012/roles/customOrgRole2", "ORGANIZATION", "CUSTOM"),
     }
 
-
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=tests.data.gcp.iam.LIST_PREDEFINED_ROLES_RESPONSE["roles"],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=tests.data.gcp.iam.LIST_ORG_ROLES_RESPONSE["roles"],
-)
-def test_sync_org_iam_role_relationships(
-    _mock_get_org_roles, _mock_get_predefined, neo4j_session
-):
-    """Test sync_org_iam() creates correct relationships for org-level roles."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
-
-    cartography.intel.gcp.iam.sync_org_iam(
-        neo4j_session,
-        MagicMock(),
-        TEST_ORG_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
     # Verify organization -> role RESOURCE relationship
-    assert check_rels(
-        neo4j_session,
-        "GCPOrganization",
-        "id",
-        "GCPRole",
-        "name",
-        "RESOURCE",
-        rel_direction_right=True,
-    ) == {
+    assert snapshot["rels"][_ORG_ROLE_REL] == {
         (TEST_ORG_ID, "roles/owner"),
         (TEST_ORG_ID, "roles/editor"),
         (TEST_ORG_ID, "roles/viewer"),
@@ -284,102 +183,3 @@ def test_sync_org_iam_role_relationships(
         (TEST_ORG_ID, "organizations/123456789012/roles/customOrgRole1"),
         (TEST_ORG_ID, "organizations/123456789012/roles/customOrgRole2"),
     }
-
-
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=tests.data.gcp.iam.LIST_PREDEFINED_ROLES_RESPONSE["roles"],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=tests.data.gcp.iam.LIST_ORG_ROLES_RESPONSE["roles"],
-)
-def test_sync_org_iam_role_scope_property(
-    _mock_get_org_roles, _mock_get_predefined, neo4j_session
-):
-    """Test sync_org_iam() sets the scope property correctly on roles."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
-
-    cartography.intel.gcp.iam.sync_org_iam(
-        neo4j_session,
-        MagicMock(),
-        TEST_ORG_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    # Verify scope property is set correctly
-    result = neo4j_session.run(
-        """
-        MATCH (r:GCPRole)
-        RETURN r.name as name, r.scope as scope, r.role_type as role_type
-        ORDER BY r.name
-        """
-    )
-    roles = {
-        record["name"]: (record["scope"], record["role_type"]) for record in result
-    }
-
-    # Basic roles should have GLOBAL scope and BASIC type
-    assert roles["roles/owner"] == ("GLOBAL", "BASIC")
-    assert roles["roles/editor"] == ("GLOBAL", "BASIC")
-    assert roles["roles/viewer"] == ("GLOBAL", "BASIC")
-
-    # Predefined roles should have GLOBAL scope and PREDEFINED type
-    assert roles["roles/iam.securityAdmin"] == ("GLOBAL", "PREDEFINED")
-
-    # Custom org roles should have ORGANIZATION scope and CUSTOM type
-    assert roles["organizations/123456789012/roles/customOrgRole1"] == (
-        "ORGANIZATION",
-        "CUSTOM",
-    )
-    assert roles["organizations/123456789012/roles/customOrgRole2"] == (
-        "ORGANIZATION",
-        "CUSTOM",
-    )
-
-
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=tests.data.gcp.iam.LIST_PROJECT_CUSTOM_ROLES_RESPONSE["roles"],
-)
-def test_sync_project_role_scope_property(
-    _mock_get_project_roles, _mock_get_sa, neo4j_session
-):
-    """Test sync() sets the scope property correctly on project custom roles."""
-    neo4j_session.run("MATCH (n) DETACH DELETE n")
-    _create_test_project(neo4j_session, TEST_PROJECT_ID, TEST_UPDATE_TAG)
-    _create_test_organization(neo4j_session, TEST_ORG_ID, TEST_UPDATE_TAG)
-
-    cartography.intel.gcp.iam.sync(
-        neo4j_session,
-        MagicMock(),
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    # Verify scope property is set correctly
-    result = neo4j_session.run(
-        """
-        MATCH (r:GCPRole)
-        RETURN r.name as name, r.scope as scope, r.role_type as role_type
-        ORDER BY r.name
-        """
-    )
-    roles = {
-        record["name"]: (record["scope"], record["role_type"]) for record in result
-    }
-
-    # Custom project roles should have PROJECT scope and CUSTOM type
-    assert roles["projects/project-abc/roles/customRole1"] == ("PROJECT", "CUSTOM")
-    assert roles["projects/project-abc/roles/customRole2"] == ("PROJECT", "CUSTOM")
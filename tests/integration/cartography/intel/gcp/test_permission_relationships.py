@@ -1,31 +1,23 @@
-from unittest.mock import MagicMock
-from unittest.mock import patch
+import pytest
 
 import cartography.intel.gcp.compute
-import cartography.intel.gcp.iam
 import cartography.intel.gcp.permission_relationships
 import cartography.intel.gcp.policy_bindings
 import cartography.intel.gcp.storage
-import cartography.intel.gsuite.groups
-import cartography.intel.gsuite.users
 from tests.data.gcp.permission_relationships import MOCK_COMPUTE_INSTANCES
 from tests.data.gcp.permission_relationships import MOCK_PERMISSION_RELATIONSHIPS_YAML
 from tests.data.gcp.permission_relationships import MOCK_STORAGE_BUCKETS
-from tests.data.gcp.policy_bindings import MOCK_GSUITE_GROUP_MEMBERS
-from tests.data.gcp.policy_bindings import MOCK_GSUITE_GROUPS
-from tests.data.gcp.policy_bindings import MOCK_GSUITE_USERS
-from tests.data.gcp.policy_bindings import MOCK_IAM_ROLES
-from tests.data.gcp.policy_bindings import MOCK_IAM_SERVICE_ACCOUNTS
-from tests.data.gcp.policy_bindings import MOCK_POLICY_BINDINGS_RESPONSE
+from tests.integration.cartography.intel.gcp.helpers import (
+    COMMON_JOB_PARAMS as GCP_COMMON_JOB_PARAMS,
+)
+from tests.integration.cartography.intel.gcp.helpers import GCPSyncParams
+from tests.integration.cartography.intel.gcp.helpers import TEST_PROJECT_ID
+from tests.integration.cartography.intel.gcp.helpers import TEST_UPDATE_TAG
 from tests.integration.util import check_nodes
 from tests.integration.util import check_rels
 
-TEST_PROJECT_ID = "project-abc"
-TEST_UPDATE_TAG = 123456789
 COMMON_JOB_PARAMS = {
-    "UPDATE_TAG": TEST_UPDATE_TAG,
-    "ORG_RESOURCE_NAME": "organizations/1337",
-    "PROJECT_ID": TEST_PROJECT_ID,
+    **GCP_COMMON_JOB_PARAMS,
     "gcp_permission_relationships_file": "dummy_path",  # Will be mocked!
 }
 GSUITE_COMMON_PARAMS = {
@@ -34,162 +26,62 @@ GSUITE_COMMON_PARAMS = {
 }
 
 
-def _create_test_project(neo4j_session):
-    """Create a test GCP project node."""
-    neo4j_session.run(
-        """
-        MERGE (project:GCPProject{id: $project_id})
-        ON CREATE SET project.firstseen = timestamp()
-        SET project.lastupdated = $update_tag
-        """,
+@pytest.fixture(scope="module")
+def gcp_sync_params():
+    return GCPSyncParams(
         project_id=TEST_PROJECT_ID,
+        org_id=COMMON_JOB_PARAMS["ORG_RESOURCE_NAME"],
         update_tag=TEST_UPDATE_TAG,
+        common_job_params=COMMON_JOB_PARAMS,
+        gsuite_params=GSUITE_COMMON_PARAMS,
     )
 
 
-def _create_test_organization(neo4j_session):
-    """Create a test GCP organization node for org-level roles."""
-    neo4j_session.run(
-        """
-        MERGE (org:GCPOrganization{id: $org_id})
-        ON CREATE SET org.firstseen = timestamp()
-        SET org.lastupdated = $update_tag
-        """,
-        org_id=COMMON_JOB_PARAMS["ORG_RESOURCE_NAME"],
-        update_tag=TEST_UPDATE_TAG,
+@pytest.fixture(scope="module")
+def gcp_resource_patch_spec():
+    """
+    Static return values for the storage, compute and permission relationship file calls.
+    """
+    return (
+        (
+            cartography.intel.gcp.permission_relationships,
+            "parse_permission_relationships_file",
+            MOCK_PERMISSION_RELATIONSHIPS_YAML,
+        ),
+        (
+            cartography.intel.gcp.compute,
+            "get_gcp_instance_responses",
+            [MOCK_COMPUTE_INSTANCES],
+        ),
+        (
+            cartography.intel.gcp.compute,
+            "get_zones_in_project",
+            [{"name": "us-east1-b"}],
+        ),
+        (cartography.intel.gcp.storage, "get_gcp_buckets", MOCK_STORAGE_BUCKETS),
     )
 
 
-@patch.object(
-    cartography.intel.gcp.permission_relationships,
-    "parse_permission_relationships_file",
-    return_value=MOCK_PERMISSION_RELATIONSHIPS_YAML,
-)
-@patch.object(
-    cartography.intel.gcp.compute,
-    "get_gcp_instance_responses",
-    return_value=[MOCK_COMPUTE_INSTANCES],
-)
-@patch.object(
-    cartography.intel.gcp.compute,
-    "get_zones_in_project",
-    return_value=[{"name": "us-east1-b"}],
-)
-@patch.object(
-    cartography.intel.gcp.storage,
-    "get_gcp_buckets",
-    return_value=MOCK_STORAGE_BUCKETS,
-)
-@patch.object(
-    cartography.intel.gcp.policy_bindings,
-    "get_policy_bindings",
-    return_value=MOCK_POLICY_BINDINGS_RESPONSE,
-)
-@patch.object(
-    cartography.intel.gsuite.groups,
-    "get_members_for_groups",
-    return_value=MOCK_GSUITE_GROUP_MEMBERS,
-)
-@patch.object(
-    cartography.intel.gsuite.groups,
-    "get_all_groups",
-    return_value=MOCK_GSUITE_GROUPS,
-)
-@patch.object(
-    cartography.intel.gsuite.users,
-    "get_all_users",
-    return_value=MOCK_GSUITE_USERS,
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=MOCK_IAM_ROLES,
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=[],
+@pytest.mark.usefixtures(
+    "gcp_iam_gsuite_synced",
+    "gcp_resource_patches",
 )
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=MOCK_IAM_SERVICE_ACCOUNTS,
-)
-def test_sync_gcp_permission_relationships(
-    mock_get_service_accounts,
-    mock_get_project_custom_roles,
-    mock_get_org_roles,
-    mock_get_predefined_roles,
-    mock_get_all_users,
-    mock_get_all_groups,
-    mock_get_group_members,
-    mock_get_policy_bindings,
-    mock_get_buckets,
-    mock_get_zones,
-    mock_get_instance_responses,
-    mock_parse_yaml,
-    neo4j_session,
-):
+def test_sync_gcp_permission_relationships(neo4j_session, mock_clients):
     """
     Test that GCP permission relationships sync creates the expected nodes and relationships.
     """
     # ARRANGE
-    _create_test_project(neo4j_session)
-    _create_test_organization(neo4j_session)
-    mock_iam_client = MagicMock()
-    mock_admin_resource = MagicMock()
-    mock_storage_client = MagicMock()
-    mock_compute_client = MagicMock()
-    mock_asset_client = MagicMock()
-
-    # Sync org-level IAM (predefined roles) first
-    cartography.intel.gcp.iam.sync_org_iam(
-        neo4j_session,
-        mock_iam_client,
-        COMMON_JOB_PARAMS["ORG_RESOURCE_NAME"],
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    # Sync project-level IAM (service accounts and project custom roles)
-    cartography.intel.gcp.iam.sync(
-        neo4j_session,
-        mock_iam_client,
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    cartography.intel.gsuite.users.sync_gsuite_users(
-        neo4j_session,
-        mock_admin_resource,
-        TEST_UPDATE_TAG,
-        GSUITE_COMMON_PARAMS,
-    )
-
-    cartography.intel.gsuite.groups.sync_gsuite_groups(
-        neo4j_session,
-        mock_admin_resource,
-        TEST_UPDATE_TAG,
-        GSUITE_COMMON_PARAMS,
-    )
-
     cartography.intel.gcp.policy_bindings.sync(
         neo4j_session,
         TEST_PROJECT_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
-        mock_asset_client,
+        mock_clients.asset,
     )
 
     cartography.intel.gcp.storage.sync_gcp_buckets(
         neo4j_session,
-        mock_storage_client,
+        mock_clients.storage,
         TEST_PROJECT_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
@@ -197,7 +89,7 @@ def test_sync_gcp_permission_relationships(
 
     cartography.intel.gcp.compute.sync_gcp_instances(
         neo4j_session,
-        mock_compute_client,
+        mock_clients.compute,
         TEST_PROJECT_ID,
         [{"name": "us-east1-b"}],
         TEST_UPDATE_TAG,
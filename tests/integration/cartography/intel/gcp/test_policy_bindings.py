@@ -1,162 +1,68 @@
-from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
 from google.api_core.exceptions import PermissionDenied
 
-import cartography.intel.gcp.iam
 import cartography.intel.gcp.policy_bindings
-import cartography.intel.gsuite.groups
-import cartography.intel.gsuite.users
-import tests.data.gcp.policy_bindings
-from tests.integration.util import check_nodes
-from tests.integration.util import check_rels
+from tests.integration.cartography.intel.gcp.helpers import COMMON_JOB_PARAMS
+from tests.integration.cartography.intel.gcp.helpers import GCPSyncParams
+from tests.integration.cartography.intel.gcp.helpers import TEST_PROJECT_ID
+from tests.integration.cartography.intel.gcp.helpers import TEST_UPDATE_TAG
+from tests.integration.util import graph_snapshot
 
-TEST_PROJECT_ID = "project-abc"
-TEST_UPDATE_TAG = 123456789
-COMMON_JOB_PARAMS = {
-    "UPDATE_TAG": TEST_UPDATE_TAG,
-    "ORG_RESOURCE_NAME": "organizations/1337",
-    "PROJECT_ID": TEST_PROJECT_ID,
-}
 GSUITE_COMMON_PARAMS = {
     **COMMON_JOB_PARAMS,
     "CUSTOMER_ID": "customer-123",
 }
 
-
-def _create_test_project(neo4j_session):
-    """Create a test GCP project node."""
-    neo4j_session.run(
-        """
-        MERGE (project:GCPProject{id: $project_id})
-        ON CREATE SET project.firstseen = timestamp()
-        SET project.lastupdated = $update_tag
-        """,
-        project_id=TEST_PROJECT_ID,
-        update_tag=TEST_UPDATE_TAG,
-    )
+_PROJECT_BINDING_REL = ("GCPProject", "id", "GCPPolicyBinding", "id", "RESOURCE")
+_PRINCIPAL_BINDING_REL = (
+    "GCPPrincipal",
+    "email",
+    "GCPPolicyBinding",
+    "id",
+    "HAS_ALLOW_POLICY",
+)
+_BINDING_ROLE_REL = ("GCPPolicyBinding", "id", "GCPRole", "name", "GRANTS_ROLE")
+_POLICY_BINDINGS_SPEC = {
+    "nodes": {"GCPPolicyBinding": ["id", "role", "resource_type"]},
+    "rels": [_PROJECT_BINDING_REL, _PRINCIPAL_BINDING_REL, _BINDING_ROLE_REL],
+}
 
 
-def _create_test_organization(neo4j_session):
-    """Create a test GCP organization node for org-level roles."""
-    neo4j_session.run(
-        """
-        MERGE (org:GCPOrganization{id: $org_id})
-        ON CREATE SET org.firstseen = timestamp()
-        SET org.lastupdated = $update_tag
-        """,
+@pytest.fixture(scope="module")
+def gcp_sync_params():
+    return GCPSyncParams(
+        project_id=TEST_PROJECT_ID,
         org_id=COMMON_JOB_PARAMS["ORG_RESOURCE_NAME"],
         update_tag=TEST_UPDATE_TAG,
+        common_job_params=COMMON_JOB_PARAMS,
+        gsuite_params=GSUITE_COMMON_PARAMS,
     )
 
 
-@patch.object(
-    cartography.intel.gcp.policy_bindings,
-    "get_policy_bindings",
-    return_value=tests.data.gcp.policy_bindings.MOCK_POLICY_BINDINGS_RESPONSE,
-)
-@patch.object(
-    cartography.intel.gsuite.groups,
-    "get_members_for_groups",
-    return_value=tests.data.gcp.policy_bindings.MOCK_GSUITE_GROUP_MEMBERS,
-)
-@patch.object(
-    cartography.intel.gsuite.groups,
-    "get_all_groups",
-    return_value=tests.data.gcp.policy_bindings.MOCK_GSUITE_GROUPS,
-)
-@patch.object(
-    cartography.intel.gsuite.users,
-    "get_all_users",
-    return_value=tests.data.gcp.policy_bindings.MOCK_GSUITE_USERS,
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_predefined_roles",
-    return_value=tests.data.gcp.policy_bindings.MOCK_IAM_ROLES,
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_org_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_project_custom_roles",
-    return_value=[],
-)
-@patch.object(
-    cartography.intel.gcp.iam,
-    "get_gcp_service_accounts",
-    return_value=tests.data.gcp.policy_bindings.MOCK_IAM_SERVICE_ACCOUNTS,
-)
+@pytest.mark.usefixtures("gcp_iam_gsuite_synced")
 def test_sync_gcp_policy_bindings(
-    mock_get_service_accounts,
-    mock_get_project_custom_roles,
-    mock_get_org_roles,
-    mock_get_predefined_roles,
-    mock_get_all_users,
-    mock_get_all_groups,
-    mock_get_group_members,
-    mock_get_policy_bindings,
     neo4j_session,
+    mock_clients,
 ):
     """
     Test that GCP policy bindings sync creates the expected nodes and relationships.
     """
-    # ARRANGE
-    _create_test_project(neo4j_session)
-    _create_test_organization(neo4j_session)
-    mock_iam_client = MagicMock()
-    mock_admin_resource = MagicMock()
-    mock_asset_client = MagicMock()
-
-    # Sync org-level IAM (predefined roles) first
-    cartography.intel.gcp.iam.sync_org_iam(
-        neo4j_session,
-        mock_iam_client,
-        COMMON_JOB_PARAMS["ORG_RESOURCE_NAME"],
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    # Sync project-level IAM (service accounts and project custom roles)
-    cartography.intel.gcp.iam.sync(
-        neo4j_session,
-        mock_iam_client,
-        TEST_PROJECT_ID,
-        TEST_UPDATE_TAG,
-        COMMON_JOB_PARAMS,
-    )
-
-    cartography.intel.gsuite.users.sync_gsuite_users(
-        neo4j_session,
-        mock_admin_resource,
-        TEST_UPDATE_TAG,
-        GSUITE_COMMON_PARAMS,
-    )
-
-    cartography.intel.gsuite.groups.sync_gsuite_groups(
-        neo4j_session,
-        mock_admin_resource,
-        TEST_UPDATE_TAG,
-        GSUITE_COMMON_PARAMS,
-    )
-
     # ACT
     cartography.intel.gcp.policy_bindings.sync(
         neo4j_session,
         TEST_PROJECT_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
-        mock_asset_client,
+        mock_clients.asset,
     )
 
     # ASSERT
+    snapshot = graph_snapshot(neo4j_session, _POLICY_BINDINGS_SPEC)
+
     # Check GCP policy binding nodes
-    assert check_nodes(
-        neo4j_session, "GCPPolicyBinding", ["id", "role", "resource_type"]
-    ) == {
+    assert snapshot["nodes"]["GCPPolicyBinding"] == {
         (
             "//cloudresourcemanager.googleapis.com/projects/project-abc_roles/editor",
             "roles/editor",
@@ -180,15 +86,7 @@ def test_sync_gcp_policy_bindings(
     }
 
     # Check GCPProject to GCPPolicyBinding relationships
-    assert check_rels(
-        neo4j_session,
-        "GCPProject",
-        "id",
-        "GCPPolicyBinding",
-        "id",
-        "RESOURCE",
-        rel_direction_right=True,
-    ) == {
+    assert snapshot["rels"][_PROJECT_BINDING_REL] == {
         (
             TEST_PROJECT_ID,
             "//cloudresourcemanager.googleapis.com/projects/project-abc_roles/editor",
@@ -208,15 +106,7 @@ def test_sync_gcp_policy_bindings(
     }
 
     # Check GCPPrincipal to GCPPolicyBinding relationships
-    assert check_rels(
-        neo4j_session,
-        "GCPPrincipal",
-        "email",
-        "GCPPolicyBinding",
-        "id",
-        "HAS_ALLOW_POLICY",
-        rel_direction_right=True,
-    ) == {
+    assert snapshot["rels"][_PRINCIPAL_BINDING_REL] == {
         # GSuite users
         (
             "alice@example.com",
@@ -243,15 +133,7 @@ def test_sync_gcp_policy_bindings(
     }
 
     # Check GCPPolicyBinding to GCPRole relationships
-    assert check_rels(
-        neo4j_session,
-        "GCPPolicyBinding",
-        "id",
-        "GCPRole",
-        "name",
-        "GRANTS_ROLE",
-        rel_direction_right=True,
-    ) == {
+    assert snapshot["rels"][_BINDING_ROLE_REL] == {
         (
             "//cloudresourcemanager.googleapis.com/projects/project-abc_roles/editor",
             "roles/editor",
@@ -271,6 +153,7 @@ def test_sync_gcp_policy_bindings(
     }
 
 
+@pytest.mark.usefixtures("gcp_project_and_org")
 @patch.object(
     cartography.intel.gcp.policy_bindings,
     "get_policy_bindings",
@@ -281,23 +164,20 @@ def test_sync_gcp_policy_bindings(
 def test_sync_gcp_policy_bindings_permission_denied(
     mock_get_policy_bindings,
     neo4j_session,
+    mock_clients,
 ):
     """
     Test that policy bindings sync handles PermissionDenied gracefully.
     When the user lacks org-level cloudasset.viewer role, sync should return False
     and not raise an exception.
     """
-    # ARRANGE
-    _create_test_project(neo4j_session)
-    mock_asset_client = MagicMock()
-
     # ACT
     result = cartography.intel.gcp.policy_bindings.sync(
         neo4j_session,
         TEST_PROJECT_ID,
         TEST_UPDATE_TAG,
         COMMON_JOB_PARAMS,
-        mock_asset_client,
+        mock_clients.asset,
     )
 
     # ASSERT - sync should return False and not raise an exception
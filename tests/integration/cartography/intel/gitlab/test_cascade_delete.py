@@ -9,287 +9,174 @@ without cascade_delete, the project's resources (branches, dependency files, etc
 would remain as orphans since resource cleanup is scoped to project_url.
 """
 
+from dataclasses import dataclass
+
+import pytest
+
 from cartography.graph.job import GraphJob
+from cartography.models.gitlab.branches import GitLabBranchSchema
+from cartography.models.gitlab.manifests import GitLabDependencyFileSchema
+from cartography.models.gitlab.organizations import GitLabOrganizationSchema
 from cartography.models.gitlab.projects import GitLabProjectSchema
-from tests.integration.util import check_nodes
+from tests.integration.util import delete_nodes_by_label
+from tests.integration.util import ensure_schema_indexes
+from tests.integration.util import graph_snapshot
 
 TEST_UPDATE_TAG = 123456789
 TEST_UPDATE_TAG_V2 = 123456790
 TEST_ORG_URL = "https://gitlab.example.com/myorg"
 TEST_PROJECT_URL = "https://gitlab.example.com/myorg/test-project"
 
+_BRANCH_MAIN_ID = f"{TEST_PROJECT_URL}/tree/main"
+_BRANCH_DEVELOP_ID = f"{TEST_PROJECT_URL}/tree/develop"
+_DEPFILE_REQ_ID = f"{TEST_PROJECT_URL}/requirements.txt"
+
+_GITLAB_LABELS = ["GitLabProject", "GitLabBranch", "GitLabDependencyFile"]
+
+_ARRANGE_GITLAB_GRAPH_CYPHER = """
+MERGE (o:GitLabOrganization {id: $spec.org.id})
+SET o += $spec.org
+MERGE (p:GitLabProject {id: $spec.project.id})
+SET p += $spec.project
+MERGE (o)-[:RESOURCE]->(p)
+FOREACH (branch IN coalesce($spec.branches, []) |
+    MERGE (b:GitLabBranch {id: branch.id})
+    SET b += branch
+    MERGE (p)-[:RESOURCE]->(b)
+)
+FOREACH (dep_file IN coalesce($spec.dep_files, []) |
+    MERGE (df:GitLabDependencyFile {id: dep_file.id})
+    SET df += dep_file
+    MERGE (p)-[:RESOURCE]->(df)
+)
+"""
 
-class TestProjectCascadeDelete:
-    """
-    Test that cascade_delete on GitLabProject cleanup removes orphaned child resources.
-    """
-
-    def test_project_cascade_deletes_child_branches(self, neo4j_session):
-        """
-        When a stale GitLabProject is deleted with cascade_delete=True,
-        its child branches should also be deleted.
-        """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create organization
-        neo4j_session.run(
-            """
-            MERGE (o:GitLabOrganization {id: $org_url})
-            SET o.lastupdated = $tag
-            """,
-            org_url=TEST_ORG_URL,
-            tag=TEST_UPDATE_TAG_V2,  # Current tag - org is fresh
-        )
 
-        # Create stale project (old update tag)
-        neo4j_session.run(
-            """
-            MERGE (p:GitLabProject {id: $project_url})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GitLabOrganization {id: $org_url})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_url=TEST_PROJECT_URL,
-            org_url=TEST_ORG_URL,
-            old_tag=TEST_UPDATE_TAG,  # Old tag - project is stale
-        )
+@pytest.fixture(scope="module", autouse=True)
+def _gitlab_indexes(neo4j_session):
+    """_arrange_gitlab_graph() MERGEs GitLab nodes by id, so create their indexes once for the module."""
+    ensure_schema_indexes(
+        neo4j_session,
+        GitLabOrganizationSchema(),
+        GitLabProjectSchema(),
+        GitLabBranchSchema(),
+        GitLabDependencyFileSchema(),
+    )
 
-        # Create child branches under the project (also stale)
-        # These simulate branches that weren't synced because the project was deleted
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (b:GitLabBranch {id: $branch_id})
-            SET b.lastupdated = $old_tag, b.name = 'main'
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_url=TEST_PROJECT_URL,
-            branch_id=f"{TEST_PROJECT_URL}/tree/main",
-            old_tag=TEST_UPDATE_TAG,
-        )
 
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (b:GitLabBranch {id: $branch_id})
-            SET b.lastupdated = $old_tag, b.name = 'develop'
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_url=TEST_PROJECT_URL,
-            branch_id=f"{TEST_PROJECT_URL}/tree/develop",
-            old_tag=TEST_UPDATE_TAG,
-        )
-
-        # Verify initial state
-        assert len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GitLabBranch", ["id"])) == 2
-
-        # Run cleanup with cascade_delete=True
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "org_url": TEST_ORG_URL,
-        }
-        GraphJob.from_node_schema(
-            GitLabProjectSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
-
-        # Verify: project and its children are deleted
-        assert (
-            len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 0
-        ), "Stale project should be deleted"
-        assert (
-            len(check_nodes(neo4j_session, "GitLabBranch", ["id"])) == 0
-        ), "Child branches should be cascade deleted"
+@pytest.fixture(autouse=True)
+def _delete_gitlab_nodes(neo4j_session):
+    """
+    Remove the GitLab nodes each test creates. Only these labels are touched, so the delete does not scan the rest of
+    the graph.
+    """
+    yield
+    delete_nodes_by_label(neo4j_session, ["GitLabOrganization", *_GITLAB_LABELS])
 
-    def test_project_cascade_preserves_fresh_branches(self, neo4j_session):
-        """
-        When cascade_delete runs, branches with current update_tag should be preserved.
-        This handles the case where a branch was re-parented in the current sync.
-        """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
 
-        # Create organization
-        neo4j_session.run(
-            """
-            MERGE (o:GitLabOrganization {id: $org_url})
-            SET o.lastupdated = $tag
-            """,
-            org_url=TEST_ORG_URL,
-            tag=TEST_UPDATE_TAG_V2,
-        )
+def _arrange_gitlab_graph(neo4j_session, spec):
+    """
+    Create an organization, a project under it, and the project's child branches and dependency files in one query.
+    `spec` maps "org" and "project" to property maps, and "branches" and "dep_files" to lists of property maps; every
+    property map must include an `id`.
+    The whole spec is sent as a single parameter so the arrange step is one round trip however many children it has.
+    """
+    neo4j_session.run(_ARRANGE_GITLAB_GRAPH_CYPHER, spec=spec).consume()
 
-        # Create stale project
-        neo4j_session.run(
-            """
-            MERGE (p:GitLabProject {id: $project_url})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GitLabOrganization {id: $org_url})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_url=TEST_PROJECT_URL,
-            org_url=TEST_ORG_URL,
-            old_tag=TEST_UPDATE_TAG,  # Stale
-        )
 
-        # Create a stale branch (should be deleted)
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (b:GitLabBranch {id: $branch_id})
-            SET b.lastupdated = $old_tag, b.name = 'stale-branch'
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_url=TEST_PROJECT_URL,
-            branch_id="stale-branch-id",
-            old_tag=TEST_UPDATE_TAG,  # Stale
-        )
+def _branch(branch_id, name, update_tag):
+    return {"id": branch_id, "name": name, "lastupdated": update_tag}
 
-        # Create a fresh branch (should be preserved - maybe re-parented)
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (b:GitLabBranch {id: $branch_id})
-            SET b.lastupdated = $current_tag, b.name = 'fresh-branch'
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_url=TEST_PROJECT_URL,
-            branch_id="fresh-branch-id",
-            current_tag=TEST_UPDATE_TAG_V2,  # Current - should be preserved
-        )
 
-        # Verify initial state
-        assert len(check_nodes(neo4j_session, "GitLabBranch", ["id"])) == 2
+@dataclass(frozen=True)
+class CascadeCase:
+    """
+    One cascade_delete scenario: a fresh org with a stale project, the project's child branches and dependency files,
+    whether cleanup runs with cascade_delete, and the child ids expected to survive cleanup.
+    """
 
-        # Run cleanup with cascade_delete
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "org_url": TEST_ORG_URL,
-        }
-        GraphJob.from_node_schema(
-            GitLabProjectSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
+    id: str
+    branches: tuple = ()
+    dep_files: tuple = ()
+    cascade_delete: bool = True
+    expected_branches: frozenset = frozenset()
+    expected_dep_files: frozenset = frozenset()
+
+
+CASCADE_CASES = [
+    # When a stale GitLabProject is deleted with cascade_delete=True, its child branches should also be deleted.
+    # The branches simulate branches that weren't synced because the project was deleted.
+    CascadeCase(
+        id="deletes_child_branches",
+        branches=(
+            _branch(_BRANCH_MAIN_ID, "main", TEST_UPDATE_TAG),
+            _branch(_BRANCH_DEVELOP_ID, "develop", TEST_UPDATE_TAG),
+        ),
+    ),
+    # Branches with the current update_tag should be preserved. This handles the case where a branch was
+    # re-parented in the current sync.
+    CascadeCase(
+        id="preserves_fresh_branches",
+        branches=(
+            _branch("stale-branch-id", "stale-branch", TEST_UPDATE_TAG),
+            _branch("fresh-branch-id", "fresh-branch", TEST_UPDATE_TAG_V2),
+        ),
+        expected_branches=frozenset({"fresh-branch-id"}),
+    ),
+    # Child dependency files of a stale project should also be cascade deleted.
+    CascadeCase(
+        id="deletes_dependency_files",
+        dep_files=(
+            {
+                "id": _DEPFILE_REQ_ID,
+                "path": "requirements.txt",
+                "lastupdated": TEST_UPDATE_TAG,
+            },
+        ),
+    ),
+    # Without cascade_delete, child resources should remain as orphans. This is the default behavior for backward
+    # compatibility.
+    CascadeCase(
+        id="without_cascade_delete_preserves_children",
+        branches=(_branch(_BRANCH_MAIN_ID, "main", TEST_UPDATE_TAG),),
+        cascade_delete=False,
+        expected_branches=frozenset({_BRANCH_MAIN_ID}),
+    ),
+]
 
-        # Verify: stale branch deleted, fresh branch preserved
-        remaining_branches = check_nodes(neo4j_session, "GitLabBranch", ["id"])
-        branch_ids = {b[0] for b in remaining_branches}
 
-        assert "stale-branch-id" not in branch_ids, "Stale branch should be deleted"
-        assert "fresh-branch-id" in branch_ids, "Fresh branch should be preserved"
+class TestProjectCascadeDelete:
+    """
+    Test that cascade_delete on GitLabProject cleanup removes orphaned child resources.
+    """
 
-    def test_project_cascade_deletes_dependency_files(self, neo4j_session):
+    @pytest.mark.parametrize("case", CASCADE_CASES, ids=lambda case: case.id)
+    def test_project_cascade(self, neo4j_session, case):
         """
-        When a stale GitLabProject is deleted with cascade_delete=True,
-        its child dependency files should also be deleted.
+        A stale GitLabProject is always deleted; its stale children are deleted only with cascade_delete=True.
         """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create organization
-        neo4j_session.run(
-            """
-            MERGE (o:GitLabOrganization {id: $org_url})
-            SET o.lastupdated = $tag
-            """,
-            org_url=TEST_ORG_URL,
-            tag=TEST_UPDATE_TAG_V2,
-        )
-
-        # Create stale project
-        neo4j_session.run(
-            """
-            MERGE (p:GitLabProject {id: $project_url})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GitLabOrganization {id: $org_url})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_url=TEST_PROJECT_URL,
-            org_url=TEST_ORG_URL,
-            old_tag=TEST_UPDATE_TAG,
-        )
-
-        # Create child dependency file
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (df:GitLabDependencyFile {id: $dep_file_id})
-            SET df.lastupdated = $old_tag, df.path = 'requirements.txt'
-            MERGE (p)-[:RESOURCE]->(df)
-            """,
-            project_url=TEST_PROJECT_URL,
-            dep_file_id=f"{TEST_PROJECT_URL}/requirements.txt",
-            old_tag=TEST_UPDATE_TAG,
+        _arrange_gitlab_graph(
+            neo4j_session,
+            {
+                "org": {"id": TEST_ORG_URL, "lastupdated": TEST_UPDATE_TAG_V2},
+                "project": {"id": TEST_PROJECT_URL, "lastupdated": TEST_UPDATE_TAG},
+                "branches": list(case.branches),
+                "dep_files": list(case.dep_files),
+            },
         )
 
         # Verify initial state
-        assert len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GitLabDependencyFile", ["id"])) == 1
-
-        # Run cleanup with cascade_delete=True
-        common_job_params = {
-            "UPDATE_TAG": TEST_UPDATE_TAG_V2,
-            "org_url": TEST_ORG_URL,
+        initial = graph_snapshot(
+            neo4j_session,
+            {"nodes": {label: ["id"] for label in _GITLAB_LABELS}},
+        )["nodes"]
+        assert {label: len(ids) for label, ids in initial.items()} == {
+            "GitLabProject": 1,
+            "GitLabBranch": len(case.branches),
+            "GitLabDependencyFile": len(case.dep_files),
         }
-        GraphJob.from_node_schema(
-            GitLabProjectSchema(), common_job_params, cascade_delete=True
-        ).run(neo4j_session)
-
-        # Verify: project and dependency file are deleted
-        assert len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 0
-        assert (
-            len(check_nodes(neo4j_session, "GitLabDependencyFile", ["id"])) == 0
-        ), "Child dependency file should be cascade deleted"
-
-    def test_without_cascade_delete_preserves_children(self, neo4j_session):
-        """
-        Without cascade_delete, child resources should remain as orphans.
-        This is the default behavior for backward compatibility.
-        """
-        neo4j_session.run("MATCH (n) DETACH DELETE n")
-
-        # Create organization
-        neo4j_session.run(
-            """
-            MERGE (o:GitLabOrganization {id: $org_url})
-            SET o.lastupdated = $tag
-            """,
-            org_url=TEST_ORG_URL,
-            tag=TEST_UPDATE_TAG_V2,
-        )
-
-        # Create stale project
-        neo4j_session.run(
-            """
-            MERGE (p:GitLabProject {id: $project_url})
-            SET p.lastupdated = $old_tag
-            WITH p
-            MATCH (o:GitLabOrganization {id: $org_url})
-            MERGE (o)-[:RESOURCE]->(p)
-            """,
-            project_url=TEST_PROJECT_URL,
-            org_url=TEST_ORG_URL,
-            old_tag=TEST_UPDATE_TAG,
-        )
-
-        # Create child branch
-        neo4j_session.run(
-            """
-            MATCH (p:GitLabProject {id: $project_url})
-            MERGE (b:GitLabBranch {id: $branch_id})
-            SET b.lastupdated = $old_tag, b.name = 'main'
-            MERGE (p)-[:RESOURCE]->(b)
-            """,
-            project_url=TEST_PROJECT_URL,
-            branch_id=f"{TEST_PROJECT_URL}/tree/main",
-            old_tag=TEST_UPDATE_TAG,
-        )
 
-        # Verify initial state
-        assert len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 1
-        assert len(check_nodes(neo4j_session, "GitLabBranch", ["id"])) == 1
-
-        # Run cleanup WITHOUT cascade_delete (default behavior)
+        # Run cleanup
         common_job_params = {
             "UPDATE_TAG": TEST_UPDATE_TAG_V2,
             "org_url": TEST_ORG_URL,
@@ -297,13 +184,18 @@ class TestProjectCascadeDelete:
         GraphJob.from_node_schema(
             GitLabProjectSchema(),
             common_job_params,
-            # cascade_delete defaults to False
+            cascade_delete=case.cascade_delete,
         ).run(neo4j_session)
 
-        # Verify: project is deleted but branch remains as orphan
-        assert (
-            len(check_nodes(neo4j_session, "GitLabProject", ["id"])) == 0
-        ), "Stale project should be deleted"
-        assert (
-            len(check_nodes(neo4j_session, "GitLabBranch", ["id"])) == 1
-        ), "Without cascade_delete, branch should remain as orphan"
+        # Verify: the stale project is deleted and only the expected children remain
+        remaining = graph_snapshot(
+            neo4j_session,
+            {"nodes": {label: ["id"] for label in _GITLAB_LABELS}},
+        )["nodes"]
+        assert remaining["GitLabProject"] == set(), "Stale project should be deleted"
+        assert remaining["GitLabBranch"] == {
+            (branch_id,) for branch_id in case.expected_branches
+        }
+        assert remaining["GitLabDependencyFile"] == {
+            (dep_file_id,) for dep_file_id in case.expected_dep_files
+        }
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+import pytest
+
 import cartography.intel.jamf.computers
 from cartography.intel.jamf.computers import sync
 from tests.data.jamf.computers import GROUPS
@@ -12,43 +14,46 @@ TEST_JAMF_USER = "test_user"
 TEST_JAMF_PASSWORD = "test_password"
 
 
-@patch.object(
-    cartography.intel.jamf.computers,
-    "get",
-    return_value=GROUPS,
-)
-def test_sync(mock_get, neo4j_session):
+@pytest.fixture(scope="module")
+def jamf_synced_session(neo4j_session):
     """
-    Ensure that the main sync function orchestrates the Jamf sync correctly.
+    Run the Jamf sync once for the module. The tests below only read the resulting graph.
     """
-    # Arrange
     common_job_parameters = {
         "UPDATE_TAG": TEST_UPDATE_TAG,
         "TENANT_ID": TEST_JAMF_URI,
     }
+    with patch.object(cartography.intel.jamf.computers, "get", return_value=GROUPS):
+        sync(
+            neo4j_session,
+            TEST_JAMF_URI,
+            TEST_JAMF_USER,
+            TEST_JAMF_PASSWORD,
+            TEST_UPDATE_TAG,
+            common_job_parameters,
+        )
+    return neo4j_session
 
-    # Act
-    sync(
-        neo4j_session,
-        TEST_JAMF_URI,
-        TEST_JAMF_USER,
-        TEST_JAMF_PASSWORD,
-        TEST_UPDATE_TAG,
-        common_job_parameters,
-    )
 
-    # Assert - JamfTenant node exists
+def test_sync_tenant(jamf_synced_session):
+    """
+    Ensure that the main sync function creates the JamfTenant.
+    """
     assert check_nodes(
-        neo4j_session,
+        jamf_synced_session,
         "JamfTenant",
         ["id"],
     ) == {
         (TEST_JAMF_URI,),
     }
 
-    # Assert - JamfComputerGroup nodes exist with expected properties
+
+def test_sync_computer_groups(jamf_synced_session):
+    """
+    Ensure that the main sync function creates the JamfComputerGroups with the expected properties.
+    """
     assert check_nodes(
-        neo4j_session,
+        jamf_synced_session,
         "JamfComputerGroup",
         ["id", "name", "is_smart"],
     ) == {
@@ -57,9 +62,13 @@ def test_sync(mock_get, neo4j_session):
         (345, "10.14.6", True),
     }
 
-    # Assert - Relationships exist between tenant and computer groups
+
+def test_sync_tenant_to_computer_groups(jamf_synced_session):
+    """
+    Ensure that the main sync function connects the tenant to its computer groups.
+    """
     assert check_rels(
-        neo4j_session,
+        jamf_synced_session,
         "JamfTenant",
         "id",
         "JamfComputerGroup",
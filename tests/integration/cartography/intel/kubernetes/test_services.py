@@ -20,14 +20,45 @@ from tests.data.kubernetes.services import KUBERNETES_MULTI_LB_SERVICE_DATA
 from tests.data.kubernetes.services import KUBERNETES_SERVICES_DATA
 from tests.integration.util import check_nodes
 from tests.integration.util import check_rels
+from tests.integration.util import delete_nodes_by_label
+from tests.integration.util import graph_snapshot
 
 TEST_UPDATE_TAG = 123456789
 TEST_ACCOUNT_ID = "000000000000"
 TEST_REGION = "us-east-1"
 
-
-@pytest.fixture
+_SERVICE_LB_REL = (
+    "KubernetesService",
+    "name",
+    "AWSLoadBalancerV2",
+    "dnsname",
+    "USES_LOAD_BALANCER",
+)
+
+_NAMESPACE_SERVICE_CONTAINS_QUERY = """
+MATCH (ns:KubernetesNamespace)-[:CONTAINS]->(svc:KubernetesService)
+RETURN ns.name, ns.cluster_name, svc.name
+"""
+
+_SEEDED_LB_DNS_NAMES = [lb["DNSName"] for lb in LOAD_BALANCER_DATA if "DNSName" in lb]
+_DELETE_UNSEEDED_LBS_CYPHER = """
+MATCH (lb:AWSLoadBalancerV2)
+WHERE NOT lb.dnsname IN $seeded_dns_names
+DETACH DELETE lb
+"""
+
+_MERGE_AWS_ACCOUNT_CYPHER = """
+MERGE (aws:AWSAccount{id: $aws_account_id})
+ON CREATE SET aws.firstseen = timestamp()
+SET aws.lastupdated = $update_tag
+"""
+
+
+@pytest.fixture(scope="module")
 def _create_test_cluster(neo4j_session):
+    """
+    Load the clusters, namespaces and pods once for the module. None of the tests modify them.
+    """
     load_kubernetes_cluster(
         neo4j_session,
         KUBERNETES_CLUSTER_DATA,
@@ -54,8 +85,44 @@ def _create_test_cluster(neo4j_session):
         cluster_id=KUBERNETES_CLUSTER_IDS[0],
         cluster_name=KUBERNETES_CLUSTER_NAMES[0],
     )
+    yield
+
 
+@pytest.fixture(autouse=True)
+def _delete_services_and_load_balancers(neo4j_session):
+    """
+    Remove the services and load balancers each test creates, leaving the module's cluster and the load balancers
+    loaded by _aws_lb_seeded in place.
+    """
     yield
+    delete_nodes_by_label(neo4j_session, ["KubernetesService"])
+    neo4j_session.run(
+        _DELETE_UNSEEDED_LBS_CYPHER,
+        seeded_dns_names=_SEEDED_LB_DNS_NAMES,
+    ).consume()
+
+
+@pytest.fixture(scope="class")
+def _aws_lb_seeded(neo4j_session):
+    """
+    Create the AWSAccount and load LOAD_BALANCER_DATA under it with the real AWSLoadBalancerV2 loader, so that the
+    tests stay in sync with the AWS LB schema. Loaded once for the tests that want a matching load balancer, and
+    removed afterwards so that the other tests do not see it.
+    """
+    neo4j_session.run(
+        _MERGE_AWS_ACCOUNT_CYPHER,
+        aws_account_id=TEST_ACCOUNT_ID,
+        update_tag=TEST_UPDATE_TAG,
+    ).consume()
+    cartography.intel.aws.ec2.load_balancer_v2s.load_load_balancer_v2s(
+        neo4j_session,
+        LOAD_BALANCER_DATA,
+        TEST_REGION,
+        TEST_ACCOUNT_ID,
+        TEST_UPDATE_TAG,
+    )
+    yield
+    delete_nodes_by_label(neo4j_session, ["AWSLoadBalancerV2"])
 
 
 def test_load_services(neo4j_session, _create_test_cluster):
@@ -83,37 +150,23 @@ def test_load_services_relationships(neo4j_session, _create_test_cluster):
         cluster_name=KUBERNETES_CLUSTER_NAMES[0],
     )
 
+    # Both projections come from the same Namespace-CONTAINS->Service match, so fetch them together
+    rows = [
+        tuple(record.values())
+        for record in neo4j_session.run(_NAMESPACE_SERVICE_CONTAINS_QUERY)
+    ]
+
     # Assert: Expect services to be in the correct namespace
     expected_rels = {
         (KUBERNETES_CLUSTER_1_NAMESPACES_DATA[-1]["name"], "my-service"),
     }
-    assert (
-        check_rels(
-            neo4j_session,
-            "KubernetesNamespace",
-            "name",
-            "KubernetesService",
-            "name",
-            "CONTAINS",
-        )
-        == expected_rels
-    )
+    assert {(ns_name, svc_name) for ns_name, _, svc_name in rows} == expected_rels
 
     # Assert: Expect services to be in the correct cluster
     expected_rels = {
         (KUBERNETES_CLUSTER_NAMES[0], "my-service"),
     }
-    assert (
-        check_rels(
-            neo4j_session,
-            "KubernetesNamespace",
-            "cluster_name",
-            "KubernetesService",
-            "name",
-            "CONTAINS",
-        )
-        == expected_rels
-    )
+    assert {(cluster, svc_name) for _, cluster, svc_name in rows} == expected_rels
 
 
 def test_service_cleanup(neo4j_session, _create_test_cluster):
@@ -137,68 +190,6 @@ def test_service_cleanup(neo4j_session, _create_test_cluster):
     assert check_nodes(neo4j_session, "KubernetesService", ["name"]) == set()
 
 
-def test_load_services_with_aws_loadbalancer_relationship(
-    neo4j_session, _create_test_cluster
-):
-    """
-    Test that KubernetesService of type LoadBalancer creates USES_LOAD_BALANCER
-    relationship to AWS AWSLoadBalancerV2 when the DNS names match.
-
-    Uses the actual AWS AWSLoadBalancerV2 test data and sync function to ensure
-    this test stays in sync if the AWS LB schema changes.
-    """
-    # Arrange: Create prerequisite AWS resources and load the AWSLoadBalancerV2
-    neo4j_session.run(
-        """
-        MERGE (aws:AWSAccount{id: $aws_account_id})
-        ON CREATE SET aws.firstseen = timestamp()
-        SET aws.lastupdated = $update_tag
-        """,
-        aws_account_id=TEST_ACCOUNT_ID,
-        update_tag=TEST_UPDATE_TAG,
-    )
-
-    # Load AWS AWSLoadBalancerV2 using the actual sync function and test data
-    cartography.intel.aws.ec2.load_balancer_v2s.load_load_balancer_v2s(
-        neo4j_session,
-        LOAD_BALANCER_DATA,
-        TEST_REGION,
-        TEST_ACCOUNT_ID,
-        TEST_UPDATE_TAG,
-    )
-
-    # Act: Load the LoadBalancer type Kubernetes service
-    load_services(
-        neo4j_session,
-        KUBERNETES_LOADBALANCER_SERVICE_DATA,
-        update_tag=TEST_UPDATE_TAG,
-        cluster_id=KUBERNETES_CLUSTER_IDS[0],
-        cluster_name=KUBERNETES_CLUSTER_NAMES[0],
-    )
-
-    # Assert: Expect that the service was loaded
-    expected_nodes = {("my-lb-service",)}
-    assert check_nodes(neo4j_session, "KubernetesService", ["name"]) == expected_nodes
-
-    # Assert: Expect USES_LOAD_BALANCER relationship exists
-    # AWS_TEST_LB_DNS_NAME is derived from LOAD_BALANCER_DATA to keep tests in sync
-    expected_rels = {
-        ("my-lb-service", AWS_TEST_LB_DNS_NAME),
-    }
-    assert (
-        check_rels(
-            neo4j_session,
-            "KubernetesService",
-            "name",
-            "AWSLoadBalancerV2",
-            "dnsname",
-            "USES_LOAD_BALANCER",
-            rel_direction_right=True,
-        )
-        == expected_rels
-    )
-
-
 def test_load_services_no_loadbalancer_relationship_when_no_match(
     neo4j_session, _create_test_cluster
 ):
@@ -206,9 +197,6 @@ def test_load_services_no_loadbalancer_relationship_when_no_match(
     Test that KubernetesService of type LoadBalancer does NOT create USES_LOAD_BALANCER
     relationship when there is no matching AWS AWSLoadBalancerV2.
     """
-    # Clean up any AWSLoadBalancerV2 nodes from previous tests
-    neo4j_session.run("MATCH (lb:AWSLoadBalancerV2) DETACH DELETE lb")
-
     # Arrange: Create an AWS AWSLoadBalancerV2 node with NON-matching DNS name
     neo4j_session.run(
         """
@@ -248,135 +236,127 @@ def test_load_services_no_loadbalancer_relationship_when_no_match(
     )
 
 
-def test_load_services_multiple_dns_names_creates_multiple_relationships(
-    neo4j_session, _create_test_cluster
-):
+@pytest.mark.usefixtures("_create_test_cluster", "_aws_lb_seeded")
+class TestServicesWithAwsLoadBalancer:
     """
-    Test one-to-many: a single KubernetesService with multiple DNS names
-    creates USES_LOAD_BALANCER relationships to multiple AWSLoadBalancerV2 nodes.
-
-    Real-world scenario: AWS frontend NLB feature where a service gets both
-    NLB and ALB DNS entries in status.loadBalancer.ingress[].
+    LoadBalancer-related tests that run against the AWSLoadBalancerV2 nodes loaded once by _aws_lb_seeded.
     """
-    # Clean up from previous tests
-    neo4j_session.run("MATCH (s:KubernetesService) DETACH DELETE s")
-    neo4j_session.run("MATCH (lb:AWSLoadBalancerV2) DETACH DELETE lb")
 
-    # Arrange: Create two AWSLoadBalancerV2 nodes with different DNS names
-    neo4j_session.run(
+    def test_load_services_with_aws_loadbalancer_relationship(self, neo4j_session):
         """
-        MERGE (aws:AWSAccount{id: $aws_account_id})
-        ON CREATE SET aws.firstseen = timestamp()
-        SET aws.lastupdated = $update_tag
-        """,
-        aws_account_id=TEST_ACCOUNT_ID,
-        update_tag=TEST_UPDATE_TAG,
-    )
-
-    # Load first LB using actual sync function
-    cartography.intel.aws.ec2.load_balancer_v2s.load_load_balancer_v2s(
-        neo4j_session,
-        LOAD_BALANCER_DATA,
-        TEST_REGION,
-        TEST_ACCOUNT_ID,
-        TEST_UPDATE_TAG,
-    )
+        Test that KubernetesService of type LoadBalancer creates USES_LOAD_BALANCER
+        relationship to AWS AWSLoadBalancerV2 when the DNS names match.
 
-    # Create second LB manually (simulating a second NLB/ALB)
-    neo4j_session.run(
+        Uses the actual AWS AWSLoadBalancerV2 test data and sync function to ensure
+        this test stays in sync if the AWS LB schema changes.
         """
-        MERGE (lb:AWSLoadBalancerV2{id: $dns_name, dnsname: $dns_name})
-        ON CREATE SET lb.firstseen = timestamp()
-        SET lb.lastupdated = $update_tag, lb.name = 'second-lb'
-        """,
-        dns_name=AWS_TEST_LB_DNS_NAME_2,
-        update_tag=TEST_UPDATE_TAG,
-    )
-
-    # Act: Load service with multiple DNS names
-    load_services(
-        neo4j_session,
-        KUBERNETES_MULTI_LB_SERVICE_DATA,
-        update_tag=TEST_UPDATE_TAG,
-        cluster_id=KUBERNETES_CLUSTER_IDS[0],
-        cluster_name=KUBERNETES_CLUSTER_NAMES[0],
-    )
+        # Act: Load the LoadBalancer type Kubernetes service
+        load_services(
+            neo4j_session,
+            KUBERNETES_LOADBALANCER_SERVICE_DATA,
+            update_tag=TEST_UPDATE_TAG,
+            cluster_id=KUBERNETES_CLUSTER_IDS[0],
+            cluster_name=KUBERNETES_CLUSTER_NAMES[0],
+        )
 
-    # Assert: Both relationships should exist
-    expected_rels = {
-        ("multi-lb-service", AWS_TEST_LB_DNS_NAME),
-        ("multi-lb-service", AWS_TEST_LB_DNS_NAME_2),
-    }
-    assert (
-        check_rels(
+        snapshot = graph_snapshot(
             neo4j_session,
-            "KubernetesService",
-            "name",
-            "AWSLoadBalancerV2",
-            "dnsname",
-            "USES_LOAD_BALANCER",
-            rel_direction_right=True,
+            {"nodes": {"KubernetesService": ["name"]}, "rels": [_SERVICE_LB_REL]},
         )
-        == expected_rels
-    )
 
+        # Assert: Expect that the service was loaded
+        expected_nodes = {("my-lb-service",)}
+        assert snapshot["nodes"]["KubernetesService"] == expected_nodes
 
-def test_clusterip_service_does_not_create_loadbalancer_relationship(
-    neo4j_session, _create_test_cluster
-):
-    """
-    Test that ClusterIP services do NOT create USES_LOAD_BALANCER relationships,
-    even when AWSLoadBalancerV2 nodes exist in the graph.
+        # Assert: Expect USES_LOAD_BALANCER relationship exists
+        # AWS_TEST_LB_DNS_NAME is derived from LOAD_BALANCER_DATA to keep tests in sync
+        expected_rels = {
+            ("my-lb-service", AWS_TEST_LB_DNS_NAME),
+        }
+        assert snapshot["rels"][_SERVICE_LB_REL] == expected_rels
 
-    Only services of type LoadBalancer should create this relationship.
-    """
-    # Clean up from previous tests
-    neo4j_session.run("MATCH (s:KubernetesService) DETACH DELETE s")
-    neo4j_session.run("MATCH (lb:AWSLoadBalancerV2) DETACH DELETE lb")
+    def test_load_services_multiple_dns_names_creates_multiple_relationships(
+        self, neo4j_session
+    ):
+        """
+        Test one-to-many: a single KubernetesService with multiple DNS names
+        creates USES_LOAD_BALANCER relationships to multiple AWSLoadBalancerV2 nodes.
 
-    # Arrange: Create a AWSLoadBalancerV2 node
-    neo4j_session.run(
+        Real-world scenario: AWS frontend NLB feature where a service gets both
+        NLB and ALB DNS entries in status.loadBalancer.ingress[].
         """
-        MERGE (aws:AWSAccount{id: $aws_account_id})
-        ON CREATE SET aws.firstseen = timestamp()
-        SET aws.lastupdated = $update_tag
-        """,
-        aws_account_id=TEST_ACCOUNT_ID,
-        update_tag=TEST_UPDATE_TAG,
-    )
+        # Arrange: Create a second AWSLoadBalancerV2 with a different DNS name (simulating a second NLB/ALB) next to
+        # the one loaded by _aws_lb_seeded
+        neo4j_session.run(
+            """
+            MERGE (lb:AWSLoadBalancerV2{id: $dns_name, dnsname: $dns_name})
+            ON CREATE SET lb.firstseen = timestamp()
+            SET lb.lastupdated = $update_tag, lb.name = 'second-lb'
+            """,
+            dns_name=AWS_TEST_LB_DNS_NAME_2,
+            update_tag=TEST_UPDATE_TAG,
+        )
 
-    cartography.intel.aws.ec2.load_balancer_v2s.load_load_balancer_v2s(
-        neo4j_session,
-        LOAD_BALANCER_DATA,
-        TEST_REGION,
-        TEST_ACCOUNT_ID,
-        TEST_UPDATE_TAG,
-    )
+        # Act: Load service with multiple DNS names
+        load_services(
+            neo4j_session,
+            KUBERNETES_MULTI_LB_SERVICE_DATA,
+            update_tag=TEST_UPDATE_TAG,
+            cluster_id=KUBERNETES_CLUSTER_IDS[0],
+            cluster_name=KUBERNETES_CLUSTER_NAMES[0],
+        )
 
-    # Act: Load ClusterIP service (KUBERNETES_SERVICES_DATA has type: ClusterIP)
-    load_services(
-        neo4j_session,
-        KUBERNETES_SERVICES_DATA,
-        update_tag=TEST_UPDATE_TAG,
-        cluster_id=KUBERNETES_CLUSTER_IDS[0],
-        cluster_name=KUBERNETES_CLUSTER_NAMES[0],
-    )
+        # Assert: Both relationships should exist
+        expected_rels = {
+            ("multi-lb-service", AWS_TEST_LB_DNS_NAME),
+            ("multi-lb-service", AWS_TEST_LB_DNS_NAME_2),
+        }
+        assert (
+            check_rels(
+                neo4j_session,
+                "KubernetesService",
+                "name",
+                "AWSLoadBalancerV2",
+                "dnsname",
+                "USES_LOAD_BALANCER",
+                rel_direction_right=True,
+            )
+            == expected_rels
+        )
 
-    # Assert: Service was loaded
-    assert check_nodes(neo4j_session, "KubernetesService", ["name"]) == {
-        ("my-service",)
-    }
+    def test_clusterip_service_does_not_create_loadbalancer_relationship(
+        self, neo4j_session
+    ):
+        """
+        Test that ClusterIP services do NOT create USES_LOAD_BALANCER relationships,
+        even when AWSLoadBalancerV2 nodes exist in the graph.
 
-    # Assert: No USES_LOAD_BALANCER relationship (ClusterIP services don't have load_balancer_dns_names)
-    assert (
-        check_rels(
+        Only services of type LoadBalancer should create this relationship.
+        """
+        # Act: Load ClusterIP service (KUBERNETES_SERVICES_DATA has type: ClusterIP)
+        load_services(
             neo4j_session,
-            "KubernetesService",
-            "name",
-            "AWSLoadBalancerV2",
-            "dnsname",
-            "USES_LOAD_BALANCER",
-            rel_direction_right=True,
+            KUBERNETES_SERVICES_DATA,
+            update_tag=TEST_UPDATE_TAG,
+            cluster_id=KUBERNETES_CLUSTER_IDS[0],
+            cluster_name=KUBERNETES_CLUSTER_NAMES[0],
+        )
+
+        # Assert: Service was loaded
+        assert check_nodes(neo4j_session, "KubernetesService", ["name"]) == {
+            ("my-service",)
+        }
+
+        # Assert: No USES_LOAD_BALANCER relationship (ClusterIP services don't have load_balancer_dns_names)
+        assert (
+            check_rels(
+                neo4j_session,
+                "KubernetesService",
+                "name",
+                "AWSLoadBalancerV2",
+                "dnsname",
+                "USES_LOAD_BALANCER",
+                rel_direction_right=True,
+            )
+            == set()
         )
-        == set()
-    )
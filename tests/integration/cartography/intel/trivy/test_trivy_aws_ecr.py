@@ -1,4 +1,5 @@
 import json
+from io import BytesIO
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -18,6 +19,8 @@ TEST_ACCOUNT_ID = "000000000000"
 TEST_UPDATE_TAG = 123456789
 TEST_REGION = "us-east-1"
 
+_TRIVY_SAMPLE_JSON_BYTES = json.dumps(TRIVY_SAMPLE).encode("utf-8")
+
 
 @patch.object(
     cartography.intel.trivy,
@@ -65,27 +68,23 @@ def test_sync_trivy_aws_ecr(
         {"UPDATE_TAG": TEST_UPDATE_TAG, "AWS_ID": TEST_ACCOUNT_ID},
     )
 
-    # Mock boto3 to return our test data
-    with patch("boto3.Session") as mock_boto3:
-        s3_client_mock = MagicMock()
-        mock_boto3.return_value.client.return_value = s3_client_mock
-
-        # Mock the S3 get_object response
-        mock_response_body = MagicMock()
-        mock_response_body.read.return_value = json.dumps(TRIVY_SAMPLE).encode("utf-8")
-        s3_client_mock.get_object.return_value = {"Body": mock_response_body}
+    # Serve the scan result from a fake S3 client
+    s3_client = MagicMock()
+    s3_client.get_object.return_value = {"Body": BytesIO(_TRIVY_SAMPLE_JSON_BYTES)}
+    s3_boto3_session = MagicMock()
+    s3_boto3_session.client.return_value = s3_client
 
-        # Act
-        sync_trivy_from_s3(
-            neo4j_session,
-            "test-bucket",
-            "trivy-scans/",
-            TEST_UPDATE_TAG,
-            {"UPDATE_TAG": TEST_UPDATE_TAG, "AWS_ID": TEST_ACCOUNT_ID},
-            mock_boto3.return_value,
-        )
+    # Act
+    sync_trivy_from_s3(
+        neo4j_session,
+        "test-bucket",
+        "trivy-scans/",
+        TEST_UPDATE_TAG,
+        {"UPDATE_TAG": TEST_UPDATE_TAG, "AWS_ID": TEST_ACCOUNT_ID},
+        s3_boto3_session,
+    )
 
-        # Assert using shared helpers
-        assert_trivy_findings(neo4j_session)
-        assert_trivy_packages(neo4j_session)
-        assert_all_trivy_relationships(neo4j_session)
+    # Assert using shared helpers
+    assert_trivy_findings(neo4j_session)
+    assert_trivy_packages(neo4j_session)
+    assert_all_trivy_relationships(neo4j_session)
@@ -19,11 +19,13 @@ TEST_ACCOUNT_ID = "000000000000"
 TEST_UPDATE_TAG = 123456789
 TEST_REGION = "us-east-1"
 
+_TRIVY_SAMPLE_JSON = json.dumps(TRIVY_SAMPLE)
+
 
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_SAMPLE),
+    read_data=_TRIVY_SAMPLE_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
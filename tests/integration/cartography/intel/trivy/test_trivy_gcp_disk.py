@@ -17,6 +17,8 @@ from tests.integration.cartography.intel.trivy.test_helpers import (
 TEST_UPDATE_TAG = 123456789
 TEST_PROJECT_ID = "test-project"
 
+_TRIVY_GCP_SAMPLE_JSON = json.dumps(TRIVY_GCP_SAMPLE)
+
 
 def _create_test_project(neo4j_session):
     """Create test GCPProject node."""
@@ -45,7 +47,7 @@ async def _mock_get_all_manifests_async(
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GCP_SAMPLE),
+    read_data=_TRIVY_GCP_SAMPLE_JSON,
 )
 @patch(
     "cartography.intel.trivy.get_json_files_in_dir",
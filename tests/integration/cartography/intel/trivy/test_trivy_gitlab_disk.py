@@ -2,6 +2,8 @@ import json
 from unittest.mock import mock_open
 from unittest.mock import patch
 
+import pytest
+
 import cartography.intel.gitlab.container_images
 import cartography.intel.gitlab.container_repository_tags
 import cartography.intel.trivy
@@ -24,15 +26,23 @@ from tests.integration.cartography.intel.trivy.test_helpers import (
 from tests.integration.cartography.intel.trivy.test_helpers import (
     assert_trivy_package_extended_fields,
 )
+from tests.integration.cartography.intel.trivy.test_helpers import (
+    get_gitlab_container_image,
+)
+from tests.integration.util import delete_nodes_by_label
 
 TEST_UPDATE_TAG = 123456789
 
+_TRIVY_GITLAB_SAMPLE_JSON = json.dumps(TRIVY_GITLAB_SAMPLE)
+_MULTIARCH_MANIFEST_JSON = json.dumps(TRIVY_GITLAB_MULTIARCH_MANIFEST_LIST)
+_MULTIARCH_AMD64_JSON = json.dumps(TRIVY_GITLAB_MULTIARCH_CHILD_AMD64)
+_MULTIARCH_ARM64_JSON = json.dumps(TRIVY_GITLAB_MULTIARCH_CHILD_ARM64)
+_MULTI_REPO_DIGESTS_JSON = json.dumps(TRIVY_GITLAB_MULTI_REPO_DIGESTS)
+
 
 def _cleanup_trivy_data(neo4j_session):
     """Clean up all Trivy-related nodes before test runs."""
-    neo4j_session.run("MATCH (n:TrivyImageFinding) DETACH DELETE n")
-    neo4j_session.run("MATCH (n:Package) DETACH DELETE n")
-    neo4j_session.run("MATCH (n:TrivyFix) DETACH DELETE n")
+    delete_nodes_by_label(neo4j_session, ["TrivyImageFinding", "Package", "TrivyFix"])
 
 
 def _create_test_org(neo4j_session):
@@ -49,67 +59,87 @@ def _create_test_org(neo4j_session):
     )
 
 
+@pytest.fixture(scope="module")
+def _gitlab_container_images(neo4j_session):
+    """
+    Sync the GitLab organization, container images and tags once for the module. The Trivy syncs in the tests below
+    only add Trivy nodes on top of this baseline.
+    """
+    _create_test_org(neo4j_session)
+
+    common_job_parameters = {
+        "UPDATE_TAG": TEST_UPDATE_TAG,
+        "org_url": TEST_ORG_URL,
+    }
+
+    # Sync GitLab container images
+    with patch.object(
+        cartography.intel.gitlab.container_images,
+        "get_container_images",
+        return_value=(
+            GET_CONTAINER_IMAGES_RESPONSE,
+            GET_CONTAINER_MANIFEST_LISTS_RESPONSE,
+        ),
+    ):
+        cartography.intel.gitlab.container_images.sync_container_images(
+            neo4j_session,
+            "https://gitlab.example.com",
+            "fake-token",
+            TEST_ORG_URL,
+            [],
+            TEST_UPDATE_TAG,
+            common_job_parameters,
+        )
+
+    # Sync GitLab container repository tags
+    with patch.object(
+        cartography.intel.gitlab.container_repository_tags,
+        "get_all_container_repository_tags",
+        return_value=GET_CONTAINER_REPOSITORY_TAGS_RESPONSE,
+    ):
+        cartography.intel.gitlab.container_repository_tags.sync_container_repository_tags(
+            neo4j_session,
+            "https://gitlab.example.com",
+            "fake-token",
+            TEST_ORG_URL,
+            [],
+            TEST_UPDATE_TAG,
+            common_job_parameters,
+        )
+
+    return common_job_parameters
+
+
+@pytest.fixture
+def gitlab_job_parameters(neo4j_session, _gitlab_container_images):
+    """
+    The module's synced GitLab baseline, with the Trivy nodes left by the previous test removed.
+    """
+    _cleanup_trivy_data(neo4j_session)
+    return _gitlab_container_images
+
+
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GITLAB_SAMPLE),
+    read_data=_TRIVY_GITLAB_SAMPLE_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
     "get_json_files_in_dir",
     return_value={"/tmp/scan.json"},
 )
-@patch.object(
-    cartography.intel.gitlab.container_repository_tags,
-    "get_all_container_repository_tags",
-    return_value=GET_CONTAINER_REPOSITORY_TAGS_RESPONSE,
-)
-@patch.object(
-    cartography.intel.gitlab.container_images,
-    "get_container_images",
-    return_value=(GET_CONTAINER_IMAGES_RESPONSE, GET_CONTAINER_MANIFEST_LISTS_RESPONSE),
-)
 def test_sync_trivy_gitlab(
-    mock_get_images,
-    mock_get_tags,
     mock_list_dir_scan_results,
     mock_file_open,
     neo4j_session,
+    gitlab_job_parameters,
 ):
     """
     Ensure that Trivy scan results create relationships to GitLabContainerImage nodes.
     Tests both tag-based matching (RepoTags) and digest-based matching (RepoDigests).
     """
-    # Arrange - clean up and create GitLab organization
-    _cleanup_trivy_data(neo4j_session)
-    _create_test_org(neo4j_session)
-
-    common_job_parameters = {
-        "UPDATE_TAG": TEST_UPDATE_TAG,
-        "org_url": TEST_ORG_URL,
-    }
-
-    # First sync GitLab container images
-    cartography.intel.gitlab.container_images.sync_container_images(
-        neo4j_session,
-        "https://gitlab.example.com",
-        "fake-token",
-        TEST_ORG_URL,
-        [],  # repositories - not used since we're mocking get_container_images
-        TEST_UPDATE_TAG,
-        common_job_parameters,
-    )
-
-    # Sync GitLab container repository tags to enable tag-based matching
-    cartography.intel.gitlab.container_repository_tags.sync_container_repository_tags(
-        neo4j_session,
-        "https://gitlab.example.com",
-        "fake-token",
-        TEST_ORG_URL,
-        [],  # repositories - not used since we're mocking get_all_container_repository_tags
-        TEST_UPDATE_TAG,
-        common_job_parameters,
-    )
+    common_job_parameters = gitlab_job_parameters
 
     # Act - sync Trivy results
     sync_trivy_from_dir(
@@ -153,58 +183,10 @@ def test_sync_trivy_gitlab(
     assert_trivy_package_extended_fields(neo4j_session)
 
 
-def _sync_gitlab_data(neo4j_session, update_tag=TEST_UPDATE_TAG):
-    """Helper to sync GitLab container images and tags for tests."""
-    _cleanup_trivy_data(neo4j_session)
-    _create_test_org(neo4j_session)
-
-    common_job_parameters = {
-        "UPDATE_TAG": update_tag,
-        "org_url": TEST_ORG_URL,
-    }
-
-    # Sync GitLab container images
-    with patch.object(
-        cartography.intel.gitlab.container_images,
-        "get_container_images",
-        return_value=(
-            GET_CONTAINER_IMAGES_RESPONSE,
-            GET_CONTAINER_MANIFEST_LISTS_RESPONSE,
-        ),
-    ):
-        cartography.intel.gitlab.container_images.sync_container_images(
-            neo4j_session,
-            "https://gitlab.example.com",
-            "fake-token",
-            TEST_ORG_URL,
-            [],
-            TEST_UPDATE_TAG,
-            common_job_parameters,
-        )
-
-    # Sync GitLab container repository tags
-    with patch.object(
-        cartography.intel.gitlab.container_repository_tags,
-        "get_all_container_repository_tags",
-        return_value=GET_CONTAINER_REPOSITORY_TAGS_RESPONSE,
-    ):
-        cartography.intel.gitlab.container_repository_tags.sync_container_repository_tags(
-            neo4j_session,
-            "https://gitlab.example.com",
-            "fake-token",
-            TEST_ORG_URL,
-            [],
-            TEST_UPDATE_TAG,
-            common_job_parameters,
-        )
-
-    return common_job_parameters
-
-
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GITLAB_MULTIARCH_MANIFEST_LIST),
+    read_data=_MULTIARCH_MANIFEST_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
@@ -215,6 +197,7 @@ def test_sync_trivy_gitlab_multiarch_manifest_list(
     mock_list_dir_scan_results,
     mock_file_open,
     neo4j_session,
+    gitlab_job_parameters,
 ):
     """
     Test Trivy scan of a multi-arch manifest list.
@@ -222,7 +205,7 @@ def test_sync_trivy_gitlab_multiarch_manifest_list(
     Verifies that findings link to the manifest_list type image node,
     not to the platform-specific children.
     """
-    common_job_parameters = _sync_gitlab_data(neo4j_session)
+    common_job_parameters = gitlab_job_parameters
 
     # Act - sync Trivy results for manifest list
     sync_trivy_from_dir(
@@ -253,22 +236,20 @@ def test_sync_trivy_gitlab_multiarch_manifest_list(
         expected_finding_rels,
     )
 
+    image = get_gitlab_container_image(
+        neo4j_session,
+        "sha256:bbb222333444555666777888999000aaabbbcccdddeeefff000111222333444",
+    )
+
     # Verify the image node is of type manifest_list
-    result = neo4j_session.run(
-        """
-        MATCH (img:GitLabContainerImage {digest: $digest})
-        RETURN img.type AS type
-        """,
-        digest="sha256:bbb222333444555666777888999000aaabbbcccdddeeefff000111222333444",
-    ).single()
-    assert result is not None
-    assert result["type"] == "manifest_list"
+    assert image is not None
+    assert image["type"] == "manifest_list"
 
 
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GITLAB_MULTIARCH_CHILD_AMD64),
+    read_data=_MULTIARCH_AMD64_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
@@ -279,6 +260,7 @@ def test_sync_trivy_gitlab_multiarch_child_amd64(
     mock_list_dir_scan_results,
     mock_file_open,
     neo4j_session,
+    gitlab_job_parameters,
 ):
     """
     Test Trivy scan of a platform-specific child image (linux/amd64).
@@ -286,7 +268,7 @@ def test_sync_trivy_gitlab_multiarch_child_amd64(
     Verifies that findings link to the child image digest,
     and that the child is correctly related to its parent manifest list.
     """
-    common_job_parameters = _sync_gitlab_data(neo4j_session)
+    common_job_parameters = gitlab_job_parameters
 
     # Act - sync Trivy results for amd64 child
     sync_trivy_from_dir(
@@ -317,27 +299,24 @@ def test_sync_trivy_gitlab_multiarch_child_amd64(
         expected_finding_rels,
     )
 
+    image = get_gitlab_container_image(
+        neo4j_session,
+        "sha256:child1amd64555666777888999000aaabbbcccdddeeefff000111222333444",
+    )
+
     # Verify the child image is linked to parent manifest list
-    result = neo4j_session.run(
-        """
-        MATCH (parent:GitLabContainerImage {type: 'manifest_list'})
-              -[:CONTAINS_IMAGE]->(child:GitLabContainerImage {digest: $child_digest})
-        RETURN parent.digest AS parent_digest, child.architecture AS arch
-        """,
-        child_digest="sha256:child1amd64555666777888999000aaabbbcccdddeeefff000111222333444",
-    ).single()
-    assert result is not None
+    assert image is not None
     assert (
-        result["parent_digest"]
+        image["parent_digest"]
         == "sha256:bbb222333444555666777888999000aaabbbcccdddeeefff000111222333444"
     )
-    assert result["arch"] == "amd64"
+    assert image["architecture"] == "amd64"
 
 
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GITLAB_MULTIARCH_CHILD_ARM64),
+    read_data=_MULTIARCH_ARM64_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
@@ -348,6 +327,7 @@ def test_sync_trivy_gitlab_multiarch_child_arm64(
     mock_list_dir_scan_results,
     mock_file_open,
     neo4j_session,
+    gitlab_job_parameters,
 ):
     """
     Test Trivy scan of a platform-specific child image (linux/arm64).
@@ -355,7 +335,7 @@ def test_sync_trivy_gitlab_multiarch_child_arm64(
     Verifies that findings link to the arm64 child image digest,
     demonstrating platform-specific vulnerability tracking.
     """
-    common_job_parameters = _sync_gitlab_data(neo4j_session)
+    common_job_parameters = gitlab_job_parameters
 
     # Act - sync Trivy results for arm64 child
     sync_trivy_from_dir(
@@ -386,23 +366,21 @@ def test_sync_trivy_gitlab_multiarch_child_arm64(
         expected_finding_rels,
     )
 
+    image = get_gitlab_container_image(
+        neo4j_session,
+        "sha256:child2arm64555666777888999000aaabbbcccdddeeefff000111222333444",
+    )
+
     # Verify the child image has correct architecture and variant
-    result = neo4j_session.run(
-        """
-        MATCH (child:GitLabContainerImage {digest: $child_digest})
-        RETURN child.architecture AS arch, child.variant AS variant
-        """,
-        child_digest="sha256:child2arm64555666777888999000aaabbbcccdddeeefff000111222333444",
-    ).single()
-    assert result is not None
-    assert result["arch"] == "arm64"
-    assert result["variant"] == "v8"
+    assert image is not None
+    assert image["architecture"] == "arm64"
+    assert image["variant"] == "v8"
 
 
 @patch(
     "builtins.open",
     new_callable=mock_open,
-    read_data=json.dumps(TRIVY_GITLAB_MULTI_REPO_DIGESTS),
+    read_data=_MULTI_REPO_DIGESTS_JSON,
 )
 @patch.object(
     cartography.intel.trivy,
@@ -413,6 +391,7 @@ def test_sync_trivy_gitlab_multi_repo_digests(
     mock_list_dir_scan_results,
     mock_file_open,
     neo4j_session,
+    gitlab_job_parameters,
 ):
     """
     Test Trivy scan with multiple RepoDigests entries.
@@ -420,7 +399,7 @@ def test_sync_trivy_gitlab_multi_repo_digests(
     Verifies that the first RepoDigests entry is selected for digest extraction,
     ensuring consistent behavior when images are pushed to multiple registries.
     """
-    common_job_parameters = _sync_gitlab_data(neo4j_session)
+    common_job_parameters = gitlab_job_parameters
 
     # Act - sync Trivy results with multiple RepoDigests
     sync_trivy_from_dir(
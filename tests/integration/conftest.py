@@ -1,17 +1,96 @@
 import logging
+import os
+import uuid
 
 import neo4j
 import pytest
 
 from tests.integration import settings
+from tests.integration.util import reset_graph
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("neo4j").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="module")
-def neo4j_session():
+@pytest.fixture(scope="session")
+def neo4j_driver():
+    """
+    A single driver (and so a single connection pool) for the whole test run, so that the connection handshake is
+    not paid again by every test module.
+    """
     driver = neo4j.GraphDatabase.driver(settings.get("NEO4J_URL"))
-    with driver.session() as session:
-        yield session
-        session.run("MATCH (n) DETACH DELETE n;")
+    yield driver
+    driver.close()
+
+
+@pytest.fixture(scope="session")
+def neo4j_multi_database(neo4j_driver):
+    """
+    Whether the server supports CREATE/DROP DATABASE, which is an Enterprise feature.
+    """
+    with neo4j_driver.session() as session:
+        editions = {
+            record["edition"]
+            for record in session.run(
+                "CALL dbms.components() YIELD edition RETURN edition",
+            )
+        }
+    return "enterprise" in editions
+
+
+def _create_module_database(driver: neo4j.Driver) -> str | None:
+    """
+    Create a dedicated, empty database for a test module so that cleanup is a DROP DATABASE instead of a full-graph
+    DETACH DELETE. This also isolates pytest-xdist workers from each other. Returns None if the database cannot be
+    created, in which case the default database is used.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    database = f"cartography-test-{worker}-{uuid.uuid4().hex[:12]}"
+    try:
+        with driver.session(database="system") as session:
+            session.run(f"CREATE DATABASE `{database}` IF NOT EXISTS WAIT").consume()
+    except neo4j.exceptions.ClientError as e:
+        logger.warning(
+            "Could not create test database %s, using the default database: %s",
+            database,
+            e,
+        )
+        return None
+    return database
+
+
+@pytest.fixture(scope="module")
+def neo4j_session(neo4j_driver, neo4j_multi_database):
+    database = _create_module_database(neo4j_driver) if neo4j_multi_database else None
+    if database:
+        try:
+            with neo4j_driver.session(database=database) as session:
+                yield session
+        finally:
+            with neo4j_driver.session(database="system") as session:
+                session.run(f"DROP DATABASE `{database}` IF EXISTS").consume()
+    else:
+        if os.environ.get("PYTEST_XDIST_WORKER"):
+            pytest.fail(
+                "Parallel integration tests need a database per module, which requires Neo4j Enterprise. Run them "
+                "without pytest-xdist on this server.",
+                pytrace=False,
+            )
+        with neo4j_driver.session(database=settings.get("NEO4J_DATABASE")) as session:
+            yield session
+            reset_graph(session)
+
+
+@pytest.fixture(autouse=True)
+def _reset_graph_if_marked(request):
+    """
+    Wipe the module's graph after each test marked `needs_clean_graph`, so that those tests do not need to clear the
+    graph themselves. Mark a whole module with `pytestmark = pytest.mark.needs_clean_graph`.
+    """
+    if request.node.get_closest_marker("needs_clean_graph") is None:
+        yield
+        return
+    session = request.getfixturevalue("neo4j_session")
+    yield
+    reset_graph(session)
@@ -1,6 +1,8 @@
 import os
 
 NEO4J_URL = os.environ.get("NEO4J_URL", "bolt://localhost:7687")
+# Naming the database up front saves the driver a round trip to resolve the home database for each new session.
+NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
 
 
 def get(name):
@@ -1,5 +1,7 @@
 from string import Template
 from typing import Any
+from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Set
@@ -7,16 +9,19 @@ from typing import Tuple
 
 import neo4j
 
+from cartography.client.core.tx import ensure_indexes
+from cartography.models.core.nodes import CartographyNodeSchema
+
 
 def check_nodes(
     neo4j_session: neo4j.Session,
     node_label: str,
     attrs: List[str],
-) -> Optional[Set[Tuple[Any, ...]]]:
+) -> Set[Tuple[Any, ...]]:
     """
     Helper function for checking nodes in cartography integration tests.
     Returns the result of a neo4j match query on the given node label and the given list of attributes as a set of
-    tuples.
+    tuples. The rows are de-duplicated server side and returned as a single record.
     """
     if not attrs:
         raise ValueError(
@@ -24,11 +29,87 @@ def check_nodes(
         )
 
     attrs = ", ".join(f"n.{attr}" for attr in attrs)
-    query_template = Template("MATCH (n:$NodeLabel) RETURN $Attrs")
-    result = neo4j_session.run(
+    query_template = Template(
+        "MATCH (n:$NodeLabel) RETURN collect(DISTINCT [$Attrs]) AS rows",
+    )
+    rows = neo4j_session.run(
         query_template.safe_substitute(NodeLabel=node_label, Attrs=attrs),
+    ).single()["rows"]
+    return set(map(tuple, rows))
+
+
+def check_nodes_fast(
+    neo4j_session: neo4j.Session,
+    node_label: str,
+    attrs: List[str],
+    expected: Set[Tuple[Any, ...]],
+) -> FrozenSet[Tuple[Any, ...]]:
+    """
+    Variant of check_nodes() for asserting against a known expected set.
+    Runs a cheap `count(n)` first; if the cardinality already differs from `expected`, the full node set is returned
+    so that pytest can render a diff. Otherwise the projection is limited to len(expected) + 1 rows.
+    Use as `assert check_nodes_fast(session, label, attrs, expected) == expected`.
+    """
+    if not attrs:
+        raise ValueError(
+            "`attrs` passed to check_nodes_fast() must have at least one element.",
+        )
+
+    count = neo4j_session.run(
+        Template("MATCH (n:$NodeLabel) RETURN count(n) AS c").safe_substitute(
+            NodeLabel=node_label,
+        ),
+    ).single()["c"]
+    if count != len(expected):
+        return frozenset(check_nodes(neo4j_session, node_label, attrs))
+
+    query_template = Template("MATCH (n:$NodeLabel) RETURN $Attrs LIMIT $Limit")
+    result = neo4j_session.run(
+        query_template.safe_substitute(
+            NodeLabel=node_label,
+            Attrs=", ".join(f"n.{attr}" for attr in attrs),
+            Limit=len(expected) + 1,
+        ),
     )
-    return {tuple(row.values()) for row in result}
+    return frozenset(tuple(row.values()) for row in result)
+
+
+def count_nodes_by_label(
+    neo4j_session: neo4j.Session,
+    node_labels: List[str],
+    id_contains: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Helper function that counts the nodes of several labels in a single query and round trip.
+    Returns a dict mapping each label to its node count. If `id_contains` is given, only nodes whose `id` contains
+    that string are counted.
+    """
+    if not node_labels:
+        raise ValueError(
+            "`node_labels` passed to count_nodes_by_label() must have at least one element.",
+        )
+
+    where = " WHERE n.id CONTAINS $id_contains" if id_contains is not None else ""
+    query = "RETURN " + ", ".join(
+        f"COUNT {{ MATCH (n:{label}){where} }} AS `{label}`" for label in node_labels
+    )
+    record = neo4j_session.run(query, id_contains=id_contains).single()
+    return {label: record[label] for label in node_labels}
+
+
+def any_nodes_exist(
+    neo4j_session: neo4j.Session,
+    node_label: str,
+    id_contains: Optional[str] = None,
+) -> bool:
+    """
+    Helper function for asserting that nodes were (or were not) deleted. Stops at the first matching node instead of
+    streaming back the whole label like check_nodes() does. If `id_contains` is given, only nodes whose `id` contains
+    that string are considered.
+    """
+    where = " WHERE n.id CONTAINS $id_contains" if id_contains is not None else ""
+    query = f"MATCH (n:{node_label}){where} RETURN 1 LIMIT 1"
+    return neo4j_session.run(query, id_contains=id_contains).single() is not None
 
 
 def check_rels(
@@ -58,7 +139,8 @@ def check_rels(
     )
 
     query_template = Template(
-        "MATCH (n1:$Node1Label)$Rel(n2:$Node2Label) RETURN n1.$Node1Attr, n2.$Node2Attr;",
+        "MATCH (n1:$Node1Label)$Rel(n2:$Node2Label) "
+        "RETURN collect(DISTINCT [n1.$Node1Attr, n2.$Node2Attr]) AS rows;",
     )
     query = query_template.safe_substitute(
         Node1Label=node_1_label,
@@ -67,5 +149,129 @@ def check_rels(
         Node1Attr=node_1_attr,
         Node2Attr=node_2_attr,
     )
-    result = neo4j_session.run(query)
-    return {(r[f"n1.{node_1_attr}"], r[f"n2.{node_2_attr}"]) for r in result}
+    rows = neo4j_session.run(query).single()["rows"]
+    return set(map(tuple, rows))
+
+
+def graph_snapshot(
+    neo4j_session: neo4j.Session,
+    spec: Dict[str, Any],
+) -> Dict[str, Dict[Any, Set[Tuple[Any, ...]]]]:
+    """
+    Helper function that fetches several check_nodes()/check_rels() projections in a single query and round trip.
+    `spec` has the shape
+    {"nodes": {node_label: [attr, ...]}, "rels": [(node_1_label, node_1_attr, node_2_label, node_2_attr, rel_label)]}
+    where each rels entry may carry a sixth `rel_direction_right` element (default True).
+    Returns {"nodes": {node_label: set of tuples}, "rels": {rels entry: set of tuples}}, with the same tuples that
+    check_nodes() and check_rels() would return.
+    """
+    nodes = spec.get("nodes", {})
+    rels = [tuple(rel) for rel in spec.get("rels", [])]
+    if not nodes and not rels:
+        raise ValueError(
+            "`spec` passed to graph_snapshot() must have at least one node label or relationship.",
+        )
+
+    branches = []
+    for idx, (node_label, attrs) in enumerate(nodes.items()):
+        if not attrs:
+            raise ValueError(
+                f"`attrs` for {node_label} passed to graph_snapshot() must have at least one element.",
+            )
+        values = ", ".join(f"n.{attr}" for attr in attrs)
+        branches.append(
+            f"MATCH (n:{node_label}) RETURN 'nodes' AS kind, {idx} AS idx, [{values}] AS row",
+        )
+    for idx, (n1_label, n1_attr, n2_label, n2_attr, rel_label, *direction) in enumerate(
+        rels,
+    ):
+        rel_direction_right = direction[0] if direction else True
+        relationship = (
+            f"-[:{rel_label}]->" if rel_direction_right else f"<-[:{rel_label}]-"
+        )
+        branches.append(
+            f"MATCH (n1:{n1_label}){relationship}(n2:{n2_label}) "
+            f"RETURN 'rels' AS kind, {idx} AS idx, [n1.{n1_attr}, n2.{n2_attr}] AS row",
+        )
+
+    node_labels = list(nodes)
+    snapshot: Dict[str, Dict[Any, Set[Tuple[Any, ...]]]] = {
+        "nodes": {node_label: set() for node_label in node_labels},
+        "rels": {rel: set() for rel in rels},
+    }
+    for record in neo4j_session.run(" UNION ALL ".join(branches)):
+        if record["kind"] == "nodes":
+            snapshot["nodes"][node_labels[record["idx"]]].add(tuple(record["row"]))
+        else:
+            snapshot["rels"][rels[record["idx"]]].add(tuple(record["row"]))
+    return snapshot
+
+
+def query_single_value(
+    neo4j_session: neo4j.Session,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Helper function for assertions that only need a single aggregate, e.g. a count or a `collect()` of the ids on the
+    other end of one node's relationships, instead of the full set of pairs that check_rels() returns.
+    `query` must return exactly one row; the value of its first column is returned.
+    """
+    record = neo4j_session.run(query, params or {}).single()
+    assert record is not None, f"Expected a single row from query: {query}"
+    return record.value()
+
+
+def _label(label: Optional[str]) -> str:
+    return f":`{label}`" if label else ""
+
+
+def ensure_schema_indexes(
+    neo4j_session: neo4j.Session,
+    *node_schemas: CartographyNodeSchema,
+) -> None:
+    """
+    Helper function to create the indexes of the given node schemas. Use it in tests that MERGE nodes by id with
+    handwritten Cypher before anything has been loaded through `load()`, which is what normally creates the indexes.
+    """
+    for node_schema in node_schemas:
+        ensure_indexes(neo4j_session, node_schema)
+
+
+def reset_graph(neo4j_session: neo4j.Session, batch_size: int = 50000) -> None:
+    """
+    Helper function to delete every node in the graph in batched transactions, so that wiping a large residual graph
+    does not need one huge transaction. Batches run one after the other: concurrent batches that detach-delete
+    shared relationships can deadlock.
+    """
+    neo4j_session.run(
+        f"MATCH (n) CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {int(batch_size)} ROWS",
+    ).consume()
+
+
+def delete_nodes_by_label(
+    neo4j_session: neo4j.Session,
+    labels: List[str],
+    batch_size: int = 10000,
+    id_contains: Optional[str] = None,
+) -> None:
+    """
+    Helper function to delete only the nodes with the given labels, in batched transactions. Cheaper than
+    reset_graph() for tests that create a handful of labels, since each label is read with a label scan rather than a
+    scan of the whole graph. All labels are deleted in a single query. If `id_contains` is given, only nodes whose
+    `id` contains that string are deleted.
+    """
+    if not labels:
+        raise ValueError(
+            "`labels` passed to delete_nodes_by_label() must have at least one element.",
+        )
+
+    where = " WHERE n.id CONTAINS $id_contains" if id_contains is not None else ""
+    matches = " UNION ".join(
+        f"MATCH (n{_label(label)}){where} RETURN n" for label in labels
+    )
+    neo4j_session.run(
+        f"CALL {{ {matches} }} "
+        f"CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {int(batch_size)} ROWS",
+        id_contains=id_contains,
+    ).consume()
@@ -1,5 +1,9 @@
+import re
 from typing import List
 
+# Whitespace at the start of a line. Since \s also matches newlines, this swallows any blank lines that follow too.
+_LEADING_WHITESPACE_RE = re.compile(r"^\s+", re.MULTILINE)
+
 
 def remove_leading_whitespace_and_empty_lines(text: str) -> str:
     """
@@ -8,11 +12,8 @@ def remove_leading_whitespace_and_empty_lines(text: str) -> str:
     :param text: Text string
     :return: The text string but with no leading whitespace and no blank lines.
     """
-    # We call lstrip() twice on the same line. This is inefficient but ok for small unit tests.
-    # Please change it if you want to.
-    return "\n".join(
-        [line.lstrip() for line in text.split("\n") if line.lstrip() != ""],
-    )
+    # Trailing blank lines collapse to a single "\n", which is dropped as well.
+    return _LEADING_WHITESPACE_RE.sub("", text).removesuffix("\n")
 
 
 def clean_query_list(queries: List[str]) -> List[str]:
@@ -10,6 +10,7 @@ import pytest
 
 from cartography.graph.cleanupbuilder import _build_cleanup_node_and_rel_queries
 from cartography.graph.cleanupbuilder import build_cleanup_queries
+from cartography.graph.job import get_parameters
 from tests.data.graph.querybuilder.sample_models.allow_unscoped import (
     UnscopedNodeSchema,
 )
@@ -24,6 +25,33 @@ from tests.data.graph.querybuilder.sample_models.interesting_asset import (
 )
 from tests.unit.cartography.graph.helpers import clean_query_list
 
+# Expected queries shared by several of the tests below
+EXPECTED_CASCADE_NODE_QUERY = """
+MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
+WHERE n.lastupdated <> $UPDATE_TAG
+WITH n LIMIT $LIMIT_SIZE
+CALL {
+    WITH n
+    OPTIONAL MATCH (n)-[:RELATIONSHIP_LABEL]->(child)
+    WITH child WHERE child IS NOT NULL AND child.lastupdated <> $UPDATE_TAG
+    DETACH DELETE child
+}
+DETACH DELETE n;
+"""
+EXPECTED_SUB_RESOURCE_REL_QUERY = """
+MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
+WHERE s.lastupdated <> $UPDATE_TAG
+WITH s LIMIT $LIMIT_SIZE
+DELETE s;
+"""
+EXPECTED_HELLO_ASSET_REL_QUERY = """
+MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
+MATCH (n)-[r:ASSOCIATED_WITH]->(:HelloAsset)
+WHERE r.lastupdated <> $UPDATE_TAG
+WITH r LIMIT $LIMIT_SIZE
+DELETE r;
+"""
+
 
 def test_cascade_cleanup_sub_rel():
     """
@@ -40,24 +68,8 @@ def test_cascade_cleanup_sub_rel():
         cascade_delete=True,
     )
     expected_queries = [
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        WHERE n.lastupdated <> $UPDATE_TAG
-        WITH n LIMIT $LIMIT_SIZE
-        CALL {
-            WITH n
-            OPTIONAL MATCH (n)-[:RELATIONSHIP_LABEL]->(child)
-            WITH child WHERE child IS NOT NULL AND child.lastupdated <> $UPDATE_TAG
-            DETACH DELETE child
-        }
-        DETACH DELETE n;
-        """,
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        WHERE s.lastupdated <> $UPDATE_TAG
-        WITH s LIMIT $LIMIT_SIZE
-        DELETE s;
-        """,
+        EXPECTED_CASCADE_NODE_QUERY,
+        EXPECTED_SUB_RESOURCE_REL_QUERY,
     ]
     assert clean_query_list(actual_queries) == clean_query_list(expected_queries)
 
@@ -86,13 +98,7 @@ def test_cascade_cleanup_with_selected_rel():
         }
         DETACH DELETE n;
         """,
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        MATCH (n)-[r:ASSOCIATED_WITH]->(:HelloAsset)
-        WHERE r.lastupdated <> $UPDATE_TAG
-        WITH r LIMIT $LIMIT_SIZE
-        DELETE r;
-        """,
+        EXPECTED_HELLO_ASSET_REL_QUERY,
     ]
     assert clean_query_list(actual_queries) == clean_query_list(expected_queries)
 
@@ -107,31 +113,9 @@ def test_build_cleanup_queries_with_cascade():
         cascade_delete=True,
     )
     expected_queries = [
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        WHERE n.lastupdated <> $UPDATE_TAG
-        WITH n LIMIT $LIMIT_SIZE
-        CALL {
-            WITH n
-            OPTIONAL MATCH (n)-[:RELATIONSHIP_LABEL]->(child)
-            WITH child WHERE child IS NOT NULL AND child.lastupdated <> $UPDATE_TAG
-            DETACH DELETE child
-        }
-        DETACH DELETE n;
-        """,
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        WHERE s.lastupdated <> $UPDATE_TAG
-        WITH s LIMIT $LIMIT_SIZE
-        DELETE s;
-        """,
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        MATCH (n)-[r:ASSOCIATED_WITH]->(:HelloAsset)
-        WHERE r.lastupdated <> $UPDATE_TAG
-        WITH r LIMIT $LIMIT_SIZE
-        DELETE r;
-        """,
+        EXPECTED_CASCADE_NODE_QUERY,
+        EXPECTED_SUB_RESOURCE_REL_QUERY,
+        EXPECTED_HELLO_ASSET_REL_QUERY,
         """
         MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
         MATCH (n)<-[r:CONNECTED]-(:WorldAsset)
@@ -143,6 +127,23 @@ def test_build_cleanup_queries_with_cascade():
     assert clean_query_list(actual_queries) == clean_query_list(expected_queries)
 
 
+def test_cascade_cleanup_queries_are_parameterized():
+    """
+    Test that every cascade cleanup query is scoped by the $sub_resource_id parameter rather than a literal id, and
+    uses no parameters beyond the standard cleanup ones, so one cached plan serves every sub resource.
+    """
+    queries: list[str] = build_cleanup_queries(
+        InterestingAssetSchema(),
+        cascade_delete=True,
+    )
+    assert all("$sub_resource_id" in query for query in queries)
+    assert get_parameters(queries) == {
+        "UPDATE_TAG",
+        "sub_resource_id",
+        "LIMIT_SIZE",
+    }
+
+
 def test_cascade_delete_default_false():
     """
     Test that cascade_delete defaults to False and produces standard cleanup queries.
@@ -166,12 +167,7 @@ def test_cascade_delete_default_false():
         WITH n LIMIT $LIMIT_SIZE
         DETACH DELETE n;
         """,
-        """
-        MATCH (n:InterestingAsset)<-[s:RELATIONSHIP_LABEL]-(:SubResource{id: $sub_resource_id})
-        WHERE s.lastupdated <> $UPDATE_TAG
-        WITH s LIMIT $LIMIT_SIZE
-        DELETE s;
-        """,
+        EXPECTED_SUB_RESOURCE_REL_QUERY,
     ]
     assert clean_query_list(actual_queries_default) == clean_query_list(
         expected_queries
@@ -1,5 +1,7 @@
 import datetime
 
+import pytest
+
 from cartography.intel.aws import iam
 from cartography.intel.aws.iam import PolicyType
 from cartography.intel.aws.iam import transform_policy_data
@@ -41,9 +43,31 @@ def test__parse_principal_entries():
 def test_get_account_from_arn():
     result = iam.get_account_from_arn("arn:aws:iam::081157660428:role/TestRole")
     assert result == "081157660428"
+    # Colons in the resource part do not matter, and a truncated ARN has no account
+    assert (
+        iam.get_account_from_arn("arn:aws:logs:us-east-1:081157660428:log-group:a:*")
+        == "081157660428"
+    )
+    assert iam.get_account_from_arn("arn:aws:iam:") == ""
+
+
+def test_get_account_from_arn_six_fields():
+    assert (
+        iam.get_account_from_arn("arn:aws:s3:us-east-1:081157660428:bucket-name")
+        == "081157660428"
+    )
+
 
+def test_get_account_from_arn_four_fields():
+    # A malformed ARN that stops before the account field has no account, rather than raising IndexError
+    assert iam.get_account_from_arn("arn:aws:iam:us-east-1") == ""
 
-def test__get_role_tags_valid_tags(mocker):
+
+@pytest.fixture
+def iam_role_mocks(mocker):
+    """
+    A boto3 session whose IAM resource returns a single mock role "test-role". Tests set the role's tags.
+    """
     mocker.patch(
         "cartography.intel.aws.iam.get_role_list_data",
         return_value={
@@ -59,14 +83,19 @@ def test__get_role_tags_valid_tags(mocker):
     mock_session = mocker.Mock()
     mock_client = mocker.Mock()
     mock_role = mocker.Mock()
+    mock_client.Role.return_value = mock_role
+    mock_session.resource.return_value = mock_client
+    return mock_session, mock_role
+
+
+def test__get_role_tags_valid_tags(iam_role_mocks):
+    mock_session, mock_role = iam_role_mocks
     mock_role.tags = [
         {
             "Key": "k1",
             "Value": "v1",
         },
     ]
-    mock_client.Role.return_value = mock_role
-    mock_session.resource.return_value = mock_client
     result = iam.get_role_tags(mock_session)
 
     assert result == [
@@ -82,25 +111,9 @@ def test__get_role_tags_valid_tags(mocker):
     ]
 
 
-def test__get_role_tags_no_tags(mocker):
-    mocker.patch(
-        "cartography.intel.aws.iam.get_role_list_data",
-        return_value={
-            "Roles": [
-                {
-                    "RoleName": "test-role",
-                    "Arn": "test-arn",
-                },
-            ],
-        },
-    )
-    mocker.patch("boto3.session.Session")
-    mock_session = mocker.Mock()
-    mock_client = mocker.Mock()
-    mock_role = mocker.Mock()
+def test__get_role_tags_no_tags(iam_role_mocks):
+    mock_session, mock_role = iam_role_mocks
     mock_role.tags = []
-    mock_client.Role.return_value = mock_role
-    mock_session.resource.return_value = mock_client
     result = iam.get_role_tags(mock_session)
 
     assert result == []
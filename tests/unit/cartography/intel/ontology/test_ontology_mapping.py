@@ -1,15 +1,17 @@
-from dataclasses import asdict
+from dataclasses import fields
+from dataclasses import MISSING
+from functools import lru_cache
 from typing import Type
 
 import cartography.models
 from cartography.models.core.nodes import CartographyNodeSchema
+from cartography.models.core.nodes import ExtraNodeLabels
 from cartography.models.ontology.mapping import ONTOLOGY_MODELS
 from cartography.models.ontology.mapping import ONTOLOGY_NODES_MAPPING
 from cartography.models.ontology.mapping import SEMANTIC_LABELS_MAPPING
 from cartography.sync import TOP_LEVEL_MODULES
 from tests.utils import load_models
 
-MODELS = list(load_models(cartography.models))
 ALL_MAPPINGS = {
     **ONTOLOGY_NODES_MAPPING,
     **SEMANTIC_LABELS_MAPPING,
@@ -18,52 +20,99 @@ ALL_MAPPINGS = {
 # Unfortunately, some nodes are not yet migrated to the new data model system.
 # We need to ignore them in this test for now as we are not able to load their model class.
 # This is a temporary workaround until all models are migrated.
-OLD_FORMAT_NODES = [
-    "OktaUser",
-    "OktaApplication",
-    "OktaOrganization",
-    "AWSAccount",
-    "EntraTenant",  # main label is AzureTenant
-]
+OLD_FORMAT_NODES = frozenset(
+    {
+        "OktaUser",
+        "OktaApplication",
+        "OktaOrganization",
+        "AWSAccount",
+        "EntraTenant",  # main label is AzureTenant
+    },
+)
 
 
-def _get_model_by_node_label(node_label: str) -> list[Type[CartographyNodeSchema]]:
-    models = []
-    for _, node_class in MODELS:
-        if not issubclass(node_class, CartographyNodeSchema):
-            continue
-        if node_class.label == node_label:
-            models.append(node_class)
-    return models
+@lru_cache(maxsize=None)
+def _get_models_by_label() -> dict[str, tuple[Type[CartographyNodeSchema], ...]]:
+    """
+    Get the node schema classes indexed by their primary label. Importing every model is the slowest part of this
+    module, so it happens on first use rather than at import time, and not at all when no test here is selected.
+    The classes are stored as tuples so that callers cannot mutate the cached index.
+    """
+    models_by_label: dict[str, list[Type[CartographyNodeSchema]]] = {}
+    for _, node_class in load_models(cartography.models):
+        if issubclass(node_class, CartographyNodeSchema):
+            models_by_label.setdefault(node_class().label, []).append(node_class)
+    return {label: tuple(models) for label, models in models_by_label.items()}
+
+
+def _get_model_by_node_label(
+    node_label: str,
+) -> tuple[Type[CartographyNodeSchema], ...]:
+    return _get_models_by_label().get(node_label, ())
+
+
+@lru_cache(maxsize=None)
+def _get_extra_node_labels(model_class: Type[CartographyNodeSchema]) -> tuple[str, ...]:
+    """
+    Get the extra_node_labels of a model without instantiating it. A declared default is a class attribute; otherwise
+    the model either uses a default_factory or inherits the base class property, which returns None.
+    """
+    extra_node_labels = getattr(model_class, "extra_node_labels", None)
+    if not isinstance(extra_node_labels, ExtraNodeLabels):
+        field = getattr(model_class, "__dataclass_fields__", {}).get(
+            "extra_node_labels"
+        )
+        if field is not None and field.default_factory is not MISSING:
+            extra_node_labels = field.default_factory()
+        else:
+            extra_node_labels = None
+    return tuple(extra_node_labels.labels) if extra_node_labels else ()
 
 
+@lru_cache(maxsize=None)
 def _get_models_with_properties_for_label(
     node_label: str,
-) -> list[Type[CartographyNodeSchema]]:
+) -> tuple[Type[CartographyNodeSchema], ...]:
     """
     Get all models that can contribute properties to nodes with the given label.
     This includes:
     1. Models with the exact label
     2. Models targeting any of the extra_node_labels of the primary models (composite schemas)
+    Cached, since the same label appears in many mappings.
     """
     # First get the primary models for this label
     primary_models = _get_model_by_node_label(node_label)
     all_models = list(primary_models)
 
     # Collect all extra_node_labels from primary models
-    # Need to instantiate to get the actual value (property returns None on class if not defined)
     extra_labels: set[str] = set()
     for model_class in primary_models:
-        model_instance = model_class()
-        if model_instance.extra_node_labels:
-            extra_labels.update(model_instance.extra_node_labels.labels)
+        extra_labels.update(_get_extra_node_labels(model_class))
 
     # Find composite schemas that target these extra labels
     for extra_label in extra_labels:
         composite_models = _get_model_by_node_label(extra_label)
         all_models.extend(composite_models)
 
-    return all_models
+    return tuple(all_models)
+
+
+@lru_cache(maxsize=None)
+def _get_property_names(model_class: Type[CartographyNodeSchema]) -> frozenset[str]:
+    """
+    Get the names of the properties defined on a model, computed once per model class.
+    """
+    return frozenset(field.name for field in fields(model_class().properties))
+
+
+@lru_cache(maxsize=None)
+def _get_ontology_id_field(category: str) -> str:
+    """
+    Get the name of the property the ontology model of a category uses as id.
+    """
+    model = ONTOLOGY_MODELS[category]
+    assert model is not None
+    return model().properties.id.name
 
 
 def test_ontology_mapping_modules():
@@ -90,39 +139,40 @@ def test_ontology_mapping_categories():
 def test_ontology_mapping_fields():
     # Verify that all ontology fields in the mapping exist as extra indexed fields
     # in the corresponding module's model.
-    for _, mappings in ALL_MAPPINGS.items():
-        for module_name, mapping in mappings.items():
-            # Skip ontology module as it does not have a corresponding model
-            if module_name == "ontology":
-                continue
-            for node in mapping.nodes:
-                # TODO: Remove that uggly exception once all models are migrated to the new data model system
-                if node.node_label in OLD_FORMAT_NODES:
-                    continue
-                # Load all model classes that can contribute properties to this node
-                # This includes primary models and composite schemas targeting extra labels
-                model_classes = _get_models_with_properties_for_label(node.node_label)
-                assert len(model_classes) > 0, (
-                    f"Model class for node label '{node.node_label}' "
-                    f"in module '{module_name}' not found."
-                )
+    mapped_nodes = [
+        (module_name, node)
+        for mappings in ALL_MAPPINGS.values()
+        for module_name, mapping in mappings.items()
+        # Skip ontology module as it does not have a corresponding model
+        if module_name != "ontology"
+        for node in mapping.nodes
+        # TODO: Remove that uggly exception once all models are migrated to the new data model system
+        if node.node_label not in OLD_FORMAT_NODES
+    ]
+    for module_name, node in mapped_nodes:
+        # Load all model classes that can contribute properties to this node
+        # This includes primary models and composite schemas targeting extra labels
+        assert len(_get_models_with_properties_for_label(node.node_label)) > 0, (
+            f"Model class for node label '{node.node_label}' "
+            f"in module '{module_name}' not found."
+        )
 
-                for mapping_field in node.fields:
-                    found = False
-                    # Skip static value handling
-                    if mapping_field.special_handling == "static_value":
-                        continue
-                    for model_class in model_classes:
-                        model_property = getattr(
-                            model_class.properties, mapping_field.node_field, None
-                        )
-                        if model_property is not None:
-                            found = True
-                            break
-                    assert found, (
-                        f"Model property '{mapping_field.node_field}' for node label "
-                        f"'{node.node_label}' in module '{module_name}' not found."
-                    )
+    mapped_fields = [
+        (module_name, node, mapping_field)
+        for module_name, node in mapped_nodes
+        for mapping_field in node.fields
+        # Skip static value handling
+        if mapping_field.special_handling != "static_value"
+    ]
+    for module_name, node, mapping_field in mapped_fields:
+        found = any(
+            mapping_field.node_field in _get_property_names(model_class)
+            for model_class in _get_models_with_properties_for_label(node.node_label)
+        )
+        assert found, (
+            f"Model property '{mapping_field.node_field}' for node label "
+            f"'{node.node_label}' in module '{module_name}' not found."
+        )
 
 
 def test_ontology_mapping_required_fields():
@@ -131,21 +181,21 @@ def test_ontology_mapping_required_fields():
         assert (
             category in ONTOLOGY_MODELS
         ), f"Module '{category}' not found in ONTOLOGY_MODELS."
-        model_class = ONTOLOGY_MODELS[category]
-        data_dict_id_field = model_class().properties.id.name
+        data_dict_id_field = _get_ontology_id_field(category)
         for module, mapping in category_mappings.items():
             for node in mapping.nodes:
-                found_id_field = False
-                for field in node.fields:
-                    if field.ontology_field != data_dict_id_field:
-                        continue
-                    found_id_field = True
+                id_fields = [
+                    field
+                    for field in node.fields
+                    if field.ontology_field == data_dict_id_field
+                ]
+                for field in id_fields:
                     assert field.required, (
                         f"Field '{field.ontology_field}' in mapping for node '{node.node_label}' in '{category}.{module}' "
                         f"is used as id in the model but is not marked as `required` in the ontology mapping."
                     )
                 if node.eligible_for_source:
-                    assert found_id_field, (
+                    assert id_fields, (
                         f"Node '{node.node_label}' in module '{category}.{module}' does not have the id field "
                         f"'{data_dict_id_field}' mapped in the ontology mapping. "
                         "You should add it or set `eligible_for_source` to False."
@@ -184,7 +234,7 @@ def test_ontology_mapping_or_boolean_fields():
                         f"in module '{module_name}' not found."
                     )
                     for node_class in node_classes:
-                        node_properties = asdict(node_class.properties)
+                        node_properties = _get_property_names(node_class)
                         found = False
                         for extra_field in extra_fields:
                             assert isinstance(extra_field, str), (
@@ -220,7 +270,7 @@ def test_ontology_mapping_nor_boolean_fields():
                         f"in module '{module_name}' not found."
                     )
                     for node_class in node_classes:
-                        node_properties = asdict(node_class().properties)
+                        node_properties = _get_property_names(node_class)
                         found = False
                         for extra_field in extra_fields:
                             assert isinstance(extra_field, str), (
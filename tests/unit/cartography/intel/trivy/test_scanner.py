@@ -8,12 +8,52 @@ from cartography.intel.trivy import sync_trivy_from_s3
 from cartography.intel.trivy.scanner import get_json_files_in_s3
 from cartography.intel.trivy.scanner import sync_single_image_from_s3
 
+_TEST_IMAGE_URI = "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-app:v1.2.3"
+_TEST_IMAGE_DIGEST = (
+    "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-app"
+    "@sha256:abcd1234efgh5678abcd1234efgh5678abcd1234efgh5678abcd1234efgh5678"
+)
+
+# Scan results as they are stored in S3, serialized once for the whole module.
+_VULN_SCAN_DATA = {
+    "Results": [
+        {
+            "Target": "test-app",
+            "Vulnerabilities": [
+                {"VulnerabilityID": "CVE-2023-1234", "Severity": "HIGH"}
+            ],
+        }
+    ],
+    "Metadata": {"RepoDigests": [_TEST_IMAGE_DIGEST]},
+}
+_VULN_SCAN_JSON = json.dumps(_VULN_SCAN_DATA)
+
+_CLEAN_SCAN_JSON = json.dumps(
+    {
+        "Results": [{"Target": "test-app", "Vulnerabilities": []}],
+        "Metadata": {"RepoDigests": [_TEST_IMAGE_DIGEST]},
+    }
+)
+
+# Trivy may omit the Results key entirely for images with no vulnerabilities.
+_NO_RESULTS_SCAN_DATA = {"Metadata": {"RepoDigests": [_TEST_IMAGE_DIGEST]}}
+_NO_RESULTS_SCAN_JSON = json.dumps(_NO_RESULTS_SCAN_DATA)
+
+
+@pytest.fixture
+def mock_s3():
+    """
+    A mock boto3 session and the S3 client it hands out, as (boto3_session, s3_client).
+    """
+    boto3_session = MagicMock()
+    return boto3_session, boto3_session.client.return_value
+
 
-@patch("boto3.Session")
-def test_list_s3_scan_results_basic_match(mock_boto3_session):
+def test_list_s3_scan_results_basic_match(mock_s3):
     """Test basic S3 object listing with matching ECR images."""
     # Arrange
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.return_value = [
+    boto3_session, s3_client = mock_s3
+    s3_client.get_paginator.return_value.paginate.return_value = [
         {
             "Contents": [
                 {
@@ -31,7 +71,7 @@ def test_list_s3_scan_results_basic_match(mock_boto3_session):
     result = get_json_files_in_s3(
         s3_bucket="my-bucket",
         s3_prefix="scan-results",
-        boto3_session=mock_boto3_session.return_value,
+        boto3_session=boto3_session,
     )
 
     # Assert
@@ -42,20 +82,18 @@ def test_list_s3_scan_results_basic_match(mock_boto3_session):
     }
     assert result == expected_keys
 
-    mock_boto3_session.return_value.client.assert_called_once_with("s3")
-    mock_boto3_session.return_value.client.return_value.get_paginator.assert_called_once_with(
-        "list_objects_v2"
-    )
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.assert_called_once_with(
+    boto3_session.client.assert_called_once_with("s3")
+    s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+    s3_client.get_paginator.return_value.paginate.assert_called_once_with(
         Bucket="my-bucket", Prefix="scan-results"
     )
 
 
-@patch("boto3.Session")
-def test_list_s3_scan_results_no_matches(mock_boto3_session):
+def test_list_s3_scan_results_no_matches(mock_s3):
     """Test S3 object listing when no ECR images match."""
     # Arrange
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.return_value = [
+    boto3_session, s3_client = mock_s3
+    s3_client.get_paginator.return_value.paginate.return_value = [
         {
             "Contents": [
                 {"Key": "scan-results/some-other-image:latest.json"},
@@ -68,50 +106,46 @@ def test_list_s3_scan_results_no_matches(mock_boto3_session):
     result = get_json_files_in_s3(
         s3_bucket="my-bucket",
         s3_prefix="scan-results",
-        boto3_session=mock_boto3_session.return_value,
+        boto3_session=boto3_session,
     )
 
     # Assert
     assert len(result) == 2
-    expected_keys = [
+    expected_keys = {
         "scan-results/some-other-image:latest.json",
         "scan-results/another-image:v1.0.json",
-    ]
-    assert sorted(result) == sorted(expected_keys)
+    }
+    assert result == expected_keys
 
-    mock_boto3_session.return_value.client.assert_called_once_with("s3")
-    mock_boto3_session.return_value.client.return_value.get_paginator.assert_called_once_with(
-        "list_objects_v2"
-    )
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.assert_called_once_with(
+    boto3_session.client.assert_called_once_with("s3")
+    s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+    s3_client.get_paginator.return_value.paginate.assert_called_once_with(
         Bucket="my-bucket", Prefix="scan-results"
     )
 
 
-@patch("boto3.Session")
-def test_list_s3_scan_results_empty_s3_response(mock_boto3_session):
+def test_list_s3_scan_results_empty_s3_response(mock_s3):
     """Test S3 object listing when S3 bucket is empty."""
     # Arrange
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.return_value = [
-        {}
-    ]  # No Contents key
+    boto3_session, s3_client = mock_s3
+    s3_client.get_paginator.return_value.paginate.return_value = [{}]  # No Contents key
 
     # Act
     result = get_json_files_in_s3(
         s3_bucket="my-bucket",
         s3_prefix="scan-results",
-        boto3_session=mock_boto3_session.return_value,
+        boto3_session=boto3_session,
     )
 
     # Assert
     assert len(result) == 0
 
 
-@patch("boto3.Session")
-def test_list_s3_scan_results_with_url_encoding(mock_boto3_session):
+def test_list_s3_scan_results_with_url_encoding(mock_s3):
     """Test S3 object listing with URL-encoded image URIs."""
     # Arrange
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.return_value = [
+    boto3_session, s3_client = mock_s3
+    s3_client.get_paginator.return_value.paginate.return_value = [
         {
             "Contents": [
                 {
@@ -125,39 +159,35 @@ def test_list_s3_scan_results_with_url_encoding(mock_boto3_session):
     result = get_json_files_in_s3(
         s3_bucket="my-bucket",
         s3_prefix="scan-results",
-        boto3_session=mock_boto3_session.return_value,
+        boto3_session=boto3_session,
     )
 
     # Assert
     assert len(result) == 1
-    expected_keys = [
+    expected_keys = {
         "scan-results/123456789012.dkr.ecr.us-east-1.amazonaws.com%2Fmy-repo%3Alatest.json"
-    ]
-    assert sorted(result) == sorted(expected_keys)
+    }
+    assert result == expected_keys
 
-    mock_boto3_session.return_value.client.assert_called_once_with("s3")
-    mock_boto3_session.return_value.client.return_value.get_paginator.assert_called_once_with(
-        "list_objects_v2"
-    )
-    mock_boto3_session.return_value.client.return_value.get_paginator.return_value.paginate.assert_called_once_with(
+    boto3_session.client.assert_called_once_with("s3")
+    s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+    s3_client.get_paginator.return_value.paginate.assert_called_once_with(
         Bucket="my-bucket", Prefix="scan-results"
     )
 
 
-@patch("boto3.Session")
-def test_list_s3_scan_results_s3_error(mock_boto3_session):
+def test_list_s3_scan_results_s3_error(mock_s3):
     """Test S3 object listing when S3 API raises an exception."""
     # Arrange
-    mock_boto3_session.return_value.client.return_value.get_paginator.side_effect = (
-        Exception("S3 API Error")
-    )
+    boto3_session, s3_client = mock_s3
+    s3_client.get_paginator.side_effect = Exception("S3 API Error")
 
     # Act & Assert
     try:
         get_json_files_in_s3(
             s3_bucket="my-bucket",
             s3_prefix="scan-results",
-            boto3_session=mock_boto3_session.return_value,
+            boto3_session=boto3_session,
         )
         assert False, "Expected exception was not raised"
     except Exception as e:
@@ -165,9 +195,9 @@ def test_list_s3_scan_results_s3_error(mock_boto3_session):
 
 
 @patch("cartography.intel.trivy.scanner.sync_single_image")
-@patch("boto3.Session")
 def test_sync_single_image_from_s3_handles_missing_results_key(
-    mock_boto3_session, mock_sync_single_image
+    mock_sync_single_image,
+    mock_s3,
 ):
     """Test that scan data without 'Results' key is handled gracefully.
 
@@ -176,28 +206,17 @@ def test_sync_single_image_from_s3_handles_missing_results_key(
     "no vulnerabilities found" rather than an error.
     """
     # Arrange
+    boto3_session, s3_client = mock_s3
     mock_neo4j_session = MagicMock()
 
     s3_bucket = "test-bucket"
-    image_uri = "555666777888.dkr.ecr.ap-southeast-2.amazonaws.com/microservice:latest"
+    image_uri = _TEST_IMAGE_URI
     s3_object_key = f"{image_uri}.json"
 
     # Scan data with Metadata but no Results key (clean image with no vulnerabilities)
-    mock_scan_data = {
-        "Metadata": {
-            "RepoDigests": [
-                f"{image_uri.split(':')[0]}@sha256:abc123def456abc123def456abc123def456abc123def456abc123def456abc1"
-            ]
-        }
-    }
-
     mock_response_body = MagicMock()
-    mock_response_body.read.return_value.decode.return_value = json.dumps(
-        mock_scan_data
-    )
-    mock_boto3_session.return_value.client.return_value.get_object.return_value = {
-        "Body": mock_response_body
-    }
+    mock_response_body.read.return_value.decode.return_value = _NO_RESULTS_SCAN_JSON
+    s3_client.get_object.return_value = {"Body": mock_response_body}
 
     # Act
     sync_single_image_from_s3(
@@ -206,56 +225,36 @@ def test_sync_single_image_from_s3_handles_missing_results_key(
         12345,  # update_tag
         s3_bucket,
         s3_object_key,
-        mock_boto3_session.return_value,
+        boto3_session,
     )
 
     # Assert - sync_single_image should have been called with the scan data
     mock_sync_single_image.assert_called_once_with(
         mock_neo4j_session,
-        mock_scan_data,
+        _NO_RESULTS_SCAN_DATA,
         image_uri,
         12345,
     )
 
 
 @patch("cartography.intel.trivy.scanner.sync_single_image")
-@patch("boto3.Session")
 def test_sync_single_image_from_s3_success(
-    mock_boto3_session,
     mock_sync_single_image,
+    mock_s3,
 ):
     # Arrange
+    boto3_session, s3_client = mock_s3
     mock_neo4j_session = MagicMock()
 
-    image_uri = "123456789012.dkr.ecr.us-east-1.amazonaws.com/test-app:v1.2.3"
+    image_uri = _TEST_IMAGE_URI
     update_tag = 12345
     s3_bucket = "trivy-scan-results"
     s3_object_key = f"{image_uri}.json"
 
     # Mock S3 response
-    mock_scan_data = {
-        "Results": [
-            {
-                "Target": "test-app",
-                "Vulnerabilities": [
-                    {"VulnerabilityID": "CVE-2023-1234", "Severity": "HIGH"}
-                ],
-            }
-        ],
-        "Metadata": {
-            "RepoDigests": [
-                f"{image_uri.split(':')[0]}@sha256:abcd1234efgh5678abcd1234efgh5678abcd1234efgh5678abcd1234efgh5678"
-            ]
-        },
-    }
-
     mock_response_body = MagicMock()
-    mock_response_body.read.return_value.decode.return_value = json.dumps(
-        mock_scan_data
-    )
-    mock_boto3_session.return_value.client.return_value.get_object.return_value = {
-        "Body": mock_response_body
-    }
+    mock_response_body.read.return_value.decode.return_value = _VULN_SCAN_JSON
+    s3_client.get_object.return_value = {"Body": mock_response_body}
 
     # Act
     sync_single_image_from_s3(
@@ -264,27 +263,25 @@ def test_sync_single_image_from_s3_success(
         update_tag,
         s3_bucket,
         s3_object_key,
-        mock_boto3_session.return_value,
+        boto3_session,
     )
 
     # Assert
-    mock_boto3_session.return_value.client.assert_called_once_with("s3")
-    mock_boto3_session.return_value.client.return_value.get_object.assert_called_once_with(
-        Bucket=s3_bucket, Key=s3_object_key
-    )
+    boto3_session.client.assert_called_once_with("s3")
+    s3_client.get_object.assert_called_once_with(Bucket=s3_bucket, Key=s3_object_key)
 
     # Verify sync_single_image was called with the correct data
     mock_sync_single_image.assert_called_once_with(
         mock_neo4j_session,
-        mock_scan_data,
+        _VULN_SCAN_DATA,
         image_uri,
         update_tag,
     )
 
 
-@patch("boto3.Session")
-def test_sync_single_image_from_s3_read_error(mock_boto3_session):
+def test_sync_single_image_from_s3_read_error(mock_s3):
     # Arrange
+    boto3_session, s3_client = mock_s3
     mock_neo4j_session = MagicMock()
 
     image_uri = "987654321098.dkr.ecr.eu-west-1.amazonaws.com/backend:latest"
@@ -295,11 +292,9 @@ def test_sync_single_image_from_s3_read_error(mock_boto3_session):
     # Mock S3 read error
     from botocore.exceptions import ClientError
 
-    mock_boto3_session.return_value.client.return_value.get_object.side_effect = (
-        ClientError(
-            error_response={"Error": {"Code": "NoSuchKey", "Message": "Key not found"}},
-            operation_name="GetObject",
-        )
+    s3_client.get_object.side_effect = ClientError(
+        error_response={"Error": {"Code": "NoSuchKey", "Message": "Key not found"}},
+        operation_name="GetObject",
     )
 
     # Act & Assert
@@ -310,46 +305,31 @@ def test_sync_single_image_from_s3_read_error(mock_boto3_session):
             update_tag,
             s3_bucket,
             s3_object_key,
-            mock_boto3_session.return_value,
+            boto3_session,
         )
 
-    mock_boto3_session.return_value.client.assert_called_once_with("s3")
-    mock_boto3_session.return_value.client.return_value.get_object.assert_called_once_with(
-        Bucket=s3_bucket, Key=s3_object_key
-    )
+    boto3_session.client.assert_called_once_with("s3")
+    s3_client.get_object.assert_called_once_with(Bucket=s3_bucket, Key=s3_object_key)
 
 
 @patch("cartography.intel.trivy.scanner.sync_single_image")
-@patch("boto3.Session")
 def test_sync_single_image_from_s3_transform_error(
-    mock_boto3_session,
     mock_sync_single_image,
+    mock_s3,
 ):
     # Arrange
+    boto3_session, s3_client = mock_s3
     mock_neo4j_session = MagicMock()
 
-    image_uri = "555666777888.dkr.ecr.ap-southeast-2.amazonaws.com/worker:sha256-def456"
+    image_uri = _TEST_IMAGE_URI
     update_tag = 11111
     s3_bucket = "trivy-scan-results"
     s3_object_key = f"{image_uri}.json"
 
     # Mock successful S3 read
-    mock_scan_data = {
-        "Results": [{"Target": "worker", "Vulnerabilities": []}],
-        "Metadata": {
-            "RepoDigests": [
-                f"{image_uri.split(':')[0]}@sha256:def456ghi789def456ghi789def456ghi789def456ghi789def456ghi789def4"
-            ]
-        },
-    }
-
     mock_response_body = MagicMock()
-    mock_response_body.read.return_value.decode.return_value = json.dumps(
-        mock_scan_data
-    )
-    mock_boto3_session.return_value.client.return_value.get_object.return_value = {
-        "Body": mock_response_body
-    }
+    mock_response_body.read.return_value.decode.return_value = _CLEAN_SCAN_JSON
+    s3_client.get_object.return_value = {"Body": mock_response_body}
 
     # Mock transformation error in sync_single_image
     mock_sync_single_image.side_effect = KeyError("Missing required field")
@@ -362,43 +342,30 @@ def test_sync_single_image_from_s3_transform_error(
             update_tag,
             s3_bucket,
             s3_object_key,
-            mock_boto3_session.return_value,
+            boto3_session,
         )
 
     mock_sync_single_image.assert_called_once()
 
 
 @patch("cartography.intel.trivy.scanner.sync_single_image")
-@patch("boto3.Session")
 def test_sync_single_image_from_s3_load_error(
-    mock_boto3_session,
     mock_sync_single_image,
+    mock_s3,
 ):
     # Arrange
+    boto3_session, s3_client = mock_s3
     mock_neo4j_session = MagicMock()
 
-    image_uri = "111222333444.dkr.ecr.ca-central-1.amazonaws.com/api:v3.0.0-beta"
+    image_uri = _TEST_IMAGE_URI
     update_tag = 99999
     s3_bucket = "trivy-scan-results"
     s3_object_key = f"{image_uri}.json"
 
     # Mock successful S3 read
-    mock_scan_data = {
-        "Results": [{"Target": "api", "Vulnerabilities": []}],
-        "Metadata": {
-            "RepoDigests": [
-                f"{image_uri.split(':')[0]}@sha256:beta123abc456beta123abc456beta123abc456beta123abc456beta123abc456"
-            ]
-        },
-    }
-
     mock_response_body = MagicMock()
-    mock_response_body.read.return_value.decode.return_value = json.dumps(
-        mock_scan_data
-    )
-    mock_boto3_session.return_value.client.return_value.get_object.return_value = {
-        "Body": mock_response_body
-    }
+    mock_response_body.read.return_value.decode.return_value = _CLEAN_SCAN_JSON
+    s3_client.get_object.return_value = {"Body": mock_response_body}
 
     # Mock load error in sync_single_image
     mock_sync_single_image.side_effect = Exception("Database connection failed")
@@ -411,7 +378,7 @@ def test_sync_single_image_from_s3_load_error(
             update_tag,
             s3_bucket,
             s3_object_key,
-            mock_boto3_session.return_value,
+            boto3_session,
         )
 
     mock_sync_single_image.assert_called_once()
@@ -445,15 +412,15 @@ def test_sync_trivy_from_s3_no_matches(
 @patch("cartography.intel.trivy.sync_single_image")
 @patch("cartography.intel.trivy._get_scan_targets_and_aliases")
 @patch("cartography.intel.trivy.get_json_files_in_s3")
-@patch("boto3.Session")
 def test_sync_trivy_from_s3_digest_files(
-    mock_boto_session,
     mock_get_json_files,
     mock_get_targets_and_aliases,
     mock_sync_single_image,
     mock_cleanup,
+    mock_s3,
 ):
     """Ensure digest-named files are processed and mapped to the tag URI."""
+    boto3_session, s3_client = mock_s3
     display_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/app:1.2.3"
     digest_uri = (
         "123456789012.dkr.ecr.us-west-2.amazonaws.com/app@sha256:abcdefabcdefabcdef"
@@ -477,9 +444,7 @@ def test_sync_trivy_from_s3_digest_files(
 
     body = MagicMock()
     body.read.return_value.decode.return_value = json.dumps(scan_payload)
-    mock_boto_session.return_value.client.return_value.get_object.return_value = {
-        "Body": body
-    }
+    s3_client.get_object.return_value = {"Body": body}
 
     sync_trivy_from_s3(
         neo4j_session=MagicMock(),
@@ -487,7 +452,7 @@ def test_sync_trivy_from_s3_digest_files(
         trivy_s3_prefix="trivy-scans/",
         update_tag=123,
         common_job_parameters={},
-        boto3_session=mock_boto_session.return_value,
+        boto3_session=boto3_session,
     )
 
     mock_sync_single_image.assert_called_once()